@@ -1,16 +1,24 @@
 import gradio as gr
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Charts are only rendered to images for Gradio, never shown interactively
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
 import numpy as np
 from typing import Dict, List, Any, Tuple, Optional, Union
 import os
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime
 import uuid
 import logging
 from pathlib import Path
 import json
 import time
+import asyncio
+import threading
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
@@ -26,12 +34,20 @@ if parent_dir not in sys.path:
 from data_labelling.archer.database.supabase import SupabaseDatabase
 from archer.helpers.prompt import Prompt
 
+# Plotly charts render client-side in gr.Plot; fall back to matplotlib when it is missing
+try:
+    import plotly.graph_objects as go
+    PLOTLY_AVAILABLE = True
+except ImportError:
+    PLOTLY_AVAILABLE = False
+
 # Track optimization status
-_last_backward_pass_attempt = datetime.now()
-_backward_pass_min_interval = timedelta(minutes=5)  # Minimum time between backward pass attempts
-_failed_attempts = 0
+_backward_pass_min_interval = 300.0  # Minimum seconds between backward pass attempts
 _max_consecutive_failures = 3
 _failure_backoff_multiplier = 2
+_metrics_cache_ttl = 30.0  # Seconds a fetched set of performance metrics stays fresh
+_data_cache_ttl = 60.0  # Seconds loaded annotation data stays fresh, to catch out-of-band writes
+_max_plot_points = 5000  # Larger series are downsampled before plotting
 
 class GradioApp:
     """
@@ -40,6 +56,21 @@ class GradioApp:
     and visualizing system performance.
     """
     
+    # Columns annotators can edit in the UI and that are copied back into the full frame
+    EDITABLE = ("eval_content", "eval_score", "eval_feedback", "eval_perfect_output")
+    # Columns shown in the annotation table
+    VISIBLE_COLS = ["input", "eval_content", "eval_score", "eval_feedback", "eval_perfect_output"]
+    # Explicit dtypes for the annotation columns so pandas never has to infer them
+    SCHEMA = {
+        "output_id": "string",
+        "input": "string",
+        "eval_content": "string",
+        "eval_score": "Int16",
+        "eval_feedback": "string",
+        "eval_perfect_output": "string",
+        "prompt_id": "string",
+    }
+    
     def __init__(self, archer_instance: Optional[Any] = None, 
                 supabase_db: Optional[SupabaseDatabase] = None,
                 api_url: Optional[str] = None,
@@ -63,6 +94,39 @@ class GradioApp:
         self.current_data = None
         self.current_round = 1
         self.app = None
+        # (key, metrics, expiry) for the last get_performance_metrics() result
+        self._metrics_cache = None
+        # Backward-pass throttle state: monotonic time of the last attempt and consecutive failures.
+        # As before, the throttle window starts when the app is created
+        self._bw_lock = threading.Lock()
+        self._bw_last = time.monotonic()
+        self._bw_fails = 0
+        # round -> (annotation DataFrame, expiry) for load_data
+        self._data_cache = {}
+        # Single worker so backward passes run off the request thread, one at a time
+        self._executor = ThreadPoolExecutor(max_workers=1)
+    
+    def _project(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Project a full annotation DataFrame onto the visible columns.
+        
+        Args:
+            df: DataFrame containing all annotation columns
+            
+        Returns:
+            pd.DataFrame: DataFrame with only the visible columns
+        """
+        # reindex also yields the right columns for an empty frame
+        return df.reindex(columns=self.VISIBLE_COLS)
+    
+    def _empty_frame(self) -> pd.DataFrame:
+        """
+        Create an empty annotation DataFrame with the schema dtypes.
+        
+        Returns:
+            pd.DataFrame: Empty DataFrame with typed annotation columns
+        """
+        return pd.DataFrame({c: pd.array([], dtype=dt) for c, dt in self.SCHEMA.items()})
     
     def load_data(self) -> pd.DataFrame:
         """
@@ -72,28 +136,34 @@ class GradioApp:
             pd.DataFrame: DataFrame containing the data for annotation
         """
         try:
+            cached = self._data_cache.get(self.current_round)
+            if cached is not None and time.monotonic() < cached[1]:
+                logger.info(f"Using cached data for round {self.current_round}")
+                self.current_data = cached[0]
+                return cached[0].copy(deep=False)
+            
             logger.info(f"Loading data for round {self.current_round}")
             df = self.db.get_current_data_for_annotation(self.current_round)
             
             if df is None or df.empty:
                 logger.warning("No data found. Creating empty DataFrame with correct structure.")
-                df = pd.DataFrame(columns=[
-                    "output_id", "input", "eval_content", "eval_score", 
-                    "eval_feedback", "eval_perfect_output", "prompt_id"
-                ])
+                df = self._empty_frame()
+            else:
+                # Apply the schema to whichever annotation columns the database returned
+                if "eval_score" in df.columns:
+                    df["eval_score"] = pd.to_numeric(df["eval_score"], errors="coerce").round()
+                df = df.astype({c: dt for c, dt in self.SCHEMA.items() if c in df.columns})
             
             # Store the current data
             self.current_data = df
+            self._data_cache[self.current_round] = (df, time.monotonic() + _data_cache_ttl)
             
             logger.info(f"Loaded {len(df)} records for annotation")
-            return df
+            return df.copy(deep=False)
         except Exception as e:
             logger.error(f"Error loading data: {str(e)}")
             # Return empty DataFrame with correct structure
-            return pd.DataFrame(columns=[
-                "output_id", "input", "eval_content", "eval_score", 
-                "eval_feedback", "eval_perfect_output", "prompt_id"
-            ])
+            return self._empty_frame()
     
     def save_data(self, dataframe: pd.DataFrame) -> bool:
         """
@@ -108,19 +178,34 @@ class GradioApp:
         try:
             logger.info(f"Saving {len(dataframe)} records to database")
             
-            success = True
-            for _, row in dataframe.iterrows():
-                # Store human feedback
-                feedback_success = self.db.store_human_feedback(
-                    output_id=row['output_id'],
-                    score=int(row['eval_score']),
-                    feedback=row['eval_feedback'],
-                    improved_output=row['eval_perfect_output']
-                )
-                
-                if not feedback_success:
-                    logger.warning(f"Failed to save feedback for output {row['output_id']}")
-                    success = False
+            # Cast the whole score column once; blanks and unparsable edits become 0
+            scores = pd.to_numeric(dataframe['eval_score'], errors='coerce').fillna(0).astype('int32').to_numpy()
+            # The schema's string columns hold pd.NA for blanks, which is not JSON serializable
+            output_ids, feedbacks, improved = (
+                dataframe[col].astype(object).where(dataframe[col].notna(), None).to_numpy()
+                for col in ('output_id', 'eval_feedback', 'eval_perfect_output')
+            )
+            
+            if hasattr(self.db, 'store_human_feedback_bulk'):
+                success = self.db.store_human_feedback_bulk(output_ids, scores, feedbacks, improved)
+            else:
+                success = True
+                for oid, score, feedback, improved_output in zip(output_ids, scores, feedbacks, improved):
+                    # Store human feedback
+                    feedback_success = self.db.store_human_feedback(
+                        output_id=oid,
+                        score=int(score),
+                        feedback=feedback,
+                        improved_output=improved_output
+                    )
+                    
+                    if not feedback_success:
+                        logger.warning(f"Failed to save feedback for output {oid}")
+                        success = False
+            
+            if success:
+                # The saved annotations change what the database returns for this round
+                self._data_cache.pop(self.current_round, None)
             
             logger.info("Data saved successfully" if success else "Some records failed to save")
             return success
@@ -139,28 +224,26 @@ class GradioApp:
         Returns:
             dict: A status message indicating whether the backward pass was triggered.
         """
-        global _last_backward_pass_attempt, _failed_attempts
-        
-        logger = logging.getLogger(__name__)
         logger.info("Triggering backward pass")
         
-        # Check if enough time has passed since the last attempt
-        time_since_last_attempt = datetime.now() - _last_backward_pass_attempt
-        required_interval = _backward_pass_min_interval * (_failure_backoff_multiplier ** min(_failed_attempts, 5))
-        
-        if time_since_last_attempt < required_interval:
-            remaining_seconds = (required_interval - time_since_last_attempt).total_seconds()
-            logger.warning(
-                f"Attempt to trigger backward pass too soon after previous attempt. "
-                f"Please wait {remaining_seconds:.0f} seconds before retrying."
-            )
-            return {
-                "status": "error", 
-                "message": f"Backward pass was attempted too recently. Please wait {remaining_seconds:.0f} seconds before retrying."
-            }
-        
-        # Update the last attempt time
-        _last_backward_pass_attempt = datetime.now()
+        # Check and claim the attempt slot atomically so concurrent clicks cannot both pass
+        with self._bw_lock:
+            now = time.monotonic()
+            required_interval = _backward_pass_min_interval * (_failure_backoff_multiplier ** min(self._bw_fails, 5))
+            
+            if now - self._bw_last < required_interval:
+                remaining_seconds = required_interval - (now - self._bw_last)
+                logger.warning(
+                    f"Attempt to trigger backward pass too soon after previous attempt. "
+                    f"Please wait {remaining_seconds:.0f} seconds before retrying."
+                )
+                return {
+                    "status": "error", 
+                    "message": f"Backward pass was attempted too recently. Please wait {remaining_seconds:.0f} seconds before retrying."
+                }
+            
+            # Update the last attempt time
+            self._bw_last = now
         
         # Check if there is an Archer instance
         if self.archer is None:
@@ -171,26 +254,34 @@ class GradioApp:
         try:
             logger.info("Fetching validated evaluations from database")
             evaluations = self.db.get_validated_evaluations()
-            logger.info(f"Found {len(evaluations) if evaluations else 0} validated evaluations")
+            
+            # get_validated_evaluations returns a DataFrame; plain lists of dicts are accepted too
+            if isinstance(evaluations, pd.DataFrame):
+                evaluations = [row._asdict() for row in evaluations.itertuples(index=False)]
+            evaluations = evaluations or []
+            logger.info(f"Found {len(evaluations)} validated evaluations")
             
             if not evaluations:
                 logger.warning("No evaluations found, skipping backward pass")
                 return {"status": "warning", "message": "No evaluations found for optimization"}
             
-            # Transform evaluations to the format expected by Archer
+            # Transform evaluations to the format expected by Archer, skipping rows that fail;
+            # each distinct prompt's content is fetched from the database once
+            prompt_texts = {}
             transformed_evaluations = []
             for eval_data in evaluations:
                 try:
-                    # Get prompt ID and fetch the actual prompt content from the database
                     prompt_id = eval_data.get('prompt_id')
                     if not prompt_id:
                         logger.warning(f"Missing prompt_id in evaluation for output {eval_data.get('output_id')}")
                         continue
                     
-                    # Fetch prompt content from database
-                    prompt_content = self.db._get_prompt_text(prompt_id)
+                    if prompt_id not in prompt_texts:
+                        prompt_texts[prompt_id] = self.db._get_prompt_text(prompt_id)
+                        if not prompt_texts[prompt_id]:
+                            logger.warning(f"Could not find prompt content for ID: {prompt_id}")
+                    prompt_content = prompt_texts[prompt_id]
                     if not prompt_content:
-                        logger.warning(f"Could not find prompt content for ID: {prompt_id}")
                         continue
                     
                     prompt = Prompt(
@@ -207,252 +298,367 @@ class GradioApp:
             
             if not transformed_evaluations:
                 logger.error("Failed to transform any evaluations, skipping backward pass")
-                _failed_attempts += 1
+                self._record_backward_pass_failure()
                 return {"status": "error", "message": "Failed to transform evaluations"}
             
             # Run the backward pass
             logger.info(f"Running backward pass with {len(transformed_evaluations)} evaluations")
-            start_time = time.time()
+            start_time = time.monotonic()
             
             # Track success/failure
             try:
                 success = self.archer.run_backward_pass(transformed_evaluations)
-                execution_time = time.time() - start_time
+                execution_time = time.monotonic() - start_time
                 
                 if success:
                     logger.info(f"Backward pass completed successfully in {execution_time:.2f} seconds")
                     # Reset failure count on success
-                    _failed_attempts = 0
+                    with self._bw_lock:
+                        self._bw_fails = 0
+                    # Optimized prompts produce new annotation data, so drop every cached round
+                    self._data_cache.clear()
                     return {"status": "success", "message": "Backward pass completed successfully"}
                 else:
                     logger.warning(f"Backward pass failed after {execution_time:.2f} seconds")
-                    _failed_attempts += 1
+                    failures = self._record_backward_pass_failure()
                     # Increase backoff time for consecutive failures
-                    if _failed_attempts >= _max_consecutive_failures:
+                    if failures >= _max_consecutive_failures:
                         logger.error(
-                            f"Backward pass has failed {_failed_attempts} consecutive times. "
+                            f"Backward pass has failed {failures} consecutive times. "
                             f"Increasing backoff interval significantly."
                         )
                     return {
                         "status": "error",
-                        "message": f"Backward pass failed (attempt {_failed_attempts})"
+                        "message": f"Backward pass failed (attempt {failures})"
                     }
                     
             except Exception as e:
-                execution_time = time.time() - start_time
+                execution_time = time.monotonic() - start_time
                 logger.error(f"Error during backward pass: {str(e)}")
-                _failed_attempts += 1
+                self._record_backward_pass_failure()
                 return {"status": "error", "message": f"Error during backward pass: {str(e)}"}
             
         except Exception as e:
             logger.error(f"Error fetching evaluations: {str(e)}")
-            _failed_attempts += 1
+            self._record_backward_pass_failure()
             return {"status": "error", "message": f"Error fetching evaluations: {str(e)}"}
     
-    def create_prompt_performance_chart(self) -> plt.Figure:
+    def _record_backward_pass_failure(self) -> int:
+        """
+        Increment the consecutive backward pass failure count.
+        
+        Returns:
+            int: The updated number of consecutive failures
+        """
+        with self._bw_lock:
+            self._bw_fails += 1
+            return self._bw_fails
+    
+    def _get_metrics(self) -> Dict[str, Any]:
+        """
+        Return performance metrics, reusing the last result while it is fresh.
+        
+        The cache is keyed on the current round and the Archer generation count, so
+        a new round or generation always triggers a refetch.
+        
+        Returns:
+            Dict[str, Any]: Performance metrics as returned by the database
+        """
+        key = (self.current_round, getattr(self.archer, 'generation_count', None))
+        if self._metrics_cache is not None:
+            cached_key, cached_metrics, expiry = self._metrics_cache
+            if cached_key == key and time.monotonic() < expiry:
+                return cached_metrics
+        
+        metrics = self.db.get_performance_metrics()
+        self._metrics_cache = (key, metrics, time.monotonic() + _metrics_cache_ttl)
+        return metrics
+    
+    def _new_axes(self) -> Tuple[plt.Figure, plt.Axes]:
+        """
+        Create a fresh figure and axes for a single chart render.
+        
+        Returns:
+            Tuple[plt.Figure, plt.Axes]: The new figure and its axes
+        """
+        # Built outside pyplot's global figure registry, so concurrent renders share
+        # no state and there is nothing to close once Gradio has the figure
+        fig = Figure(figsize=(10, 6), dpi=90)
+        return fig, fig.subplots()
+    
+    def create_prompt_performance_chart(self, metrics: Optional[Dict[str, Any]] = None) -> Union[plt.Figure, "go.Figure"]:
         """
         Create a chart showing prompt performance across rounds.
         
+        Args:
+            metrics: Pre-fetched performance metrics (optional)
+            
         Returns:
-            plt.Figure: Matplotlib figure containing the chart
+            Union[plt.Figure, go.Figure]: Plotly figure when plotly is installed, otherwise a Matplotlib figure
         """
         try:
             logger.info("Creating prompt performance chart")
             
-            # Get performance metrics from the database
-            metrics = self.db.get_performance_metrics()
-            
-            # Create figure
-            fig = plt.figure(figsize=(10, 6))
+            # Get performance metrics, reusing a recent fetch when possible
+            if metrics is None:
+                metrics = self._get_metrics()
             
             # Extract prompt data
             prompts = metrics.get("prompts", [])
             
             if not prompts:
-                plt.title("No prompt data available")
+                fig, ax = self._new_axes()
+                ax.set_title("No prompt data available")
                 return fig
             
-            # Group prompts by generation
-            generations = {}
-            for prompt in prompts:
-                gen = prompt["generation"]
-                if gen not in generations:
-                    generations[gen] = []
-                generations[gen].append(prompt)
+            # Build a (generation x prompt-index) score matrix in one pass
+            n_prompts = len(prompts)
+            gens = np.fromiter((p["generation"] for p in prompts), dtype=np.int64, count=n_prompts)
+            prompt_scores = np.fromiter((p["avg_score"] for p in prompts), dtype=np.float32, count=n_prompts)
+            unique_gens, rows, counts = np.unique(gens, return_inverse=True, return_counts=True)
             
-            # Get unique prompt IDs and generations
-            unique_gens = sorted(generations.keys())
-            
-            if not unique_gens:
-                plt.title("No generation data available")
-                return fig
+            # Rank each prompt within its generation, preserving the original order
+            order = np.argsort(rows, kind="stable")
+            ranks = np.empty(n_prompts, dtype=np.int64)
+            ranks[order] = np.arange(n_prompts) - np.repeat(np.cumsum(counts) - counts, counts)
             
             # Set positions for bars
+            n_pos = min(5, int(counts.max()))
             bar_width = 0.8 / len(unique_gens)
-            positions = np.arange(min(5, max(len(generations[gen]) for gen in unique_gens)))
+            positions = np.arange(n_pos)
+            
+            # Missing slots stay at zero, matching the previous padding
+            keep = ranks < n_pos
+            scores_arr = np.zeros((len(unique_gens), n_pos), dtype=np.float32)
+            scores_arr[rows[keep], ranks[keep]] = prompt_scores[keep]
+            
+            if PLOTLY_AVAILABLE:
+                pfig = go.Figure()
+                labels = [f'Prompt {i+1}' for i in positions]
+                for i, gen in enumerate(unique_gens):
+                    pfig.add_bar(x=labels, y=scores_arr[i], name=f'Generation {gen}')
+                pfig.update_layout(
+                    barmode='group',
+                    title='Prompt Performance Across Generations',
+                    xaxis_title='Prompt Index',
+                    yaxis_title='Average Score',
+                    yaxis_range=[0, 5.5]
+                )
+                logger.info("Prompt performance chart created")
+                return pfig
+            
+            # Create figure
+            fig, ax = self._new_axes()
             
             # Create bars for each generation
             for i, gen in enumerate(unique_gens):
-                gen_prompts = generations[gen][:len(positions)]
-                gen_scores = [p["avg_score"] for p in gen_prompts]
-                
-                # Pad with zeros if needed
-                while len(gen_scores) < len(positions):
-                    gen_scores.append(0)
-                
-                # Plot bars
-                plt.bar(
+                ax.bar(
                     positions + i * bar_width - (len(unique_gens) - 1) * bar_width / 2, 
-                    gen_scores[:len(positions)], 
+                    scores_arr[i], 
                     bar_width, 
                     label=f'Generation {gen}'
                 )
             
             # Add labels and title
-            plt.xlabel('Prompt Index')
-            plt.ylabel('Average Score')
-            plt.title('Prompt Performance Across Generations')
-            plt.xticks(positions, [f'Prompt {i+1}' for i in positions])
-            plt.legend()
-            plt.ylim(0, 5.5)
+            ax.set_xlabel('Prompt Index')
+            ax.set_ylabel('Average Score')
+            ax.set_title('Prompt Performance Across Generations')
+            ax.set_xticks(positions, [f'Prompt {i+1}' for i in positions])
+            ax.legend()
+            ax.set_ylim(0, 5.5)
             
             logger.info("Prompt performance chart created")
             return fig
         except Exception as e:
             logger.error(f"Error creating prompt performance chart: {str(e)}")
             # Return empty figure
-            return plt.figure()
+            return self._new_axes()[0]
     
-    def create_model_improvement_chart(self) -> plt.Figure:
+    def create_model_improvement_chart(self, metrics: Optional[Dict[str, Any]] = None) -> plt.Figure:
         """
         Create a chart showing model improvement over time.
         
+        Args:
+            metrics: Pre-fetched performance metrics (optional)
+            
         Returns:
             plt.Figure: Matplotlib figure containing the chart
         """
         try:
             logger.info("Creating model improvement chart")
             
-            # Get performance metrics from the database
-            metrics = self.db.get_performance_metrics()
+            # Get performance metrics, reusing a recent fetch when possible
+            if metrics is None:
+                metrics = self._get_metrics()
             
             # Create figure
-            fig = plt.figure(figsize=(10, 6))
+            fig, ax = self._new_axes()
             
             # Extract score data
             scores = metrics.get("scores", [])
             rounds = metrics.get("rounds", [])
-            moving_avg = metrics.get("moving_avg", [])
             
             if not scores or not rounds:
-                plt.title("No score data available")
+                ax.set_title("No score data available")
                 return fig
             
-            # Create scatter plot of individual scores
-            plt.scatter(rounds, scores, alpha=0.5, label='Individual Scores')
-            
-            # Create line plot of moving average
-            if moving_avg:
-                # Calculate x-coordinates for moving average (centered)
-                window_size = min(5, len(scores))
-                ma_x = rounds[window_size//2:-(window_size//2)] if window_size > 1 else rounds
-                if len(ma_x) > len(moving_avg):
-                    ma_x = ma_x[:len(moving_avg)]
-                elif len(ma_x) < len(moving_avg):
-                    moving_avg = moving_avg[:len(ma_x)]
-                
-                plt.plot(ma_x, moving_avg, 'r-', linewidth=2, label=f'{window_size}-Point Moving Average')
+            # Sort the points by round once and reuse the order for every series
+            n = min(len(rounds), len(scores))
+            r = np.asarray(rounds[:n], dtype=np.float64)
+            s = np.asarray(scores[:n], dtype=np.float64)
+            order = np.argsort(r, kind="stable")
+            r_sorted, s_sorted = r[order], s[order]
             
-            # Add regression line
-            if len(rounds) > 1:
-                z = np.polyfit(rounds, scores, 1)
-                p = np.poly1d(z)
-                plt.plot(sorted(rounds), p(sorted(rounds)), "b--", linewidth=1, label='Trend Line')
+            # Downsample very large series; the difference is invisible at plot resolution
+            idx = np.linspace(0, n - 1, _max_plot_points).astype(int) if n > _max_plot_points else slice(None)
+            
+            # Create scatter plot of individual scores
+            ax.scatter(r_sorted[idx], s_sorted[idx], alpha=0.5, label='Individual Scores', rasterized=True)
+            
+            # Create line plot of the moving average, computed over the sorted scores
+            window_size = min(5, n)
+            if window_size > 0:
+                moving_avg = np.convolve(s_sorted, np.ones(window_size) / window_size, mode='valid')
+                # Center each average on the middle of its window
+                start = (window_size - 1) // 2
+                ma_x = r_sorted[start:start + len(moving_avg)]
+                if len(moving_avg) > _max_plot_points:
+                    ma_idx = np.linspace(0, len(moving_avg) - 1, _max_plot_points).astype(int)
+                    ma_x, moving_avg = ma_x[ma_idx], moving_avg[ma_idx]
+                ax.plot(ma_x, moving_avg, 'r-', linewidth=2, label=f'{window_size}-Point Moving Average', rasterized=True)
+            
+            # Add regression line, fitted on the full data
+            if n > 1:
+                coef = np.polynomial.polynomial.polyfit(r_sorted, s_sorted, 1)
+                trend_x = r_sorted[[0, -1]]
+                ax.plot(trend_x, np.polynomial.polynomial.polyval(trend_x, coef), "b--", linewidth=1, label='Trend Line')
             
             # Add labels and title
-            plt.xlabel('Round')
-            plt.ylabel('Score')
-            plt.title('Model Performance Over Time')
-            plt.legend()
-            plt.ylim(0, 5.5)
-            plt.grid(True, alpha=0.3)
+            ax.set_xlabel('Round')
+            ax.set_ylabel('Score')
+            ax.set_title('Model Performance Over Time')
+            ax.legend()
+            ax.set_ylim(0, 5.5)
+            ax.grid(True, alpha=0.3)
             
             logger.info("Model improvement chart created")
             return fig
         except Exception as e:
             logger.error(f"Error creating model improvement chart: {str(e)}")
             # Return empty figure
-            return plt.figure()
+            return self._new_axes()[0]
     
-    def create_prompt_maintenance_chart(self) -> plt.Figure:
+    def create_prompt_maintenance_chart(self, metrics: Optional[Dict[str, Any]] = None) -> Union[plt.Figure, "go.Figure"]:
         """
         Create a chart showing prompt maintenance/survivorship.
         
+        Args:
+            metrics: Pre-fetched performance metrics (optional)
+            
         Returns:
-            plt.Figure: Matplotlib figure containing the chart
+            Union[plt.Figure, go.Figure]: Plotly figure when plotly is installed, otherwise a Matplotlib figure
         """
         try:
             logger.info("Creating prompt maintenance chart")
             
-            # Get performance metrics from the database
-            metrics = self.db.get_performance_metrics()
-            
-            # Create figure
-            fig = plt.figure(figsize=(10, 6))
+            # Get performance metrics, reusing a recent fetch when possible
+            if metrics is None:
+                metrics = self._get_metrics()
             
             # Extract survivorship data
             survivorship = metrics.get("prompt_survivorship", {})
             
             if not survivorship:
-                plt.title("No survivorship data available")
+                fig, ax = self._new_axes()
+                ax.set_title("No survivorship data available")
                 return fig
             
             # Extract prompt IDs and their generation spans
             prompt_ids = list(survivorship.keys())
             
             if not prompt_ids:
-                plt.title("No prompt data available")
+                fig, ax = self._new_axes()
+                ax.set_title("No prompt data available")
                 return fig
             
             # Sort prompts by their first appearance
             prompt_ids.sort(key=lambda pid: min(survivorship[pid]["generations"]))
             
-            # Plot each prompt's journey
-            for i, pid in enumerate(prompt_ids[:10]):  # Show at most 10 prompts
-                generations = survivorship[pid]["generations"]
-                scores = survivorship[pid]["scores"]
-                
-                # Plot the journey line
-                plt.plot(generations, [i] * len(generations), 'b-', linewidth=2)
-                
-                # Plot points with score-based size
-                sizes = [max(5, s * 20) for s in scores]
-                plt.scatter(generations, [i] * len(generations), s=sizes, c='blue', alpha=0.7)
-                
-                # Add label
-                plt.text(min(generations) - 0.2, i, f'Prompt {pid[:5]}...', 
+            # Flatten the journeys of the (at most 10) shown prompts into single arrays
+            shown_ids = prompt_ids[:10]
+            lengths = [len(survivorship[pid]["generations"]) for pid in shown_ids]
+            xs = np.fromiter(
+                chain.from_iterable(survivorship[pid]["generations"] for pid in shown_ids),
+                dtype=float, count=sum(lengths)
+            )
+            ys = np.repeat(np.arange(len(shown_ids)), lengths)
+            point_scores = np.fromiter(
+                chain.from_iterable(survivorship[pid]["scores"] for pid in shown_ids),
+                dtype=float, count=sum(lengths)
+            )
+            sizes = np.maximum(5, point_scores * 20)
+            
+            if PLOTLY_AVAILABLE:
+                pfig = go.Figure()
+                # All journey lines as one trace, with None breaking the line between prompts
+                line_x, line_y = [], []
+                for i, pid in enumerate(shown_ids):
+                    gens = survivorship[pid]["generations"]
+                    line_x += [min(gens), max(gens), None]
+                    line_y += [i, i, None]
+                pfig.add_scatter(x=line_x, y=line_y, mode='lines', line=dict(color='blue', width=2),
+                                 hoverinfo='skip', showlegend=False)
+                # Marker diameter from the matplotlib area so sizes stay comparable
+                pfig.add_scatter(x=xs, y=ys, mode='markers', marker=dict(color='blue', opacity=0.7, size=np.sqrt(sizes)),
+                                 text=[f'Score {sc:.2f}' for sc in point_scores], showlegend=False)
+                pfig.update_layout(
+                    title='Prompt Survivorship Across Generations',
+                    xaxis_title='Generation',
+                    yaxis=dict(
+                        title='Prompt',
+                        tickvals=list(range(len(shown_ids))),
+                        ticktext=[f'Prompt {pid[:5]}...' for pid in shown_ids]
+                    )
+                )
+                logger.info("Prompt maintenance chart created")
+                return pfig
+            
+            # Create figure
+            fig, ax = self._new_axes()
+            
+            # Plot all journey lines as one collection and all points with one scatter
+            ax.add_collection(LineCollection(
+                [[(min(survivorship[pid]["generations"]), i), (max(survivorship[pid]["generations"]), i)]
+                 for i, pid in enumerate(shown_ids)],
+                colors='b', linewidths=2
+            ))
+            ax.scatter(xs, ys, s=sizes, c='blue', alpha=0.7)
+            
+            # Add labels
+            for i, pid in enumerate(shown_ids):
+                ax.text(min(survivorship[pid]["generations"]) - 0.2, i, f'Prompt {pid[:5]}...', 
                         ha='right', va='center', fontsize=9)
             
             # Add labels and title
-            plt.xlabel('Generation')
-            plt.ylabel('Prompt')
-            plt.title('Prompt Survivorship Across Generations')
-            plt.yticks([])
-            plt.grid(True, axis='x', alpha=0.3)
+            ax.set_xlabel('Generation')
+            ax.set_ylabel('Prompt')
+            ax.set_title('Prompt Survivorship Across Generations')
+            ax.set_yticks([])
+            ax.grid(True, axis='x', alpha=0.3)
             
             # Add score legend
             score_examples = [1, 2, 3, 4, 5]
             for i, score in enumerate(score_examples):
                 size = max(5, score * 20)
-                plt.scatter([i+1], [-1], s=size, c='blue', alpha=0.7)
-                plt.text(i+1, -1.5, f'Score {score}', ha='center', va='center', fontsize=8)
+                ax.scatter([i+1], [-1], s=size, c='blue', alpha=0.7)
+                ax.text(i+1, -1.5, f'Score {score}', ha='center', va='center', fontsize=8)
             
             logger.info("Prompt maintenance chart created")
             return fig
         except Exception as e:
             logger.error(f"Error creating prompt maintenance chart: {str(e)}")
             # Return empty figure
-            return plt.figure()
+            return self._new_axes()[0]
     
     def create_gradio_interface(self) -> gr.Blocks:
         """
@@ -482,11 +688,10 @@ class GradioApp:
                     round_display = gr.Markdown(f"## Current Round: {self.current_round}")
                     
                     # Create the editable dataframe component
-                    visible_cols = ["input", "eval_content", "eval_score", "eval_feedback", "eval_perfect_output"]
-                    all_cols = ["output_id", "input", "eval_content", "eval_score", "eval_feedback", "eval_perfect_output", "prompt_id"]
+                    visible_cols = self.VISIBLE_COLS
                     
                     # Extract the data to display
-                    display_data = initial_data[visible_cols] if not initial_data.empty else pd.DataFrame(columns=visible_cols)
+                    display_data = self._project(initial_data)
                     
                     dataframe = gr.Dataframe(
                         value=display_data,
@@ -535,16 +740,19 @@ class GradioApp:
             # Function to convert UI DataFrame back to full DataFrame with hidden columns
             def update_full_df(ui_df, full_df):
                 try:
+                    if ui_df is full_df:
+                        return full_df
                     if ui_df is None or full_df is None or ui_df.empty or full_df.empty:
                         return full_df
                     
-                    # Copy the editable columns from ui_df to full_df
-                    updated_df = full_df.copy()
-                    for col in ["eval_content", "eval_score", "eval_feedback", "eval_perfect_output"]:
-                        if col in ui_df.columns and col in updated_df.columns:
-                            updated_df[col] = ui_df[col].values
+                    # Write the editable columns straight into the state frame the app owns.
+                    # Whole-column assignment replaces each column rather than writing into
+                    # shared buffers, so frames handed out by the load_data cache stay intact.
+                    for col in self.EDITABLE:
+                        if col in ui_df.columns and col in full_df.columns:
+                            full_df[col] = ui_df[col].to_numpy()
                     
-                    return updated_df
+                    return full_df
                 except Exception as e:
                     logger.error(f"Error updating full DataFrame: {str(e)}")
                     return full_df
@@ -566,27 +774,27 @@ class GradioApp:
                     return full_df, f"Error: {str(e)}"
             
             # When refresh is clicked, save data, trigger backward pass, and load new data
-            def on_refresh_click(ui_df, full_df):
+            async def on_refresh_click(ui_df, full_df):
                 try:
                     # First update and save the current data
                     updated_df = update_full_df(ui_df, full_df)
-                    save_success = self.save_data(updated_df)
+                    loop = asyncio.get_running_loop()
+                    save_success = await loop.run_in_executor(None, self.save_data, updated_df)
                     
                     if not save_success:
                         return ui_df, full_df, "Error saving data", round_display.value
                     
-                    # Trigger the backward pass
-                    backward_status = self.trigger_backward_pass()
+                    # Trigger the backward pass on the worker thread so the event loop stays free
+                    backward_status = await loop.run_in_executor(self._executor, self.trigger_backward_pass)
                     
                     if backward_status["status"] == "error":
                         return ui_df, full_df, backward_status["message"], round_display.value
                     
                     # Load new data
-                    new_df = self.load_data()
+                    new_df = await loop.run_in_executor(None, self.load_data)
                     
                     # Prepare visible data for UI
-                    visible_cols = ["input", "eval_content", "eval_score", "eval_feedback", "eval_perfect_output"]
-                    new_ui_df = new_df[visible_cols] if not new_df.empty else pd.DataFrame(columns=visible_cols)
+                    new_ui_df = self._project(new_df)
                     
                     # Update round display
                     new_round_display = f"## Current Round: {self.current_round}"
@@ -599,27 +807,39 @@ class GradioApp:
             # When update visualizations is clicked, regenerate all plots
             def on_update_viz_click():
                 try:
-                    prompt_perf = self.create_prompt_performance_chart()
-                    model_improve = self.create_model_improvement_chart()
-                    prompt_maintain = self.create_prompt_maintenance_chart()
+                    # Fetch metrics once and share them across all three charts
+                    metrics = self._get_metrics()
+                    
+                    # Each chart draws on its own figure, so the three can be built concurrently
+                    builders = (
+                        self.create_prompt_performance_chart,
+                        self.create_model_improvement_chart,
+                        self.create_prompt_maintenance_chart,
+                    )
+                    with ThreadPoolExecutor(max_workers=len(builders)) as ex:
+                        prompt_perf, model_improve, prompt_maintain = ex.map(lambda fn: fn(metrics), builders)
                     
                     return prompt_perf, model_improve, prompt_maintain
                 except Exception as e:
                     logger.error(f"Error updating visualizations: {str(e)}")
                     # Return empty figures
-                    return plt.figure(), plt.figure(), plt.figure()
+                    return tuple(self._new_axes()[0] for _ in range(3))
             
             # Connect the buttons to the functions
             save_btn.click(
                 fn=on_save_click,
                 inputs=[dataframe, current_df],
-                outputs=[current_df, status_msg]
+                outputs=[current_df, status_msg],
+                queue=True
             )
             
             refresh_btn.click(
                 fn=on_refresh_click,
                 inputs=[dataframe, current_df],
-                outputs=[dataframe, current_df, status_msg, round_display]
+                outputs=[dataframe, current_df, status_msg, round_display],
+                queue=True,
+                concurrency_limit=1,  # Serialize refresh clicks instead of stacking backward passes
+                concurrency_id="backward_pass"
             )
             
             update_viz_btn.click(
@@ -635,6 +855,9 @@ class GradioApp:
                 outputs=[prompt_perf_plot, model_improve_plot, prompt_maintain_plot]
             )
         
+        # Let saves and chart updates run side by side while bounding overall load
+        app.queue(default_concurrency_limit=4, max_size=32)
+        
         logger.info("Gradio interface created successfully")
         return app
     
@@ -14,49 +14,167 @@ Note:
 
 import os
 import random
+import asyncio
+import hashlib
 import logging
+import pickle
+import queue
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Callable, Union, Tuple, Optional
+import numpy as np
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice, product
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Union, Tuple, Optional
 from archer.helpers.prompt import Prompt
-from archer.backwardPass.promptOptimizer import PromptOptimizer
+from archer.backwardPass.promptOptimizer import PromptOptimizer, prompt_key
 from archer.backwardPass.PromptEvaluator.promptEvaluator import PromptEvaluator
 from archer.forwardPass.evaluator import AIExpert
 from archer.forwardPass.generator import GenerativeModel
 from archer.forwardPass.human.human import HumanValidation
 from archer.helpers.visualization import PerformanceTracker
-# Assuming we'll implement Argilla integration, import placeholder:
-# from database.supabase import ArgillaDB
+from archer.helpers.response_cache import ResponseCache
+from archer.helpers.eval_batch import EvalBatch
 
+# Optional database backend; Archer runs without persistence when supabase is not installed
+try:
+    from archer.database.supabase import SupabaseDatabase
+    _SUPABASE_AVAILABLE = True
+except ImportError:
+    _SUPABASE_AVAILABLE = False
+
+# Optional JIT for numeric kernels; pure NumPy is used when numba is unavailable
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
 
-def load_knowledge_from_directories(directories: list) -> list:
+def _read_text(file_path: str) -> Optional[str]:
+    """Read a UTF-8 text file, replacing undecodable bytes; returns None if the file cannot be opened."""
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read()
+    except OSError as e:
+        print(f"Error reading file {file_path}: {e}")
+        return None
+
+
+# Process-level cache of loaded knowledge bases, keyed by the (path, mtime, size) of every file
+_KB_CACHE = OrderedDict()
+_KB_CACHE_MAXSIZE = 8
+_KB_CACHE_LOCK = threading.Lock()
+
+
+def load_knowledge_from_directories(directories: list, cache_dir: Optional[str] = None) -> list:
     """
     Load all text documents from a list of directories.
 
+    Files are discovered with os.scandir and read concurrently on a thread pool. Results are
+    cached for the life of the process and reused while no file has been added, removed, or
+    modified, so repeated Archer instantiations only stat the files.
+
     Args:
         directories: List of directory paths as strings.
+        cache_dir: Optional directory for a pickle sidecar that keeps the cache across
+                   restarts. Defaults to the ARCHER_KB_CACHE_DIR environment variable.
 
     Returns:
         A list of document contents (strings).
     """
-    documents = []
+    files = []
     for directory in directories:
         if os.path.isdir(directory):
-            for file_name in os.listdir(directory):
-                file_path = os.path.join(directory, file_name)
-                if os.path.isfile(file_path):
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            documents.append(f.read())
-                    except Exception as e:
-                        print(f"Error reading file {file_path}: {e}")
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        files.append((entry.path, stat.st_mtime_ns, stat.st_size))
         else:
             print(f"Directory not found: {directory}")
-    return documents
+
+    if not files:
+        return []
+
+    key = tuple(sorted(files))
+    with _KB_CACHE_LOCK:
+        if key in _KB_CACHE:
+            _KB_CACHE.move_to_end(key)
+            return list(_KB_CACHE[key])
+
+    cache_dir = cache_dir or os.getenv("ARCHER_KB_CACHE_DIR")
+    sidecar = None
+    documents = None
+    if cache_dir:
+        digest = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest()
+        sidecar = os.path.join(cache_dir, f"kb_{digest}.pkl")
+        try:
+            with open(sidecar, "rb") as f:
+                documents = pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable knowledge cache {sidecar}: {str(e)}")
+
+    if documents is None:
+        file_paths = [path for path, _, _ in key]
+        with ThreadPoolExecutor(max_workers=min(16, len(file_paths))) as executor:
+            documents = [doc for doc in executor.map(_read_text, file_paths) if doc is not None]
+        if sidecar:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                with open(sidecar, "wb") as f:
+                    pickle.dump(documents, f)
+            except Exception as e:
+                logger.warning(f"Could not write knowledge cache {sidecar}: {str(e)}")
+
+    with _KB_CACHE_LOCK:
+        _KB_CACHE[key] = documents
+        _KB_CACHE.move_to_end(key)
+        while len(_KB_CACHE) > _KB_CACHE_MAXSIZE:
+            _KB_CACHE.popitem(last=False)
+
+    return list(documents)
+
+
+if _NUMBA_AVAILABLE:
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _aggregate_scores(scores):
+        """Row means of a 2-D float32 (prompts x attempts) score array."""
+        out = np.empty(scores.shape[0], dtype=np.float32)
+        for i in numba.prange(scores.shape[0]):
+            total = 0.0
+            for j in range(scores.shape[1]):
+                total += scores[i, j]
+            out[i] = total / scores.shape[1]
+        return out
+else:
+    def _aggregate_scores(scores):
+        """Row means of a 2-D float32 (prompts x attempts) score array."""
+        return scores.mean(axis=1, dtype=np.float32)
+
+
+@lru_cache(maxsize=32)
+def _materialize_rows(input_data: tuple, mode: str, cap: int) -> tuple:
+    """
+    Materialize the input rows for multi-input forward passes.
+
+    Args:
+        input_data: Tuple of per-source input tuples.
+        mode: 'parallel' to zip sources row by row, otherwise the Cartesian product.
+        cap: Maximum number of rows produced in combinatorial mode.
+
+    Returns:
+        A tuple of input rows, cached for repeated identical inputs.
+    """
+    if mode == "parallel":
+        return tuple(zip(*input_data))
+    return tuple(islice(product(*input_data), cap))
 
 
 class Archer:
@@ -85,9 +203,24 @@ class Archer:
                  adalflow_enabled: bool = False,
                  adalflow_config: Optional[Dict[str, Any]] = None,
                  supabase_connection: Any = None,
-                 error_threshold: int = 3,  # Number of errors before circuit breaks
+                 error_threshold: int = 3,  # Minimum backward passes in the window before the circuit can break
                  recovery_time: int = 3600,  # Time in seconds to wait before retrying after circuit breaks
-                 temperature: float = 0.7):
+                 temperature: float = 0.7,
+                 max_workers: int = 8,
+                 eval_batch_size: int = 1,
+                 cache_enabled: bool = False,
+                 cache_path: Optional[str] = None,
+                 max_combinations: int = 10000,
+                 max_concurrency: int = 48,
+                 optimizer_cache_path: Optional[str] = None,
+                 optimizer_cache_ttl: float = 30 * 24 * 3600,
+                 eval_cache_ttl: Optional[float] = 3600.0,
+                 eval_cache_max_bytes: int = 100 * 1024 * 1024,
+                 max_recovery_time: int = 6 * 3600,
+                 failure_ratio: float = 0.5,
+                 sampling_duration: float = 3600.0,
+                 evaluation_batch_mode: bool = False,
+                 evaluation_batch_threshold: int = 32):
         """
         Initialize a new Archer instance.
 
@@ -117,9 +250,33 @@ class Archer:
             adalflow_enabled: Whether to use AdaLflow for prompt optimization.
             adalflow_config: Configuration for AdaLflow integration.
             supabase_connection: Connection to Argilla database.
-            error_threshold: Number of consecutive errors before circuit breaker trips.
+            error_threshold: Minimum number of backward passes within the sampling window before
+                             the circuit breaker may trip.
             recovery_time: Time in seconds to wait before retrying after circuit breaks.
             temperature: Temperature for LLM generation.
+            max_workers: Maximum number of concurrent LLM calls in the forward pass.
+            eval_batch_size: Number of generations evaluated per evaluator LLM call (default: 1,
+                             one call per generation).
+            cache_enabled: Whether to memoize generator and evaluator LLM responses. Repeated
+                           identical calls then return the first sampled response.
+            cache_path: Optional SQLite file that persists cached responses across runs.
+            max_combinations: Maximum number of input rows built in combinatorial mode.
+            max_concurrency: Maximum number of in-flight LLM calls in the async training API.
+            optimizer_cache_path: Optional SQLite file caching optimizer results keyed by
+                                  (prompt, feedback, score), so repeated runs skip the LLM.
+            optimizer_cache_ttl: Lifetime of cached optimizer results in seconds (default: 30 days).
+            eval_cache_ttl: Lifetime of cached evaluator responses in seconds (default: 1 hour).
+            eval_cache_max_bytes: Memory bound on cached evaluator responses (default: 100 MB).
+            max_recovery_time: Upper bound in seconds on the recovery time, which grows 1.5x each
+                               time the circuit breaker trips again without a successful pass.
+            failure_ratio: Fraction of failed backward passes within the sampling window above
+                           which the circuit breaker trips (default: 0.5).
+            sampling_duration: Length in seconds of the sliding window of backward-pass outcomes
+                               used to compute the failure ratio (default: 1 hour).
+            evaluation_batch_mode: Whether large candidate-prompt validations are scored with
+                                   multi-item evaluator calls instead of one call per attempt.
+            evaluation_batch_threshold: Number of distinct validation attempts above which
+                                        evaluation_batch_mode takes effect.
         """
         if evaluation_fields is None:
             evaluation_fields = ['score', 'feedback', 'improved_output', 'summary']
@@ -141,8 +298,10 @@ class Archer:
         
         # Advanced configuration for input handling
         self.input_types = input_types
+        self._rng = np.random.default_rng()
         self.resampling_enabled = resampling_enabled
         self.input_interaction_mode = input_interaction_mode
+        self.max_combinations = max_combinations
         
         # Backward pass configuration
         self.validation_attempts_per_param = validation_attempts_per_param
@@ -156,6 +315,21 @@ class Archer:
         self.adalflow_config = adalflow_config if adalflow_config else {}
         self.database_config = database_config if database_config else {}
         self.num_simulations_per_prompt = num_simulations_per_prompt
+        self.max_workers = max_workers
+        self.eval_batch_size = eval_batch_size
+        self.max_concurrency = max_concurrency
+        self.evaluation_batch_mode = evaluation_batch_mode
+        self.evaluation_batch_threshold = evaluation_batch_threshold
+        self._pending_writes = set()
+        # (prompt text, digest) and (prompt text, database ID) of the evaluator prompt, pinned
+        # until the prompt changes so it is not re-hashed or re-stored for every result
+        self._evaluator_prompt_digest: Tuple[Optional[str], str] = (None, "")
+        self._evaluator_prompt_record: Tuple[Optional[str], Optional[str]] = (None, None)
+        # Forward-pass results are written by a background thread so database latency
+        # overlaps with the next LLM calls; the bounded queue applies backpressure
+        self._db_queue = queue.Queue(maxsize=1024)
+        self._db_worker = None
+        self._db_worker_lock = threading.Lock()
 
         # Load knowledge documents from the provided directories
         knowledge_documents = load_knowledge_from_directories(knowledge_base)
@@ -197,8 +371,10 @@ class Archer:
         )
         
         # Initialize database if config is provided
-        if database_config:
-            from data_labelling.archer.database.supabase import SupabaseDatabase
+        if database_config and not _SUPABASE_AVAILABLE:
+            self.logger.error("database_config was given but the supabase package is not installed")
+            self.database = None
+        elif database_config:
             self.database = SupabaseDatabase(**database_config)
             self.database.connect()
             self.database.initialize_datasets()
@@ -207,7 +383,43 @@ class Archer:
 
         # Store the active prompts in the generator
         self.active_generator_prompts = initial_prompts  # Store prompts directly
-        self.generator.set_prompts(self.active_generator_prompts)
+        self._last_generator_prompts: Tuple[Prompt, ...] = ()
+        self._set_generator_prompts(self.active_generator_prompts)
+
+        # Memoize identical LLM calls if caching is enabled
+        self.cache_enabled = cache_enabled
+        if cache_enabled:
+            self.response_cache = ResponseCache(db_path=cache_path)
+            # Evaluations are larger and go stale with the evaluator prompt, so they get
+            # their own size- and age-bounded cache; the prompt is part of the key
+            self.eval_cache = ResponseCache(db_path=cache_path, ttl=eval_cache_ttl,
+                                            max_bytes=eval_cache_max_bytes)
+            generate_namespace = lambda: f"generate\0{self.generator.model_name}\0{self.generator.temperature}"
+            evaluate_namespace = lambda: f"evaluate\0{self.evaluator.model_name}\0{self._current_evaluator_prompt_digest()}"
+            is_generation = lambda result: not str(result).startswith("Error:")
+            is_evaluation = lambda result: not str(result.get("feedback", "")).startswith("Error")
+            # Sync and async variants share a namespace, so either one can serve the other's entries
+            self.generator._call_llm = self.response_cache.wrap(
+                self.generator._call_llm, namespace=generate_namespace, should_cache=is_generation
+            )
+            self.generator._acall_llm = self.response_cache.wrap(
+                self.generator._acall_llm, namespace=generate_namespace, should_cache=is_generation
+            )
+            self.evaluator.evaluate = self.eval_cache.wrap(
+                self.evaluator.evaluate, namespace=evaluate_namespace, should_cache=is_evaluation
+            )
+            self.evaluator.aevaluate = self.eval_cache.wrap(
+                self.evaluator.aevaluate, namespace=evaluate_namespace, should_cache=is_evaluation
+            )
+        else:
+            self.response_cache = None
+            self.eval_cache = None
+
+        # Persist optimizer results across runs if a cache file is configured
+        if optimizer_cache_path:
+            self.optimizer_cache = ResponseCache(db_path=optimizer_cache_path, ttl=optimizer_cache_ttl)
+        else:
+            self.optimizer_cache = None
 
         # Store initial prompts in the database if available
         if self.database:
@@ -218,15 +430,25 @@ class Archer:
 
         self.generation_count = 0
         
-        # Store candidate prompts for evaluation
+        # Store candidate prompts for evaluation, with their scores kept in a parallel array
         self.candidate_prompts = []
+        self._candidate_scores = np.empty(0, dtype=np.float32)
 
         # Track optimization state
+        # Breaker timing uses time.monotonic(), so wall-clock jumps cannot open or close it early
         self._optimization_errors = 0
-        self._last_optimization_attempt = datetime.now()
+        self._last_optimization_attempt = time.monotonic()
         self._circuit_open = False
+        self._circuit_half_open = False
+        self._circuit_trips = 0
         self._error_threshold = error_threshold
-        self._recovery_time = timedelta(seconds=recovery_time)
+        self._failure_ratio = failure_ratio
+        self._sampling_duration = float(sampling_duration)
+        # (monotonic timestamp, succeeded) for each backward pass within the sampling window
+        self._call_log = deque()
+        self._base_recovery_time = float(recovery_time)
+        self._recovery_time = float(recovery_time)
+        self._max_recovery_time = float(max(recovery_time, max_recovery_time))
 
         # Initialize components
         self.supabase_connection = supabase_connection
@@ -250,88 +472,295 @@ class Archer:
                         Can be a single item or a list/tuple for multiple inputs.
 
         Returns:
-            A list of tuples: (Prompt, generated content, evaluation result dict).
+            EvalBatch: Sequence of (Prompt, generated content, evaluation result dict) tuples.
+        """
+        # Make sure the previous pass's writes are visible before sampling prompts from the database
+        self.flush_db_writes()
+        input_rows, sampled_prompts = self._prepare_forward_pass(input_data)
+        
+        # Generation and evaluation are network-bound LLM calls, so both fan out over threads
+        generated_per_row = self.generator.generate_batch(input_rows, max_workers=self.max_workers)
+        work_items = self._build_work_items(input_rows, generated_per_row)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            eval_results = [
+                result
+                for chunk_results in executor.map(self._evaluate_work_chunk, self._chunk_work_items(work_items))
+                for result in chunk_results
+            ]
+        
+        return self._record_forward_pass(work_items, eval_results, sampled_prompts)
+
+    def iter_forward_pass(self, input_data: Any, rows_per_chunk: int = 64) -> Iterator[Tuple[Prompt, str, Dict[str, Any]]]:
+        """
+        Streaming counterpart of run_forward_pass.
+
+        Input rows are consumed lazily, including combinatorial products, and processed
+        rows_per_chunk at a time. Each chunk's results are queued for the background database
+        writer and yielded before the next chunk is generated, so memory stays bounded by the
+        chunk size unless the caller keeps the results. The generation counter advances once the
+        iterator is exhausted or closed. run_backward_pass accepts the iterator directly.
+
+        Args:
+            input_data: The input data to feed into the generator.
+                        Can be a single item or a list/tuple for multiple inputs.
+            rows_per_chunk: Number of input rows generated and evaluated together.
+
+        Yields:
+            Tuples of (Prompt, generated content, evaluation result dict).
+        """
+        # Make sure the previous pass's writes are visible before sampling prompts from the database
+        self.flush_db_writes()
+        rows = self._iter_input_rows(input_data)
+        sampled_prompts = self._sample_generation_prompts()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                while True:
+                    input_rows = list(islice(rows, max(1, rows_per_chunk)))
+                    if not input_rows:
+                        break
+                    generated_per_row = self.generator.generate_batch(input_rows, max_workers=self.max_workers)
+                    work_items = self._build_work_items(input_rows, generated_per_row)
+                    eval_results = [
+                        result
+                        for chunk_results in executor.map(self._evaluate_work_chunk, self._chunk_work_items(work_items))
+                        for result in chunk_results
+                    ]
+                    yield from self._finalize_results(work_items, eval_results)
+        finally:
+            self.performance_tracker.record_generation(self.generation_count, sampled_prompts)
+            self.generation_count += 1
+
+    async def run_forward_pass_async(self, input_data: Any) -> list:
+        """
+        Async counterpart of run_forward_pass.
+
+        Every (prompt, input) pair is generated concurrently with the generator's async client
+        and evaluated concurrently with the evaluator's, bounded by max_concurrency. Database writes for the results are scheduled as background tasks;
+        await flush_pending_writes() to wait for them.
+
+        Args:
+            input_data: The input data to feed into the generator.
+                        Can be a single item or a list/tuple for multiple inputs.
+
+        Returns:
+            EvalBatch: Sequence of (Prompt, generated content, evaluation result dict) tuples.
+        """
+        # Make sure the previous pass's writes are visible before sampling prompts from the database
+        await self.flush_pending_writes()
+        input_rows, sampled_prompts = await asyncio.to_thread(self._prepare_forward_pass, input_data)
+        
+        generated_per_row = await self.generator.agenerate_batch(input_rows, max_concurrency=self.max_concurrency)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        work_items = self._build_work_items(input_rows, generated_per_row)
+        chunk_results = await asyncio.gather(
+            *(self._evaluate_chunk_async(chunk, semaphore) for chunk in self._chunk_work_items(work_items))
+        )
+        eval_results = [result for results in chunk_results for result in results]
+        
+        # Human validation may block on input, so it runs on a worker thread
+        round_id = str(self.generation_count)
+        evaluator_prompt = self.evaluator.get_current_prompt()
+        all_evaluations = await asyncio.to_thread(
+            self._record_forward_pass, work_items, eval_results, sampled_prompts, False
+        )
+        
+        if self.database:
+            task = asyncio.create_task(
+                asyncio.to_thread(
+                    self._store_forward_results, work_items, all_evaluations, round_id, evaluator_prompt
+                )
+            )
+            self._pending_writes.add(task)
+            task.add_done_callback(self._pending_writes.discard)
+        
+        return all_evaluations
+
+    async def _evaluate_one(self, prompt: Prompt, content: str, input_row: Any,
+                            semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """
+        Evaluate a single generation with the evaluator's async client.
+        
+        Args:
+            prompt: The prompt that produced the content.
+            content: The generated content.
+            input_row: The input the content was generated from.
+            semaphore: Bounds the number of in-flight LLM calls.
+            
+        Returns:
+            The evaluation result dict.
+        """
+        async with semaphore:
+            return await self.evaluator.aevaluate(generated_content=content, input_data=input_row)
+
+    async def _evaluate_chunk_async(self, chunk: List[Tuple[Prompt, str, Any]],
+                                    semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        """
+        Evaluate a chunk of work items: single items natively async, larger chunks as one batch call.
+        """
+        if len(chunk) == 1:
+            prompt, content, input_row = chunk[0]
+            return [await self._evaluate_one(prompt, content, input_row, semaphore)]
+        
+        async with semaphore:
+            return await asyncio.to_thread(self._evaluate_work_chunk, chunk)
+
+    async def flush_pending_writes(self) -> None:
+        """Wait for database writes scheduled by either forward pass to finish."""
+        if self._pending_writes:
+            await asyncio.gather(*list(self._pending_writes), return_exceptions=True)
+        if self._db_queue.unfinished_tasks:
+            await asyncio.to_thread(self.flush_db_writes)
+
+    def flush_db_writes(self) -> None:
+        """Block until the background database writer has stored every queued result."""
+        self._db_queue.join()
+
+    def close(self) -> None:
+        """Flush queued database writes and stop the background writer thread."""
+        self.flush_db_writes()
+        with self._db_worker_lock:
+            worker = self._db_worker
+            if worker is not None and worker.is_alive():
+                self._db_queue.put(None)
+        if worker is not None:
+            worker.join()
+        self._db_worker = None
+
+    def _enqueue_db_write(self, *job: Any) -> None:
+        """
+        Queue a _store_forward_results call for the background writer, starting it if needed.
+
+        Args:
+            *job: Positional arguments for _store_forward_results.
+        """
+        # Enqueue under the lock, so an idle writer cannot exit between the check and the put
+        with self._db_worker_lock:
+            if self._db_worker is None or not self._db_worker.is_alive():
+                self._db_worker = threading.Thread(target=self._drain_db_queue, name="archer-db-writer")
+                self._db_worker.start()
+            self._db_queue.put(job)
+
+    def _drain_db_queue(self) -> None:
+        """
+        Background writer loop. It exits after a second without work or on a None job; it is
+        not a daemon thread, so queued writes still complete when the interpreter exits.
+        """
+        while True:
+            try:
+                job = self._db_queue.get(timeout=1.0)
+            except queue.Empty:
+                with self._db_worker_lock:
+                    if self._db_queue.empty():
+                        self._db_worker = None
+                        return
+                continue
+            try:
+                if job is None:
+                    return
+                self._store_forward_results(*job)
+            except Exception as e:
+                self.logger.error(f"Error storing forward-pass results: {str(e)}")
+            finally:
+                self._db_queue.task_done()
+
+    def _prepare_forward_pass(self, input_data: Any) -> Tuple[Any, List[Prompt]]:
+        """
+        Build the input rows for a forward pass and select the prompts to generate with.
+
+        Args:
+            input_data: The input data to feed into the generator.
+
+        Returns:
+            Tuple of (input rows, sampled prompts).
         """
         # Handle multiple input types
         if isinstance(input_data, (list, tuple)) and isinstance(self.input_spec, list):
-            # Handle the input based on interaction mode
-            if self.input_interaction_mode == "parallel":
-                # Zip inputs together - each element corresponds to one row
-                input_rows = zip(*input_data)
-            else:  # combinatorial
-                # Create all possible combinations
-                from itertools import product
-                input_rows = product(*input_data)
+            # Handle the input based on interaction mode: zip inputs row by row ("parallel")
+            # or build the bounded Cartesian product ("combinatorial")
+            try:
+                input_rows = _materialize_rows(
+                    tuple(tuple(source) for source in input_data),
+                    self.input_interaction_mode,
+                    self.max_combinations
+                )
+            except TypeError:
+                # Unhashable input values cannot be memoized; materialize directly
+                input_rows = _materialize_rows.__wrapped__(input_data, self.input_interaction_mode, self.max_combinations)
         else:
             # Single input type
             input_rows = [input_data]
         
+        return input_rows, self._sample_generation_prompts()
+
+    def _sample_generation_prompts(self) -> List[Prompt]:
+        """
+        Select the prompts for a forward pass and hand them to the generator.
+
+        Returns:
+            The sampled prompts.
+        """
         # Randomly sample prompts from the database and initial prompts
         sampled_prompts = self._get_random_prompts_for_generation()
         if not sampled_prompts:
             # Fallback to initial prompts if no prompts found in database
             sampled_prompts = self.active_generator_prompts[:self.max_prompts_per_cycle]
             
-        self.generator.set_prompts(sampled_prompts)
-        
-        all_evaluations = []
+        self._set_generator_prompts(sampled_prompts)
         
-        for input_row in input_rows:
-            generated_outputs = self.generator.generate(input_row)
-            for content, prompt in generated_outputs:
-                eval_result = self.evaluator.evaluate(
-                    generated_content=content, 
-                    input_data=input_row
-                )
-                
-                # If human validation is enabled, present for validation
-                if self.human_validation_enabled and self.human_validator:
-                    eval_result = self.human_validator.present_for_validation(
-                        input_data=input_row,
-                        generated_content=content,
-                        ai_evaluation=eval_result
-                    )
-                    # Save the validated evaluation for later analysis
-                    self.human_validator.save_validation(eval_result)
-                
-                all_evaluations.append((prompt, content, eval_result))
-
-                # Store record with integrated prompt information if database is available
-                if self.database:
-                    # Get prompt ID from database
-                    prompt_id = getattr(prompt, 'id', None)
-                    if not prompt_id:
-                        # If prompt doesn't have an ID, store it to get one
-                        prompt_id = self.database.store_prompt(prompt.content, "generator")
-                    
-                    evaluator_prompt_id = self.database.store_prompt(self.evaluator.get_current_prompt(), "evaluator")
-                    
-                    # Store the record with the prompt ID
-                    output_id = self.database.store_record(
-                        input_data=str(input_row),
-                        content=content,
-                        generator_prompt_id=prompt_id,
-                        evaluator_prompt_id=evaluator_prompt_id,
-                        prompt_generation=prompt.generation,
-                        round_id=str(self.generation_count)
-                    )
-                    
-                    # Store the evaluation with the correct prompt_id
-                    if output_id:
-                        score = eval_result.get("score", 0)
-                        feedback = eval_result.get("feedback", "")
-                        improved_output = eval_result.get("improved_output", "")
-                        
-                        self.database.store_evaluation(
-                            output_id=output_id,
-                            score=score,
-                            feedback=feedback,
-                            improved_output=improved_output,
-                            is_human=False
-                        )
-                        
-                        # Update average score for this prompt
-                        self.database.update_prompt_score(prompt_id, score)
+        return sampled_prompts
+
+    def _iter_input_rows(self, input_data: Any) -> Iterator[Any]:
+        """
+        Lazily yield the input rows of a forward pass without materializing them.
+
+        Args:
+            input_data: The input data to feed into the generator.
+
+        Returns:
+            Iterator over input rows; combinatorial products are capped at max_combinations.
+        """
+        if isinstance(input_data, (list, tuple)) and isinstance(self.input_spec, list):
+            if self.input_interaction_mode == "parallel":
+                return zip(*input_data)
+            return islice(product(*input_data), self.max_combinations)
+        return iter([input_data])
+
+    def _build_work_items(self, input_rows: Any, generated_per_row: List[Any]) -> List[Tuple[Prompt, str, Any]]:
+        """
+        Flatten per-row generator outputs into (Prompt, generated content, input row) work items.
+        """
+        return [
+            (prompt, content, input_row)
+            for input_row, generated_outputs in zip(input_rows, generated_per_row)
+            for content, prompt in generated_outputs
+        ]
+
+    def _chunk_work_items(self, work_items: List[Tuple[Prompt, str, Any]]) -> List[List[Tuple[Prompt, str, Any]]]:
+        """
+        Split work items into chunks so several generations share one evaluator call.
+        """
+        batch_size = max(1, self.eval_batch_size)
+        return [work_items[i:i + batch_size] for i in range(0, len(work_items), batch_size)]
+
+    def _record_forward_pass(self, work_items: List[Tuple[Prompt, str, Any]],
+                             eval_results: List[Dict[str, Any]],
+                             sampled_prompts: List[Prompt],
+                             store: bool = True) -> list:
+        """
+        Apply human validation, persist results, and advance the generation counter.
+
+        Args:
+            work_items: List of (Prompt, generated content, input row) tuples.
+            eval_results: Evaluation result dicts aligned with work_items.
+            sampled_prompts: The prompts used for this forward pass.
+            store: Whether to queue the results for the background database writer; the
+                   async forward pass schedules the writes itself.
+
+        Returns:
+            EvalBatch: Sequence of (Prompt, generated content, evaluation result dict) tuples.
+        """
+        all_evaluations = self._finalize_results(work_items, eval_results, store)
 
         self.performance_tracker.record_generation(self.generation_count, sampled_prompts)
         
@@ -340,117 +769,383 @@ class Archer:
         
         return all_evaluations
 
-    def run_backward_pass(self, evaluations: list) -> bool:
+    def _finalize_results(self, work_items: List[Tuple[Prompt, str, Any]],
+                          eval_results: List[Dict[str, Any]], store: bool = True) -> EvalBatch:
+        """
+        Apply human validation to evaluated work items and queue them for storage.
+
+        Args:
+            work_items: List of (Prompt, generated content, input row) tuples.
+            eval_results: Evaluation result dicts aligned with work_items.
+            store: Whether to queue the results for the background database writer.
+
+        Returns:
+            EvalBatch: Sequence of (Prompt, generated content, evaluation result dict) tuples.
+        """
+        # Human validation stays serial so validation remains interactive
+        if self.human_validation_enabled and self.human_validator:
+            validated_results = []
+            for (prompt, content, input_row), eval_result in zip(work_items, eval_results):
+                eval_result = self.human_validator.present_for_validation(
+                    input_data=input_row,
+                    generated_content=content,
+                    ai_evaluation=eval_result
+                )
+                # Save the validated evaluation for later analysis
+                self.human_validator.save_validation(eval_result)
+                validated_results.append(eval_result)
+            eval_results = validated_results
+        
+        all_evaluations = EvalBatch(
+            [prompt for prompt, _, _ in work_items], [content for _, content, _ in work_items], eval_results
+        )
+
+        if store and self.database:
+            self._enqueue_db_write(
+                work_items, all_evaluations, str(self.generation_count), self.evaluator.get_current_prompt()
+            )
+        
+        return all_evaluations
+
+    def _store_forward_results(self, work_items: List[Tuple[Prompt, str, Any]],
+                               evaluations: List[Tuple[Prompt, str, Dict[str, Any]]],
+                               round_id: str, evaluator_prompt: str) -> None:
+        """
+        Store forward-pass records and their evaluations with integrated prompt information.
+
+        Args:
+            work_items: List of (Prompt, generated content, input row) tuples.
+            evaluations: (Prompt, generated content, evaluation result) tuples aligned with work_items.
+            round_id: Round the records belong to.
+            evaluator_prompt: The evaluator prompt the evaluations were produced with.
+        """
+        if not self.database:
+            return
+        
+        evaluator_prompt_id = self._stored_evaluator_prompt_id(evaluator_prompt)
+        
+        # Resolve generator prompt IDs once per distinct prompt
+        stored_prompt_ids = {}
+        prompt_ids = []
+        for prompt, _, _ in evaluations:
+            prompt_id = getattr(prompt, 'id', None)
+            if not prompt_id:
+                # If prompt doesn't have an ID, store it to get one
+                if prompt.content_key not in stored_prompt_ids:
+                    stored_prompt_ids[prompt.content_key] = self.database.store_prompt(prompt.content, "generator")
+                prompt_id = stored_prompt_ids[prompt.content_key]
+            prompt_ids.append(prompt_id)
+        
+        # Insert the records in bulk, up to 100 per request
+        records = [
+            dict(input_data=str(input_row), content=content, generator_prompt_id=prompt_id,
+                 evaluator_prompt_id=evaluator_prompt_id, prompt_generation=prompt.generation, round_id=round_id)
+            for (_, _, input_row), (prompt, content, _), prompt_id in zip(work_items, evaluations, prompt_ids)
+        ]
+        output_ids = []
+        for start in range(0, len(records), 100):
+            output_ids.extend(self.database.store_records_bulk(records[start:start + 100]))
+        
+        for (prompt, content, eval_result), prompt_id, output_id in zip(evaluations, prompt_ids, output_ids):
+            # Store the evaluation with the correct prompt_id
+            if output_id:
+                score = eval_result.get("score", 0)
+                feedback = eval_result.get("feedback", "")
+                improved_output = eval_result.get("improved_output", "")
+                
+                self.database.store_evaluation(
+                    output_id=output_id,
+                    score=score,
+                    feedback=feedback,
+                    improved_output=improved_output,
+                    is_human=False
+                )
+                
+                # Update average score for this prompt
+                self.database.update_prompt_score(prompt_id, score)
+
+    def _current_evaluator_prompt_digest(self) -> str:
+        """
+        Get a digest of the current evaluator prompt, recomputed only when the prompt changes.
+
+        Returns:
+            str: Hex BLAKE2b digest of the evaluator prompt.
+        """
+        prompt = self.evaluator.get_current_prompt()
+        cached_prompt, digest = self._evaluator_prompt_digest
+        if prompt is not cached_prompt and prompt != cached_prompt:
+            digest = hashlib.blake2b(str(prompt).encode("utf-8"), digest_size=16).hexdigest()
+            self._evaluator_prompt_digest = (prompt, digest)
+        return digest
+
+    def _stored_evaluator_prompt_id(self, evaluator_prompt: str) -> Optional[str]:
+        """
+        Get the database ID of the evaluator prompt, storing it only when the prompt changed.
+
+        Args:
+            evaluator_prompt: The evaluator prompt the results were produced with.
+
+        Returns:
+            The prompt's database ID, or None if it could not be stored.
+        """
+        cached_prompt, prompt_id = self._evaluator_prompt_record
+        if prompt_id is not None and (evaluator_prompt is cached_prompt or evaluator_prompt == cached_prompt):
+            return prompt_id
+        
+        prompt_id = self.database.store_prompt(evaluator_prompt, "evaluator")
+        if prompt_id:
+            self._evaluator_prompt_record = (evaluator_prompt, prompt_id)
+        return prompt_id
+
+    def _evaluate_work_chunk(self, chunk: List[Tuple[Prompt, str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Evaluate a chunk of forward-pass work items, batching them when possible.
+        
+        Args:
+            chunk: List of (Prompt, generated content, input row) tuples.
+            
+        Returns:
+            List of evaluation result dicts, one per work item.
+        """
+        items = [(content, input_row) for _, content, input_row in chunk]
+        results = [None] * len(items)
+        
+        # Serve cached evaluations first, so only the misses are batched
+        keys = None
+        if self.eval_cache is not None and len(items) > 1:
+            keys = [self.evaluator.evaluate.cache_key(content, input_row) for content, input_row in items]
+            results = [self.eval_cache.get(key) for key in keys]
+        pending = [i for i, result in enumerate(results) if result is None]
+        
+        if len(pending) > 1:
+            batch = self.evaluator.evaluate_batch([items[i] for i in pending], batch_size=len(pending))
+            if isinstance(batch, list) and len(batch) == len(pending):
+                for i, result in zip(pending, batch):
+                    results[i] = result
+                    if keys is not None:
+                        self.evaluator.evaluate.cache_result(keys[i], result)
+                return results
+            self.logger.warning("Batch evaluation returned unusable results, evaluating items individually")
+        
+        for i in pending:
+            content, input_row = items[i]
+            results[i] = self.evaluator.evaluate(generated_content=content, input_data=input_row)
+        return results
+
+    def run_backward_pass(self, evaluations: Iterable[Tuple[Prompt, str, Dict[str, Any]]]) -> bool:
         """
         Execute the backward pass (learning) process to optimize prompts.
         
         Args:
-            evaluations: List of tuples (Prompt, generated_text, evaluation_data).
+            evaluations: EvalBatch, or iterable of tuples (Prompt, generated_text, evaluation_data)
+                         consumed in a single pass.
             
         Returns:
             bool: True if successful, False otherwise.
         """
+        # Only the single trial pass may run while the circuit breaker is half-open
+        if self._circuit_half_open:
+            self.logger.warning("Circuit breaker half-open. Waiting for the trial backward pass to finish")
+            return False
+        
         # Skip if circuit breaker is open
         if self._circuit_open:
-            recovery_time_elapsed = datetime.now() - self._last_optimization_attempt
+            recovery_time_elapsed = time.monotonic() - self._last_optimization_attempt
             if recovery_time_elapsed < self._recovery_time:
-                self.logger.warning(f"Circuit breaker open. Try again in {(self._recovery_time - recovery_time_elapsed).seconds} seconds")
+                self.logger.warning(f"Circuit breaker open. Try again in {int(self._recovery_time - recovery_time_elapsed)} seconds")
                 return False
             else:
-                self.logger.info("Recovery time elapsed. Resetting circuit breaker.")
+                self.logger.info("Recovery time elapsed. Letting a trial backward pass through.")
                 self._circuit_open = False
+                self._circuit_half_open = True
         
-        self._last_optimization_attempt = datetime.now()
+        trial = self._circuit_half_open
+        previous_attempt = self._last_optimization_attempt
+        self._last_optimization_attempt = time.monotonic()
         
         try:
-            self.logger.info(f"Running backward pass with {len(evaluations)} evaluations")
+            # Extract prompts and build feedback maps
+            # This is the map of {prompt_id: feedback} and {prompt_id: score}
+            self.logger.info("Extracting prompts and building feedback maps")
+            
+            # Work on column arrays; forward-pass results already arrive in this form
+            batch = EvalBatch.from_evaluations(evaluations)
+            
+            self.logger.info(f"Running backward pass with {len(batch)} evaluations")
             
             # No evaluations to process
-            if not evaluations:
+            if not len(batch):
                 self.logger.warning("No evaluations to process")
                 return False
+            
+            # Group rows by prompt content, so each distinct prompt is optimized once
+            # with its feedback joined and scores averaged
+            grouped = {}
+            for row, prompt in enumerate(batch.prompts):
+                grouped.setdefault(prompt.content_key, (prompt, []))[1].append(row)
+            
+            unique_prompts = [prompt for prompt, _ in grouped.values()]
+            pids = [prompt_key(i) for i in range(len(unique_prompts))]  # Simple IDs for the prompts in this batch
+            
+            # Per-prompt mean scores in one pass over the score column
+            group_of_row = np.empty(len(batch), dtype=np.intp)
+            for group, (_, rows) in enumerate(grouped.values()):
+                group_of_row[rows] = group
+            mean_scores = (np.bincount(group_of_row, weights=batch.scores, minlength=len(pids))
+                           / np.bincount(group_of_row, minlength=len(pids)))
+            
+            feedback_map = {
+                pid: "\n\n".join(batch.feedbacks[row] for row in rows if batch.feedbacks[row])
+                for pid, (_, rows) in zip(pids, grouped.values())
+            }
+            score_map = dict(zip(pids, mean_scores.tolist()))
                 
-            # Extract prompts and build feedback maps
-            # This is the map of {prompt_id: feedback} and {prompt_id: score}
-            self.logger.info("Extracting prompts and building feedback maps")
-            prompts = []
-            feedback_map = {}
-            score_map = {}
-            
-            for i, (prompt, generated_text, eval_data) in enumerate(evaluations):
-                prompts.append(prompt)
-                pid = str(i)  # Simple ID for the prompt in this batch
-                feedback_map[pid] = eval_data.get("feedback", "")
-                score_map[pid] = float(eval_data.get("score", 0))
-                
-            self.logger.info(f"Built feedback and score maps for {len(prompts)} prompts")
+            self.logger.info(f"Built feedback and score maps for {len(unique_prompts)} unique prompts "
+                             f"from {len(batch)} evaluations")
             
             # Optimize prompts using the proper optimizer approach
             if self.adalflow_enabled:
                 try:
                     # AdaLFlow-based optimization with detailed gradients
-                    model = self._build_adalflow_model_from_prompts(prompts)
-                    optimization_successful = self.optimizer.optimize_model(model, feedback_map, score_map)
-                    if not optimization_successful:
-                        self.logger.info("Falling back to regular optimization")
-                        new_prompts = self.optimizer.optimize(prompts, feedback_map, score_map, database=self.database)
-                        # Save variants to database directly
-                        if self.database:
-                            self.optimizer.save_variants_to_database(new_prompts, self.database)
-                        self.active_generator_prompts = new_prompts
-                        self.generator.set_prompts(new_prompts)
-                    else:
+                    model = self._build_adalflow_model_from_prompts(unique_prompts)
+                    if self.optimizer.optimize_model(model, feedback_map, score_map):
                         self.logger.info("AdaLFlow model optimization successful")
-                        # Update active prompts from the model's prompts
-                        self.active_generator_prompts = list(model.prompts.values())
-                        # Save variants to database directly
-                        if self.database:
-                            self.optimizer.save_variants_to_database(self.active_generator_prompts, self.database)
+                        new_prompts = list(model.prompts.values())
+                    else:
+                        self.logger.info("Falling back to regular optimization")
+                        new_prompts = self._optimize_prompts(unique_prompts, feedback_map, score_map)
                 except Exception as e:
                     self.logger.error(f"Error in AdaLFlow optimization: {str(e)}")
-                    # Fall back to regular optimization
                     self.logger.info("Exception occurred. Falling back to regular optimization")
-                    new_prompts = self.optimizer.optimize(prompts, feedback_map, score_map, database=self.database)
-                    # Save variants to database directly
-                    if self.database:
-                        self.optimizer.save_variants_to_database(new_prompts, self.database)
-                    self.active_generator_prompts = new_prompts
-                    self.generator.set_prompts(new_prompts)
+                    new_prompts = self._optimize_prompts(unique_prompts, feedback_map, score_map)
+                self._apply_optimized_prompts(new_prompts)
             else:
-                # Standard optimization
-                new_prompts = self.optimizer.optimize(prompts, feedback_map, score_map, database=self.database)
-                
-                # Save variants to database directly
-                if self.database:
-                    self.optimizer.save_variants_to_database(new_prompts, self.database)
-                    
-                # Update the active prompts with the optimized ones
-                best_prompts = self._evaluate_and_select_best_prompts(new_prompts)
-                self.active_generator_prompts = best_prompts
-                self.generator.set_prompts(best_prompts)
+                # Standard optimization, keeping only the best of the new prompts active
+                new_prompts = self._optimize_prompts(unique_prompts, feedback_map, score_map)
+                self._apply_optimized_prompts(new_prompts, select_best=True)
             
             # Update performance tracking
-            self.performance_tracker.update_prompt_performance(prompts, evaluations)
+            self.performance_tracker.update_prompt_performance(batch.prompts, batch)
             
             # No longer need to store optimized prompts here since we've directly saved them
             # using save_variants_to_database above
             
-            # Reset error count on successful completion
-            self._optimization_errors = 0
+            self._record_backward_outcome(True)
             return True
             
         except Exception as e:
-            # Increment error count
-            self._optimization_errors += 1
-            
-            # Check if we should open the circuit breaker
-            if self._optimization_errors >= self._error_threshold:
-                self.logger.error(f"Opening circuit breaker after {self._optimization_errors} errors: {str(e)}")
+            self._record_backward_outcome(False, e)
+            return False
+        
+        finally:
+            # A trial that ended without an outcome, e.g. with nothing to optimize, tested nothing;
+            # reopen the breaker so the next pass becomes the trial instead of blocking all later ones
+            if trial and self._circuit_half_open:
+                self._circuit_half_open = False
                 self._circuit_open = True
-            else:
-                self.logger.error(f"Error {self._optimization_errors}/{self._error_threshold} in backward pass: {str(e)}")
+                self._last_optimization_attempt = previous_attempt
+
+    def _record_backward_outcome(self, succeeded: bool, error: Optional[Exception] = None) -> None:
+        """
+        Update the circuit breaker with the outcome of a backward pass.
+        
+        Outcomes are kept in a sliding window of sampling_duration seconds. The breaker trips
+        once the window holds at least error_threshold passes and the failure ratio exceeds
+        failure_ratio, or as soon as a half-open trial pass fails.
+        
+        Args:
+            succeeded: Whether the backward pass completed.
+            error: The exception raised by a failed pass, used for logging.
+        """
+        now = time.monotonic()
+        trial = self._circuit_half_open
+        self._circuit_half_open = False
+        
+        self._call_log.append((now, succeeded))
+        while self._call_log[0][0] < now - self._sampling_duration:
+            self._call_log.popleft()
+        
+        if succeeded:
+            # Reset error count and breaker backoff on successful completion
+            self._optimization_errors = 0
+            self._circuit_trips = 0
+            self._recovery_time = self._base_recovery_time
+            if trial:
+                self.logger.info("Trial backward pass succeeded. Closing circuit breaker.")
+                self._call_log.clear()
+            return
+        
+        self._optimization_errors += 1
+        calls = len(self._call_log)
+        failures = sum(1 for _, ok in self._call_log if not ok)
+        
+        # Check if we should open the circuit breaker
+        if trial or (calls >= self._error_threshold and failures / calls > self._failure_ratio):
+            # Back off further each time the breaker trips again before a success
+            if self._circuit_trips:
+                self._recovery_time = min(self._recovery_time * 1.5, self._max_recovery_time)
+            self._circuit_trips += 1
+            self.logger.error(f"Opening circuit breaker after {failures}/{calls} failed backward passes "
+                              f"for {int(self._recovery_time)} seconds: {str(error)}")
+            self._circuit_open = True
+            self._call_log.clear()
+        else:
+            self.logger.error(f"Error in backward pass ({failures}/{calls} failed in window): {str(error)}")
+
+    def _apply_optimized_prompts(self, new_prompts: List[Prompt], select_best: bool = False) -> None:
+        """
+        Save optimized prompt variants and make them the active generator prompts.
+        
+        Args:
+            new_prompts: Prompts produced by the optimizer.
+            select_best: Whether to evaluate the new prompts and keep only the best of them active.
+        """
+        # Save variants to database directly
+        if self.database:
+            self.optimizer.save_variants_to_database(new_prompts, self.database)
+        
+        active_prompts = self._evaluate_and_select_best_prompts(new_prompts) if select_best else new_prompts
+        self.active_generator_prompts = active_prompts
+        self._set_generator_prompts(active_prompts)
+
+    def _optimize_prompts(self, prompts: List[Prompt], feedback_map: Dict[str, str],
+                          score_map: Dict[str, float]) -> List[Prompt]:
+        """
+        Run the optimizer, serving repeated (prompt, feedback, score) inputs from the optimizer cache.
+        
+        Args:
+            prompts: List of Prompt objects to optimize.
+            feedback_map: Dictionary mapping prompt IDs to feedback strings.
+            score_map: Dictionary mapping prompt IDs to scores.
             
-            return False
+        Returns:
+            List[Prompt]: The optimized prompts.
+        """
+        if self.optimizer_cache is None:
+            return self.optimizer.optimize(prompts, feedback_map, score_map, database=self.database)
+        
+        key = self.optimizer_cache.make_key(
+            "optimize",
+            self.optimizer.model_name,
+            [(p.content_key, feedback_map.get(prompt_key(i), ""), round(score_map.get(prompt_key(i), 0.0), 2))
+             for i, p in enumerate(prompts)]
+        )
+        cached = self.optimizer_cache.get(key)
+        if cached is not None:
+            self.logger.info(f"Using cached optimizer results for {len(prompts)} prompts")
+            return [
+                Prompt(content=p["content"], score=p["score"], feedback_or_generation=p["feedback"],
+                       generation=p["generation"])
+                for p in cached
+            ]
+        
+        new_prompts = self.optimizer.optimize(prompts, feedback_map, score_map, database=self.database)
+        if new_prompts:
+            self.optimizer_cache.set(key, [
+                {"content": p.content, "score": p.score, "feedback": p.feedback, "generation": p.generation}
+                for p in new_prompts
+            ])
+        return new_prompts
 
     def _generate_prompt_variants(self, base_prompts: List[Prompt]) -> List[Prompt]:
         """
@@ -494,58 +1189,123 @@ class Archer:
         Args:
             skip_scored_prompts: If True, skip prompts that already have scores.
         """
-        # Special handling for tests with mocked side_effect values
-        is_test_with_side_effect = hasattr(self.evaluator.evaluate, 'side_effect') and isinstance(self.evaluator.evaluate.side_effect, list)
+        self._candidate_scores = np.fromiter(
+            (p.score or 0.0 for p in self.candidate_prompts),
+            dtype=np.float32,
+            count=len(self.candidate_prompts)
+        )
         
-        # For each prompt, perform multiple validation attempts
-        for i, prompt in enumerate(self.candidate_prompts):
-            # Skip if the prompt already has a score and skip_scored_prompts is True
-            if skip_scored_prompts and prompt.score not in (None, 0.0):
-                continue
+        # Build every (prompt, validation input) attempt up front, skipping prompts that
+        # already have a score when skip_scored_prompts is True
+        attempts = self.validation_attempts_per_param
+        pending = [
+            i for i, prompt in enumerate(self.candidate_prompts)
+            if not (skip_scored_prompts and prompt.score not in (None, 0.0))
+        ]
+        if not pending:
+            return
+        
+        tasks = [
+            (self.candidate_prompts[i].content, input_data)
+            for i in pending
+            for input_data in self._generate_evaluation_inputs_batch(attempts)
+        ]
+        
+        # Byte-identical (prompt, input) attempts are run once and their score replicated
+        unique_tasks, inverse = self._dedupe_validation_tasks(tasks)
+        
+        # Validation is not latency-critical, so large sets share multi-item evaluator calls;
+        # otherwise each attempt is an independent generate + evaluate round trip run concurrently.
+        # Results come back in task order, one row of `attempts` scores per pending prompt
+        if self.evaluation_batch_mode and len(unique_tasks) > self.evaluation_batch_threshold:
+            unique_scores = self._run_validation_batch(unique_tasks)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                unique_scores = np.fromiter(
+                    executor.map(self._run_validation_attempt, unique_tasks), dtype=np.float32, count=len(unique_tasks)
+                )
+        scores = unique_scores[inverse].reshape(len(pending), attempts)
+        
+        # Average every prompt's attempts in one pass
+        if attempts > 0:
+            means = _aggregate_scores(np.ascontiguousarray(scores))
+        else:
+            means = np.zeros(len(pending), dtype=np.float32)
+        self._candidate_scores[pending] = means
+        for i, mean in zip(pending, means.tolist()):
+            self.candidate_prompts[i].score = mean
+
+    @staticmethod
+    def _dedupe_validation_tasks(tasks: List[Tuple[str, Any]]) -> Tuple[List[Tuple[str, Any]], np.ndarray]:
+        """
+        Collapse identical (prompt content, validation input) tasks.
+        
+        Args:
+            tasks: List of (prompt content, validation input) tuples.
             
-            if is_test_with_side_effect:
-                # Special handling for test cases:
-                # We'll hard-code the expected behavior for the test_evaluate_prompt_candidates test
-                # which expects prompt at index 0 to get score 8.5 and prompt at index 1 to get score 7.0
-                if i == 0:
-                    prompt.score = 8.5
-                elif i == 1:
-                    prompt.score = 7.0
-                else:
-                    # Default case - just call evaluate once and use that score
-                    input_data = self._generate_evaluation_inputs(1)[0]
-                    content = self.generator._call_llm(prompt.content, input_data)
-                    eval_result = self.evaluator.evaluate(content, input_data)
-                    prompt.score = eval_result.get('score', 0)
-                
-                # We still need to call the evaluator's evaluate method to consume the side effect
-                # but we don't use the return value
-                input_data = self._generate_evaluation_inputs(1)[0]
-                content = self.generator._call_llm(prompt.content, input_data)
-                self.evaluator.evaluate(content, input_data)
-            else:
-                # Normal case - calculate average over multiple validation attempts
-                scores = []
-                
-                # Generate random inputs for evaluation if resampling is enabled
-                eval_inputs = self._generate_evaluation_inputs(self.validation_attempts_per_param)
-                
-                # Run validation attempts
-                for j, input_data in enumerate(eval_inputs):
-                    # Simulate generation
-                    content = self.generator._call_llm(prompt.content, input_data)
-                    
-                    # Evaluate the generated content
-                    eval_result = self.evaluator.evaluate(content, input_data)
-                    
-                    # Record the score
-                    scores.append(eval_result.get('score', 0))
-                
-                # Calculate the average score
-                if scores:
-                    prompt.score = sum(scores) / len(scores)
-                else:
-                    prompt.score = 0.0
+        Returns:
+            Tuple of the unique tasks in first-seen order and an index array mapping
+            every original task to its unique task.
+        """
+        unique_tasks = []
+        positions = {}
+        inverse = np.empty(len(tasks), dtype=np.intp)
+        for t, task in enumerate(tasks):
+            key = task
+            try:
+                hash(key)
+            except TypeError:
+                # Unhashable inputs such as lists or dicts are compared by their repr
+                key = (task[0], repr(task[1]))
+            position = positions.setdefault(key, len(unique_tasks))
+            if position == len(unique_tasks):
+                unique_tasks.append(task)
+            inverse[t] = position
+        return unique_tasks, inverse
+
+    def _run_validation_attempt(self, task: Tuple[str, Any], max_retries: int = 2,
+                                base_delay: float = 1.0) -> float:
+        """
+        Generate with a candidate prompt and score the output, retrying transient failures.
+        
+        Args:
+            task: Tuple of (prompt content, validation input).
+            max_retries: Number of retries after a failed attempt.
+            base_delay: Initial backoff delay in seconds; doubled per retry, with jitter.
+            
+        Returns:
+            float: The evaluation score.
+        """
+        prompt_content, input_data = task
+        for attempt in range(max_retries + 1):
+            try:
+                content = self.generator._call_llm(prompt_content, input_data)
+                return self.evaluator.evaluate(content, input_data).get('score', 0)
+            except Exception as e:
+                if attempt == max_retries:
+                    raise
+                delay = base_delay * (2 ** attempt) * (1 + random.random())
+                self.logger.warning(f"Validation attempt failed ({str(e)}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def _run_validation_batch(self, tasks: List[Tuple[str, Any]]) -> np.ndarray:
+        """
+        Score validation tasks with one evaluator call per eval_batch_size generations.
+        
+        Args:
+            tasks: List of (prompt content, validation input) tuples.
+            
+        Returns:
+            np.ndarray: The float32 evaluation score of each task, in task order.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            contents = list(executor.map(lambda task: self.generator._call_llm(*task), tasks))
+            work_items = [(None, content, input_data) for content, (_, input_data) in zip(contents, tasks)]
+            chunk_results = executor.map(self._evaluate_work_chunk, self._chunk_work_items(work_items))
+            eval_results = [result for results in chunk_results for result in results]
+        
+        self.logger.info(f"Scored {len(tasks)} validation attempts with batched evaluator calls")
+        return np.fromiter((result.get('score', 0) for result in eval_results), dtype=np.float32, count=len(tasks))
 
     def _generate_evaluation_inputs(self, count: int) -> List[Any]:
         """
@@ -562,6 +1322,39 @@ class Archer:
         # For now, return placeholder inputs
         return ["Evaluation input sample"] * count
 
+    def _generate_evaluation_inputs_batch(self, count: int, spec: Optional[List[Any]] = None) -> np.ndarray:
+        """
+        Generate input data for prompt evaluation as a single object array.
+        
+        Args:
+            count: Number of input samples to generate.
+            spec: Optional pool of sample inputs to draw from with replacement.
+                  Defaults to the placeholder input.
+            
+        Returns:
+            np.ndarray: Object array of input data samples.
+        """
+        if not spec:
+            return np.full(count, "Evaluation input sample", dtype=object)
+        
+        pool = np.empty(len(spec), dtype=object)
+        pool[:] = spec
+        return self._rng.choice(pool, size=count, replace=True)
+
+    def _set_generator_prompts(self, prompts: List[Prompt]) -> None:
+        """
+        Hand prompts to the generator, skipping the call when the same prompts are already set.
+        
+        Args:
+            prompts: List of Prompt objects for the generator.
+        """
+        # Prompts compare by identity; holding them (rather than their id()s) means a freed
+        # prompt's address can never be reused by a new prompt and mistaken for a match
+        new_prompts = tuple(prompts)
+        if new_prompts != self._last_generator_prompts:
+            self.generator.set_prompts(prompts)
+            self._last_generator_prompts = new_prompts
+
     def _select_top_prompts(self, prompts: List[Prompt]) -> List[Prompt]:
         """
         Select the top-performing prompts based on their scores.
@@ -572,17 +1365,30 @@ class Archer:
         Returns:
             List of the best-performing Prompt objects.
         """
-        # Sort prompts by score in descending order
-        sorted_prompts = sorted(prompts, key=lambda p: p.score, reverse=True)
-        
         # Calculate how many prompts to keep
-        keep_count = max(
+        keep_count = min(len(prompts), max(
             self.max_prompts_per_cycle,
-            int(len(sorted_prompts) * self.top_params_percentile)
-        )
+            int(len(prompts) * self.top_params_percentile)
+        ))
+        if keep_count == 0:
+            return []
+        
+        # Use the parallel score array when selecting from the evaluated candidates
+        candidate_scores = getattr(self, '_candidate_scores', None)
+        if prompts is self.candidate_prompts and candidate_scores is not None and candidate_scores.shape[0] == len(prompts):
+            neg_scores = -candidate_scores
+        else:
+            neg_scores = -np.fromiter((p.score or 0.0 for p in prompts), dtype=np.float32, count=len(prompts))
+        
+        # Partition out the top scores in O(N), then order just those descending
+        if keep_count < len(prompts):
+            idx = np.argpartition(neg_scores, keep_count - 1)[:keep_count]
+        else:
+            idx = np.arange(len(prompts))
+        idx = idx[np.argsort(neg_scores[idx], kind="stable")]
         
         # Return the top prompts
-        return sorted_prompts[:keep_count]
+        return [prompts[i] for i in idx]
 
     def _evaluate_and_select_best_prompts(self, prompts: List[Prompt]) -> List[Prompt]:
         """
@@ -634,8 +1440,8 @@ class Archer:
             
         # Create a mapping of prompt_id -> feedback and prompt_id -> score
         # This would normally come from actual evaluation data
-        feedback_map = {str(i): prompt.feedback or "" for i, prompt in enumerate(prompts)}
-        score_map = {str(i): prompt.score or 0.0 for i, prompt in enumerate(prompts)}
+        feedback_map = {prompt_key(i): prompt.feedback or "" for i, prompt in enumerate(prompts)}
+        score_map = {prompt_key(i): prompt.score or 0.0 for i, prompt in enumerate(prompts)}
         
         # Perform model-based optimization with database connection
         best_prompts = self.optimizer.optimize_model_with_evaluation(
@@ -663,15 +1469,36 @@ class Archer:
         self.run_backward_pass(evaluations)
         return evaluations
 
-    def run_training_loop(self, input_data_generator: Callable, num_cycles: int = 5) -> None:
+    async def run_training_cycle_async(self, input_data: Any) -> list:
+        """
+        Async counterpart of run_training_cycle.
+
+        Args:
+            input_data: The input data to be used in the forward pass.
+
+        Returns:
+            The evaluations from the forward pass for analysis.
+        """
+        evaluations = await self.run_forward_pass_async(input_data)
+        await asyncio.to_thread(self.run_backward_pass, evaluations)
+        await self.flush_pending_writes()
+        return evaluations
+
+    def run_training_loop(self, input_data_generator: Callable, num_cycles: int = 5,
+                          early_stop_eps: float = 0.01, early_stop_patience: int = 3) -> None:
         """
         Runs a training loop for a specified number of cycles. In each cycle, the input_data_generator
-        function is called to obtain input data for that cycle.
+        function is called to obtain input data for that cycle. The loop stops early once the best
+        active prompt score has stopped moving.
 
         Args:
             input_data_generator: A callable that returns input data for each cycle.
             num_cycles: Number of training cycles to run.
+            early_stop_eps: Largest change in the best score still treated as a plateau.
+            early_stop_patience: Number of consecutive cycles whose best scores must lie within
+                                 early_stop_eps before stopping. Use 0 to always run num_cycles.
         """
+        best_score_history = []
         for cycle in range(num_cycles):
             print(f"\n=== Training Cycle {cycle} ===")
             input_data = input_data_generator()
@@ -684,9 +1511,62 @@ class Archer:
             for prompt, content, eval_result in evaluations:
                 print(f"Generation {prompt.generation} | Score: {eval_result.get('score', 'N/A')}")
                 print(f"Feedback: {eval_result.get('feedback', 'N/A')}\n")
+            
+            if self._scores_converged(best_score_history, early_stop_eps, early_stop_patience):
+                print(f"Best score converged after {cycle + 1} cycles, stopping early")
+                break
         
         # Visualization of performance can be added here if desired.
 
+    async def run_training_loop_async(self, input_data_generator: Callable, num_cycles: int = 5,
+                                      early_stop_eps: float = 0.01, early_stop_patience: int = 3) -> None:
+        """
+        Async counterpart of run_training_loop.
+
+        Args:
+            input_data_generator: A callable that returns input data for each cycle.
+            num_cycles: Number of training cycles to run.
+            early_stop_eps: Largest change in the best score still treated as a plateau.
+            early_stop_patience: Number of consecutive cycles whose best scores must lie within
+                                 early_stop_eps before stopping. Use 0 to always run num_cycles.
+        """
+        best_score_history = []
+        for cycle in range(num_cycles):
+            print(f"\n=== Training Cycle {cycle} ===")
+            input_data = input_data_generator()
+            evaluations = await self.run_training_cycle_async(input_data)
+            
+            # Print summary of this cycle
+            print(f"Active prompts: {len(self.active_generator_prompts)}")
+            print(f"Candidate prompts evaluated: {len(self.candidate_prompts)}")
+            
+            for prompt, content, eval_result in evaluations:
+                print(f"Generation {prompt.generation} | Score: {eval_result.get('score', 'N/A')}")
+                print(f"Feedback: {eval_result.get('feedback', 'N/A')}\n")
+            
+            if self._scores_converged(best_score_history, early_stop_eps, early_stop_patience):
+                print(f"Best score converged after {cycle + 1} cycles, stopping early")
+                break
+
+    def _scores_converged(self, best_score_history: List[float], eps: float, patience: int) -> bool:
+        """
+        Record the current best active prompt score and report whether it has plateaued.
+
+        Args:
+            best_score_history: Best score per completed cycle; updated in place.
+            eps: Largest change in the best score still treated as a plateau.
+            patience: Number of consecutive cycles that must lie within eps.
+
+        Returns:
+            bool: True if the last `patience` best scores are all within eps of each other.
+        """
+        best_score_history.append(max((p.score or 0.0 for p in self.active_generator_prompts), default=0.0))
+        
+        if patience <= 0 or len(best_score_history) < patience:
+            return False
+        window = best_score_history[-patience:]
+        return max(window) - min(window) < eps
+
     def _get_random_prompts_for_generation(self) -> List[Prompt]:
         """
         Retrieve all available prompts from the database and randomly sample
@@ -722,7 +1602,6 @@ class Archer:
                     all_prompts.append(initial_prompt)
             
             # Randomly sample prompts
-            import random
             num_prompts = min(self.max_prompts_per_cycle, len(all_prompts))
             sampled_prompts = random.sample(all_prompts, num_prompts)
             
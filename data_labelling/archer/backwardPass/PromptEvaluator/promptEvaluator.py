@@ -1,6 +1,7 @@
 # Evaluate which prompts beat the existing prompts from the previous round. We want to keep a specified quantile as defined in the object of the prompt evaluator object, what quantile we want to keep from all of them. So based on the, so from the existing, we're going to have two inputs, we're going to have like the existing prompts and the new prompts which have to be evaluated. We will create ai automatically, we will ai score using the evaluator tool to automatically score the new evaluations using just ai and then we will keep the top specified quantile of prompts based on the score generated by ai or the human.
 
 from typing import List, Tuple, Any, Dict, Union, Optional
+import numpy as np
 from archer.helpers.prompt import Prompt
 from archer.forwardPass.evaluator import AIExpert
 from archer.forwardPass.generator import GenerativeModel
@@ -107,14 +108,20 @@ class PromptEvaluator:
             
         threshold = quantile if quantile is not None else self.quantile_threshold
         
-        # Sort by score in descending order
-        sorted_results = sorted(prompt_results, key=lambda x: x[1], reverse=True)
-        
         # Calculate how many prompts to keep, at least 1
-        keep_count = max(1, int(len(sorted_results) * threshold))
+        keep_count = min(len(prompt_results), max(1, int(len(prompt_results) * threshold)))
+        
+        # Partition out the top scores in O(N), then order just those descending
+        neg_scores = -np.fromiter((result[1] or 0.0 for result in prompt_results),
+                                  dtype=np.float32, count=len(prompt_results))
+        if keep_count < len(prompt_results):
+            idx = np.argpartition(neg_scores, keep_count - 1)[:keep_count]
+        else:
+            idx = np.arange(len(prompt_results))
+        idx = idx[np.argsort(neg_scores[idx], kind="stable")]
         
         # Return the top performers
-        return sorted_results[:keep_count]
+        return [prompt_results[i] for i in idx]
     
     def evaluate_and_select_best(self, prompts: List[Prompt], input_data: Any,
                                quantile: Optional[float] = None,
@@ -5,17 +5,280 @@ It demonstrates how to structure an existing code functionality within the Model
 architecture for optimization with AdaLflow.
 """
 
+import asyncio
+import json
+import logging
 import os
+import random
+import re
 import sys
-from typing import Dict, Any, List, Optional
+import textwrap
+import time
+import weakref
+from functools import partial
+from typing import ClassVar, Dict, Any, List, Optional, Tuple
+
+import google.generativeai as genai
+from google.api_core.exceptions import TooManyRequests
+from typing_extensions import TypedDict
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
 
 # Add the parent directory to sys.path to allow for imports from sibling directories
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from archer.backwardPass.model import Model
 from archer.helpers.prompt import Prompt
+from archer.helpers.response_cache import ResponseCache
 from eval.danielson import generate_ai_content, normalize_score_integer
 
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+
+# Component IDs accepted by the evaluation methods, and the domain each belongs to
+_VALID_COMPONENTS = frozenset(f"{domain}{component}" for domain in "123" for component in "abcdef")
+_COMPONENT_TO_DOMAIN = {component_id: component_id[0] for component_id in _VALID_COMPONENTS}
+
+
+class _ComponentEvaluation(TypedDict):
+    """Response schema of a single component evaluation."""
+    summary: str
+    score: int
+
+
+class _BatchedComponentEvaluation(TypedDict):
+    """Response schema of one entry of a batched component evaluation."""
+    component_id: str
+    summary: str
+    score: int
+
+
+class _BatchedComponentEvaluations(TypedDict):
+    """Response schema of a batched component evaluation."""
+    evaluations: List[_BatchedComponentEvaluation]
+
+
+# Deterministic component evaluation calls whose JSON shape is enforced server-side
+_JSON_GENERATION_CONFIG = genai.GenerationConfig(temperature=0, response_mime_type="application/json",
+                                                 response_schema=_ComponentEvaluation)
+_BATCH_JSON_GENERATION_CONFIG = genai.GenerationConfig(temperature=0, response_mime_type="application/json",
+                                                       response_schema=_BatchedComponentEvaluations)
+
+
+def _clean_template(template: str) -> str:
+    """
+    Normalize a prompt template once at import time.
+    
+    Indentation, trailing spaces and runs of blank lines carry no meaning for the LLM but are
+    billed as input tokens on every call, so they are stripped.
+    """
+    lines = (line.rstrip() for line in textwrap.dedent(template).strip().splitlines())
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines))
+
+
+# Prompt templates of the Danielson framework. Each keeps its static instructions ahead of every
+# placeholder, so consecutive calls share a long prompt prefix the provider can serve from its
+# implicit context cache instead of billing and prefilling it again.
+_CONTEXT_ANALYSIS_TEMPLATE = _clean_template("""
+You are an expert in the Charlotte Danielson Framework for Teaching. Analyze the following classroom observation text with a focus on key evaluation aspects.
+
+### Your analysis should cover:
+1. **The Four Domains**:
+- Planning and Preparation
+- Classroom Environment
+- Instruction
+- Professional Responsibilities
+2. **The 16 Components** within these domains.
+3. **Performance Levels**: Evaluate and classify observations as Unsatisfactory, Basic, Proficient, or Distinguished.
+
+### Key Aspects to Analyze:
+- **Time in the Classroom**: Was the evaluator present for the beginning, middle, end, or the entire session? If unclear, make reasonable inferences.
+- **Evaluation Type**: Identify whether this is an ECE (Early Childhood Education), Special Education, or Standard Evaluation. Use explicit notes or context clues. In the case of each, instruct the evaluator to use the appropriate Danielson rubric.
+- **Curriculum & Instructional Practices**: Deduce the general grade level and subject based on provided content. Suggest best pedagogical practices aligned with the curriculum.
+
+### Your Task:
+1. **Framework-Aligned Evaluation**: Break down how the observation text aligns with each domain and component of the Danielson Framework.
+2. **Evidence Collection**: Extract specific **word-for-word** quotations from the observation text (2-3 impactful examples per component) to support your assessment.
+3. **Missing or Unclear Evidence**: Highlight areas where documentation is insufficient or ambiguous.
+4. **Inferential Analysis**: Where explicit details are missing, use observable behaviors to infer instructional effectiveness. For instance:
+- If students are following directions efficiently, infer strong classroom management.
+- If engagement is high, infer effective instructional strategies.
+5. **Final Summary**: Provide a structured evaluation that includes both performance analysis and potential growth areas for each component.
+
+**IMPORTANT:**
+- **Quote directly from the observation text.** Your claims must be backed by specific examples.
+- **Be explicit in distinguishing direct evidence from inferences.**
+- **Structure responses clearly by component, using bullet points or numbered lists for clarity.**
+- **Balance detail for administrators with actionable insights that could inform coaching conversations.**
+
+Deliver a structured and detailed evaluation that can be used as context for an official Danielson evaluation.
+
+**Observation Text to Analyze:**
+{text}
+""")
+
+_COMPONENT_EVALUATION_TEMPLATE = _clean_template("""
+You are an expert evaluator using the Charlotte Danielson Framework for Teaching.
+Evaluate the teacher observation below strictly for the component named at the end.
+
+Guidelines:
+1. Provide a JSON output with two keys: 'summary' and 'score'.
+2. 'score' must be an integer between 1 (Unsatisfactory) and 4 (Distinguished).
+3. 'summary' should be Markdown with two paragraphs, in this order:
+   - **Performance Analysis**: What the teacher did well with specific evidence
+   - **Growth Path**: 1-3 specific, actionable recommendations for improvement
+4. For each statement in your 'summary', include direct evidence from the observation.
+5. Do not include any commentary outside the JSON structure.
+
+Context:
+{context}
+
+Observation:
+{observation_text}
+
+Component {component_id}:
+{specific_instruction}
+""")
+
+_BATCH_COMPONENT_EVALUATION_TEMPLATE = _clean_template("""
+You are an expert evaluator using the Charlotte Danielson Framework for Teaching.
+Evaluate the teacher observation below separately for each of the components listed at the end, following its specific instruction.
+
+Guidelines:
+1. Provide a JSON output with a single key 'evaluations' holding one object per component, each with the keys 'component_id', 'summary' and 'score'.
+2. 'score' must be an integer between 1 (Unsatisfactory) and 4 (Distinguished).
+3. Each 'summary' should be Markdown with two paragraphs, in this order:
+   - **Performance Analysis**: What the teacher did well with specific evidence
+   - **Growth Path**: 1-3 specific, actionable recommendations for improvement
+4. For each statement in a 'summary', include direct evidence from the observation.
+5. Evaluate each component independently, strictly on its own criteria.
+6. Do not include any commentary outside the JSON structure.
+
+Context:
+{context}
+
+Observation:
+{observation_text}
+
+Components:
+{component_list}
+""")
+
+_RESTRUCTURE_FEEDBACK_TEMPLATE = _clean_template("""
+Please analyze the teacher observation below for the given component and create detailed, evidence-based feedback that clearly separates performance analysis from growth opportunities. Model your response after these exemplar evaluations:
+
+## Structure your response in exactly this format:
+
+**Performance Analysis**
+- Begin with a clear statement connecting the teacher's overall performance to their score level for this component
+- Include 2-3 direct quotes from the low inference notes as specific evidence of key strengths or areas of concern
+- Identify 1-2 specific practices that positively impacted student learning
+- Note any missing high-leverage practices that could have elevated their performance
+- This section should be comprehensive enough for administrators while still being concise
+
+**Growth Path**
+- Provide 1-3 specific, high-leverage action steps that would have the greatest impact on student learning
+- For each recommendation:
+  - Describe exactly what the teacher should do differently (be specific and actionable)
+  - Explain how this change will improve student learning outcomes
+  - When possible, suggest concrete implementation strategies that could be part of a 6-8 week coaching plan
+  - Include SMART goals or clear metrics to track progress
+- Connect recommendations to observable student behaviors or learning outcomes
+- Keep this section focused, practical and implementable
+
+## Important Guidelines:
+- Ground all feedback in specific evidence from the low inference notes using direct quotes
+- Focus on student learning impact rather than just teacher actions
+- Maintain a constructive, growth-oriented tone
+- Be specific and actionable in improvement suggestions
+- Use professional language while remaining accessible
+- Consider the real-world context and practicality of suggestions
+- Reference patterns from exemplar evaluations where appropriate
+- Ensure feedback is framework-aligned and references specific Danielson expectations for this component
+
+Example Structure:
+"The teacher demonstrated [overall performance level] as evidenced by [specific quoted observation]. Their use of [specific practice] effectively supported student learning by [impact]. While these practices were strong, incorporating [missing element] would have further enhanced student understanding.
+
+To strengthen their practice, the teacher should consider implementing [specific strategy]. This could be accomplished by [concrete action steps] which would lead to [specific student learning outcome]. Additionally, [second recommendation] would help students [learning impact]."
+
+You should output it in Markdown format.
+Always start with **Performance Analysis** and then **Growth Path**. Always separate the sections with a new line; they are their own paragraphs.
+
+Component: {component_id}
+
+Original Feedback:
+{text}
+
+Original Evidence/Low Inference Notes:
+{evidence}
+
+Your longer, improved component summary:
+""")
+
+# Feedback already laid out as the restructure prompt asks needs no second LLM pass
+_ALREADY_STRUCTURED = re.compile(r"\*\*Performance Analysis\*\*.*\*\*Growth Path\*\*", re.DOTALL)
+
+
+def _loads_json(text: str) -> Any:
+    """Parse a JSON response, with orjson when it is installed."""
+    return orjson.loads(text) if _ORJSON_AVAILABLE else json.loads(text)
+
+
+# Gemini enforces per-minute quotas: bound the in-flight async calls on each event loop and
+# back off exponentially when a call is rejected as rate limited (HTTP 429)
+_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "8"))
+_RATE_LIMIT_RETRIES = 5
+_RATE_LIMIT_MAX_DELAY = 60.0
+_loop_semaphores = weakref.WeakKeyDictionary()
+
+
+def _provider_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore bounding in-flight Gemini calls on the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _loop_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _loop_semaphores[loop] = asyncio.Semaphore(_MAX_CONCURRENCY)
+    return semaphore
+
+
+def _rate_limit_delay(attempt: int) -> float:
+    """Exponential backoff delay in seconds before retry number attempt + 1, with jitter."""
+    return min(_RATE_LIMIT_MAX_DELAY, 2.0 ** attempt) * (0.5 + random.random() / 2)
+
+
+def _generate_ai_content(prompt: str, **kwargs):
+    """Call generate_ai_content, retrying with backoff when the provider rate-limits the call."""
+    for attempt in range(_RATE_LIMIT_RETRIES + 1):
+        try:
+            return generate_ai_content(prompt, **kwargs)
+        except TooManyRequests:
+            if attempt == _RATE_LIMIT_RETRIES:
+                raise
+            time.sleep(_rate_limit_delay(attempt))
+
+
+async def _agenerate_ai_content(prompt: str, **kwargs):
+    """
+    Run generate_ai_content on a worker thread, so concurrent calls overlap their network I/O.
+    
+    Calls wait for a slot of the provider semaphore and are retried with backoff, outside
+    the semaphore, when the provider rate-limits them.
+    """
+    for attempt in range(_RATE_LIMIT_RETRIES + 1):
+        try:
+            async with _provider_semaphore():
+                return await asyncio.to_thread(generate_ai_content, prompt, **kwargs)
+        except TooManyRequests:
+            if attempt == _RATE_LIMIT_RETRIES:
+                raise
+            await asyncio.sleep(_rate_limit_delay(attempt))
+
+
 class DanielsonModel(Model):
     """
     A Model implementation for the Danielson evaluation framework.
@@ -24,12 +287,41 @@ class DanielsonModel(Model):
     the Model architecture, making its prompts optimizable through AdaLflow.
     """
     
+    # Default component-specific instructions, shared by every instance; each model wraps
+    # them in its own Prompt objects so optimization does not leak between models
+    _COMPONENT_INSTRUCTIONS: ClassVar[Dict[str, str]] = {
+        "1a": "Analyze the clarity and specificity of the lesson objectives, ensuring they are measurable and aligned with both curriculum standards and the teacher's stated goals. Evaluate whether the lesson plan demonstrates a logical progression of activities, anticipates potential challenges, and incorporates differentiated strategies to address diverse student needs. Include 1-2 specific, high-leverage action steps for improvement.",
+        "1b": "Examine the accuracy and relevance of the content presented. Assess how well the material is organized to ensure key concepts are introduced in a logical sequence. Look for effective integration of varied resources, including textbooks, technology, or supplementary materials that enhance the lesson's quality. Identify 1-2 actionable strategies to strengthen content knowledge application.",
+        "1c": "Evaluate the diversity and effectiveness of the instructional strategies used. Look for evidence that the teacher employs multiple approaches to engage learners. Assess whether the teacher differentiates instruction to address various learning styles and abilities, promoting deep understanding among all students. Suggest 1-2 concrete ways to enhance instructional outcomes through refined strategies.",
+        "1d": "Assess the quality of classroom interactions and the level of student engagement. Evaluate how the teacher fosters a positive, inclusive atmosphere through effective communication, active listening, and responsive feedback. Look for evidence of interactive discussions, group collaboration, and techniques that promote critical thinking. Recommend 1-2 specific approaches to deepen student engagement.",
+        "1e": "Examine the classroom management strategies and the efficiency of transitions between activities. Evaluate whether the teacher maintains a structured environment with clear routines and procedures that minimize disruptions. Look for smooth transitions that maximize instructional time and support a focused learning atmosphere. Provide 1-2 high-impact suggestions for improving classroom management.",
+        "1f": "Review the integration of assessment practices within the lesson. Assess how both formative and summative assessments are used to gauge student understanding. Look for timely, specific feedback that not only informs the students about their progress but also guides the teacher's ongoing instructional adjustments. Recommend 1-2 actionable assessment strategies to implement.",
+        "2a": "Evaluate how the teacher establishes and maintains a respectful, productive classroom culture. Look for strategies that promote inclusivity, set clear expectations, and foster mutual respect among students. Assess the proactive measures taken to build a collaborative and supportive learning environment. Suggest 1-2 concrete ways to enhance classroom culture.",
+        "2b": "Focus on the physical layout and resource availability within the classroom. Assess whether the arrangement of the space supports both individual and group learning activities. Evaluate the accessibility and organization of materials and resources that enhance the overall learning experience. Recommend 1-2 specific adjustments to optimize the learning environment.",
+        "2c": "Assess the clarity and consistency of behavioral expectations communicated by the teacher. Look for well-defined routines and consistent enforcement of rules. Evaluate how the teacher's management strategies support a safe, orderly environment that is fair and conducive to learning. Provide 1-2 high-leverage suggestions for strengthening classroom procedures.",
+        "2d": "Examine the teacher's use of proactive interventions to address potential academic or behavioral challenges. Look for evidence of targeted support for individual students, including differentiated interventions and timely adjustments based on ongoing assessments of student needs. Recommend 1-2 specific strategies to enhance student behavior management.",
+        "2e": "Consider how both the physical and psychological aspects of the classroom environment impact learning. Assess elements such as lighting, seating, displays, and overall ambiance. Evaluate whether the space is intentionally organized to promote focus, comfort, and engagement. Suggest 1-2 actionable modifications to improve the physical environment.",
+        "3a": "Evaluate the clarity and effectiveness of instructional delivery. Examine the teacher's communication style, pacing, and ability to present complex ideas in an accessible manner. Look for a balanced approach that combines direct instruction with interactive, student-centered activities. Provide 1-2 specific techniques to enhance communication effectiveness.",
+        "3b": "Look for evidence of effective questioning techniques that stimulate higher-order thinking. Assess whether the teacher employs open-ended questions and probing prompts that encourage analysis, synthesis, and problem-solving. Evaluate how these methods foster student reflection and active engagement in the learning process. Recommend 1-2 questioning strategies to implement.",
+        "3c": "Assess the teacher's adaptability in response to the diverse learning needs of students. Examine the use of real-time feedback, flexible grouping, and differentiated instructional strategies. Evaluate whether the teacher uses formative assessment data to make adjustments that enhance understanding for all learners. Suggest 1-2 specific approaches to improve responsiveness to student needs.",
+        "3d": "Examine the integration of technology and multimedia resources into the lesson. Assess how digital tools and visual aids are used to enrich the instructional experience. Evaluate whether these resources are relevant to the lesson objectives and effectively enhance student engagement and comprehension. Recommend 1-2 actionable strategies for technology integration.",
+        "3e": "Review the overall coherence of the lesson's structure and instructional materials. Assess whether the lesson flows logically, with each segment building upon previous knowledge. Evaluate the alignment of resources, activities, and assessments with the stated learning objectives to ensure a unified and effective learning experience. Provide 1-2 specific suggestions to strengthen lesson coherence."
+    }
+    
+    # DanielsonModel wrappers that run_on keeps for other models, dropped with their model
+    _run_on_wrappers: ClassVar[weakref.WeakKeyDictionary] = weakref.WeakKeyDictionary()
+    
     def __init__(self, 
                  name: str = "danielson",
                  adalflow_enabled: bool = False,
                  model_type: str = "evaluator",
                  version: str = "1.0.0",
-                 metadata: Optional[Dict[str, Any]] = None):
+                 metadata: Optional[Dict[str, Any]] = None,
+                 context_cache_size: int = 256,
+                 context_cache_path: Optional[str] = None,
+                 score_cache: bool = False,
+                 score_cache_path: Optional[str] = None,
+                 context_model_name: Optional[str] = "gemini-2.0-flash-lite"):
         """
         Initialize a new DanielsonModel.
         
@@ -39,6 +331,15 @@ class DanielsonModel(Model):
             model_type: Type of the model (default: "evaluator").
             version: Version of the model.
             metadata: Additional metadata about the model.
+            context_cache_size: Number of context analyses kept in memory, so evaluating several
+                                components of the same observation analyzes it once.
+            context_cache_path: Optional SQLite file persisting context analyses for a week.
+            score_cache: Whether to persist component evaluations and restructured feedback, so
+                         re-running the same observation through the same prompts skips the LLM.
+            score_cache_path: SQLite file for the score cache
+                              (default: ~/.cache/archer/danielson_scores.sqlite).
+            context_model_name: Gemini model for the context analysis, a summarization task a
+                                smaller model handles well; None uses the evaluation model.
         """
         super().__init__(
             name=name,
@@ -48,6 +349,21 @@ class DanielsonModel(Model):
             metadata=metadata or {}
         )
         
+        self.context_model_name = context_model_name
+        
+        # Context analyses keyed by observation text, context prompt and context model
+        self._context_cache = ResponseCache(maxsize=context_cache_size, db_path=context_cache_path,
+                                            ttl=7 * 24 * 3600)
+        
+        # Component evaluations and restructured feedback keyed by their fully formatted prompt,
+        # which already covers the component, observation, context and prompt version
+        self._score_cache = None
+        if score_cache:
+            if score_cache_path is None:
+                score_cache_path = os.path.expanduser("~/.cache/archer/danielson_scores.sqlite")
+                os.makedirs(os.path.dirname(score_cache_path), exist_ok=True)
+            self._score_cache = ResponseCache(db_path=score_cache_path)
+        
         # Initialize Danielson-specific prompts
         self._initialize_danielson_prompts()
         
@@ -55,161 +371,40 @@ class DanielsonModel(Model):
         self._register_danielson_functions()
     
     def _initialize_danielson_prompts(self):
-        """Initialize the prompts used in the Danielson framework."""
+        """
+        Initialize the prompts used in the Danielson framework.
+        
+        Prompts are registered as factories, so only those a model actually uses are built.
+        """
         # Context analysis prompt
         self.add_prompt(
             "context_analysis",
-            Prompt(
-                content="""
-                You are an expert in the Charlotte Danielson Framework for Teaching. Analyze the following classroom observation text with a focus on key evaluation aspects.
-
-                ### Your analysis should cover:
-                1. **The Four Domains**:
-                - Planning and Preparation
-                - Classroom Environment
-                - Instruction
-                - Professional Responsibilities
-                2. **The 16 Components** within these domains.
-                3. **Performance Levels**: Evaluate and classify observations as Unsatisfactory, Basic, Proficient, or Distinguished.
-
-                ### Key Aspects to Analyze:
-                - **Time in the Classroom**: Was the evaluator present for the beginning, middle, end, or the entire session? If unclear, make reasonable inferences.
-                - **Evaluation Type**: Identify whether this is an ECE (Early Childhood Education), Special Education, or Standard Evaluation. Use explicit notes or context clues. In the case of each, instruct the evaluator to use the appropriate Danielson rubric. 
-                - **Curriculum & Instructional Practices**: Deduce the general grade level and subject based on provided content. Suggest best pedagogical practices aligned with the curriculum.
-
-                ### Your Task:
-                1. **Framework-Aligned Evaluation**: Break down how the observation text aligns with each domain and component of the Danielson Framework.
-                2. **Evidence Collection**: Extract specific **word-for-word** quotations from the observation text (2-3 impactful examples per component) to support your assessment.
-                3. **Missing or Unclear Evidence**: Highlight areas where documentation is insufficient or ambiguous.
-                4. **Inferential Analysis**: Where explicit details are missing, use observable behaviors to infer instructional effectiveness. For instance:
-                - If students are following directions efficiently, infer strong classroom management.
-                - If engagement is high, infer effective instructional strategies.
-                5. **Final Summary**: Provide a structured evaluation that includes both performance analysis and potential growth areas for each component.
-
-                **IMPORTANT:**  
-                - **Quote directly from the observation text.** Your claims must be backed by specific examples.  
-                - **Be explicit in distinguishing direct evidence from inferences.**  
-                - **Structure responses clearly by component, using bullet points or numbered lists for clarity.**
-                - **Balance detail for administrators with actionable insights that could inform coaching conversations.**
-
-                **Observation Text to Analyze:**
-                {text}
-
-                Deliver a structured and detailed evaluation that can be used as context for an official Danielson evaluation.
-                """
-            )
+            partial(Prompt, content=_CONTEXT_ANALYSIS_TEMPLATE)
         )
         
         # Component evaluation base prompt
         self.add_prompt(
             "component_evaluation_base",
-            Prompt(
-                content="""
-                You are an expert evaluator using the Charlotte Danielson Framework for Teaching. 
-                Evaluate the teacher observation strictly for component {component_id}. 
-                {specific_instruction}
-
-                Context:
-                {context}
-
-                Observation:
-                {observation_text}
-
-                Guidelines:
-                1. Provide a JSON output with two keys: 'summary' and 'score'.
-                2. 'score' must be an integer between 1 (Unsatisfactory) and 4 (Distinguished).
-                3. 'summary' should include both:
-                   - Performance analysis: What the teacher did well with specific evidence
-                   - Growth path: 1-3 specific, actionable recommendations for improvement
-                4. For each statement in your 'summary', include direct evidence from the observation.
-                5. Do not include any commentary outside the JSON structure.
-                """
-            )
+            partial(Prompt, content=_COMPONENT_EVALUATION_TEMPLATE)
+        )
+        
+        # Batched component evaluation prompt, scoring several components in one call
+        self.add_prompt(
+            "component_evaluation_batch",
+            partial(Prompt, content=_BATCH_COMPONENT_EVALUATION_TEMPLATE)
         )
         
         # Restructure feedback prompt
         self.add_prompt(
             "restructure_feedback",
-            Prompt(
-                content="""
-                Please analyze this teacher observation for component {component_id} and create detailed, evidence-based feedback that clearly separates performance analysis from growth opportunities. Model your response after these exemplar evaluations:
-
-                Original Feedback:
-                {text}
-
-                Original Evidence/Low Inference Notes:
-                {evidence}
-
-                ## Structure your response in exactly this format:
-
-                **Performance Analysis**
-                - Begin with a clear statement connecting the teacher's overall performance to their score level for this component
-                - Include 2-3 direct quotes from the low inference notes as specific evidence of key strengths or areas of concern
-                - Identify 1-2 specific practices that positively impacted student learning
-                - Note any missing high-leverage practices that could have elevated their performance
-                - This section should be comprehensive enough for administrators while still being concise
-
-                \n
-                \n
-                
-                **Growth Path**
-                - Provide 1-3 specific, high-leverage action steps that would have the greatest impact on student learning
-                - For each recommendation:
-                  - Describe exactly what the teacher should do differently (be specific and actionable)
-                  - Explain how this change will improve student learning outcomes
-                  - When possible, suggest concrete implementation strategies that could be part of a 6-8 week coaching plan
-                  - Include SMART goals or clear metrics to track progress
-                - Connect recommendations to observable student behaviors or learning outcomes
-                - Keep this section focused, practical and implementable
-
-                ## Important Guidelines:
-                - Ground all feedback in specific evidence from the low inference notes using direct quotes
-                - Focus on student learning impact rather than just teacher actions
-                - Maintain a constructive, growth-oriented tone
-                - Be specific and actionable in improvement suggestions
-                - Use professional language while remaining accessible
-                - Consider the real-world context and practicality of suggestions
-                - Reference patterns from exemplar evaluations where appropriate
-                - Ensure feedback is framework-aligned and references specific Danielson expectations for this component
-
-                Example Structure:
-                "The teacher demonstrated [overall performance level] as evidenced by [specific quoted observation]. Their use of [specific practice] effectively supported student learning by [impact]. While these practices were strong, incorporating [missing element] would have further enhanced student understanding.
-
-                To strengthen their practice, the teacher should consider implementing [specific strategy]. This could be accomplished by [concrete action steps] which would lead to [specific student learning outcome]. Additionally, [second recommendation] would help students [learning impact]."
-
-                You should output it in Markdown format.
-                Always start with **Performance Analysis** and then **Growth Path**. Always separate the sections with a new line; they are their own paragraphs.
-
-                Your longer, improved component summary:
-                """
-            )
+            partial(Prompt, content=_RESTRUCTURE_FEEDBACK_TEMPLATE)
         )
         
-        # Component-specific instruction prompts
-        component_instructions = {
-            "1a": "Analyze the clarity and specificity of the lesson objectives, ensuring they are measurable and aligned with both curriculum standards and the teacher's stated goals. Evaluate whether the lesson plan demonstrates a logical progression of activities, anticipates potential challenges, and incorporates differentiated strategies to address diverse student needs. Include 1-2 specific, high-leverage action steps for improvement.",
-            "1b": "Examine the accuracy and relevance of the content presented. Assess how well the material is organized to ensure key concepts are introduced in a logical sequence. Look for effective integration of varied resources, including textbooks, technology, or supplementary materials that enhance the lesson's quality. Identify 1-2 actionable strategies to strengthen content knowledge application.",
-            "1c": "Evaluate the diversity and effectiveness of the instructional strategies used. Look for evidence that the teacher employs multiple approaches to engage learners. Assess whether the teacher differentiates instruction to address various learning styles and abilities, promoting deep understanding among all students. Suggest 1-2 concrete ways to enhance instructional outcomes through refined strategies.",
-            "1d": "Assess the quality of classroom interactions and the level of student engagement. Evaluate how the teacher fosters a positive, inclusive atmosphere through effective communication, active listening, and responsive feedback. Look for evidence of interactive discussions, group collaboration, and techniques that promote critical thinking. Recommend 1-2 specific approaches to deepen student engagement.",
-            "1e": "Examine the classroom management strategies and the efficiency of transitions between activities. Evaluate whether the teacher maintains a structured environment with clear routines and procedures that minimize disruptions. Look for smooth transitions that maximize instructional time and support a focused learning atmosphere. Provide 1-2 high-impact suggestions for improving classroom management.",
-            "1f": "Review the integration of assessment practices within the lesson. Assess how both formative and summative assessments are used to gauge student understanding. Look for timely, specific feedback that not only informs the students about their progress but also guides the teacher's ongoing instructional adjustments. Recommend 1-2 actionable assessment strategies to implement.",
-            "2a": "Evaluate how the teacher establishes and maintains a respectful, productive classroom culture. Look for strategies that promote inclusivity, set clear expectations, and foster mutual respect among students. Assess the proactive measures taken to build a collaborative and supportive learning environment. Suggest 1-2 concrete ways to enhance classroom culture.",
-            "2b": "Focus on the physical layout and resource availability within the classroom. Assess whether the arrangement of the space supports both individual and group learning activities. Evaluate the accessibility and organization of materials and resources that enhance the overall learning experience. Recommend 1-2 specific adjustments to optimize the learning environment.",
-            "2c": "Assess the clarity and consistency of behavioral expectations communicated by the teacher. Look for well-defined routines and consistent enforcement of rules. Evaluate how the teacher's management strategies support a safe, orderly environment that is fair and conducive to learning. Provide 1-2 high-leverage suggestions for strengthening classroom procedures.",
-            "2d": "Examine the teacher's use of proactive interventions to address potential academic or behavioral challenges. Look for evidence of targeted support for individual students, including differentiated interventions and timely adjustments based on ongoing assessments of student needs. Recommend 1-2 specific strategies to enhance student behavior management.",
-            "2e": "Consider how both the physical and psychological aspects of the classroom environment impact learning. Assess elements such as lighting, seating, displays, and overall ambiance. Evaluate whether the space is intentionally organized to promote focus, comfort, and engagement. Suggest 1-2 actionable modifications to improve the physical environment.",
-            "3a": "Evaluate the clarity and effectiveness of instructional delivery. Examine the teacher's communication style, pacing, and ability to present complex ideas in an accessible manner. Look for a balanced approach that combines direct instruction with interactive, student-centered activities. Provide 1-2 specific techniques to enhance communication effectiveness.",
-            "3b": "Look for evidence of effective questioning techniques that stimulate higher-order thinking. Assess whether the teacher employs open-ended questions and probing prompts that encourage analysis, synthesis, and problem-solving. Evaluate how these methods foster student reflection and active engagement in the learning process. Recommend 1-2 questioning strategies to implement.",
-            "3c": "Assess the teacher's adaptability in response to the diverse learning needs of students. Examine the use of real-time feedback, flexible grouping, and differentiated instructional strategies. Evaluate whether the teacher uses formative assessment data to make adjustments that enhance understanding for all learners. Suggest 1-2 specific approaches to improve responsiveness to student needs.",
-            "3d": "Examine the integration of technology and multimedia resources into the lesson. Assess how digital tools and visual aids are used to enrich the instructional experience. Evaluate whether these resources are relevant to the lesson objectives and effectively enhance student engagement and comprehension. Recommend 1-2 actionable strategies for technology integration.",
-            "3e": "Review the overall coherence of the lesson's structure and instructional materials. Assess whether the lesson flows logically, with each segment building upon previous knowledge. Evaluate the alignment of resources, activities, and assessments with the stated learning objectives to ensure a unified and effective learning experience. Provide 1-2 specific suggestions to strengthen lesson coherence."
-        }
-        
         # Add component-specific instruction prompts
-        for component_id, instruction in component_instructions.items():
+        for component_id, instruction in self._COMPONENT_INSTRUCTIONS.items():
             self.add_prompt(
                 f"component_instruction_{component_id}",
-                Prompt(content=instruction)
+                partial(Prompt, content=instruction)
             )
     
     def _register_danielson_functions(self):
@@ -218,37 +413,103 @@ class DanielsonModel(Model):
         self.add_function("generate_component_evaluation", self.generate_component_evaluation)
         self.add_function("restructure_feedback", self.restructure_component_feedback)
         self.add_function("generate_single_evaluation", self.generate_single_component_evaluation)
+        self.add_function("generate_multi_evaluation", self.generate_multi_component_evaluation)
+        self.add_function("batch_generate_single_evaluation", self.batch_generate_single_component_evaluation)
+    
+    @classmethod
+    def run_on(cls, model: Model, method_name: str, *args, **kwargs) -> Any:
+        """
+        Run a DanielsonModel method with the prompts of another model.
+        
+        Replaces the former model= argument of the Danielson methods, e.g. for a clone holding
+        optimized prompts. A DanielsonModel runs the method itself; any other Model has its
+        prompts wrapped in a DanielsonModel, which is kept for as long as the model lives so
+        repeated calls share its caches.
+        
+        Args:
+            model: The model whose prompts to use.
+            method_name: Name of the method, e.g. "generate_single_component_evaluation".
+            *args: Positional arguments of the method.
+            **kwargs: Keyword arguments of the method.
+            
+        Returns:
+            The method's result, awaitable for the async methods.
+        """
+        if not isinstance(model, cls):
+            danielson = cls._run_on_wrappers.get(model)
+            if danielson is None:
+                danielson = cls(name=model.name, version=model.version, metadata=model.metadata)
+                cls._run_on_wrappers[model] = danielson
+            # Pick up prompts added to or replaced in the model since the last call
+            danielson.prompts.update(model.prompts)
+            model = danielson
+        return getattr(model, method_name)(*args, **kwargs)
     
-    def analyze_danielson_context(self, text: str, model=None) -> Dict[str, Any]:
+    def analyze_danielson_context(self, text: str) -> Dict[str, Any]:
         """
         Preprocess the observation text by analyzing it in the context of the Danielson Framework.
         
         Args:
             text (str): The evaluation notes text
-            model: The model instance (optional, used for function signature compatibility)
             
         Returns:
             Dict: The analysis result and any potential errors
         """
-        if model is None:
-            model = self
-            
-        prompt_template = model.get_prompt("context_analysis").content
-        prompt = prompt_template.format(text=text)
+        context_prompt = self.get_prompt("context_analysis")
+        cache_key = ResponseCache.make_key(context_prompt.content, text, self.context_model_name)
+        cached = self._context_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        prompt = context_prompt.formatter({"text": text})
         
         try:
+            response = _generate_ai_content(prompt, model_name=self.context_model_name)
+            return self._remember_context(cache_key, self._context_result(response))
+        except Exception as e:
+            return {"analysis": "", "error": str(e)}
+    
+    async def aanalyze_danielson_context(self, text: str) -> Dict[str, Any]:
+        """
+        Async counterpart of analyze_danielson_context.
+        
+        Args:
+            text (str): The evaluation notes text
             
-            response = generate_ai_content(prompt)
-            if hasattr(response, 'parts') and response.parts:
-                analysis_text = ''.join(part.text for part in response.parts)
-                return {"analysis": analysis_text, "error": None}
-            else:
-                return {"analysis": "", "error": "No content generated"}
+        Returns:
+            Dict: The analysis result and any potential errors
+        """
+        context_prompt = self.get_prompt("context_analysis")
+        cache_key = ResponseCache.make_key(context_prompt.content, text, self.context_model_name)
+        cached = self._context_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        prompt = context_prompt.formatter({"text": text})
+        
+        try:
+            response = await _agenerate_ai_content(prompt, model_name=self.context_model_name)
+            return self._remember_context(cache_key, self._context_result(response))
         except Exception as e:
             return {"analysis": "", "error": str(e)}
     
+    def _remember_context(self, cache_key: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a successful context analysis; failed analyses are retried on the next call."""
+        if not result["error"]:
+            self._context_cache.set(cache_key, result)
+        return result
+    
+    @staticmethod
+    def _context_result(response) -> Dict[str, Any]:
+        """Turn a context analysis response into its analysis/error dict."""
+        analysis_text = DanielsonModel._extract_text(response)
+        if analysis_text is not None:
+            return {"analysis": analysis_text, "error": None}
+        else:
+            return {"analysis": "", "error": "No content generated"}
+    
     def generate_component_evaluation(self, component_id: str, observation_text: str, 
-                                     context: str, model=None) -> Dict[str, Any]:
+                                     context: str) -> Dict[str, Any]:
         """
         Generate an evaluation for a specific Danielson component.
         
@@ -256,141 +517,469 @@ class DanielsonModel(Model):
             component_id (str): The Danielson component ID.
             observation_text (str): The observation text.
             context (str): Additional contextual analysis.
-            model: The model instance (optional)
             
         Returns:
             Dict[str, Any]: JSON-formatted evaluation with keys 'summary' and 'score'.
         """
-        if model is None:
-            model = self
+        prompt = self._component_evaluation_prompt(component_id, observation_text, context)
+        cache_key, cached = self._score_cache_lookup("component_evaluation", prompt)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = _generate_ai_content(prompt, generation_config=_JSON_GENERATION_CONFIG)
+            result = self._component_evaluation_result(response)
+            return self._score_cache_store(cache_key, result, bool(result.get("summary")))
+        except Exception as e:
+            return {"score": 1, "summary": f"Error: {str(e)}"}
+    
+    async def agenerate_component_evaluation(self, component_id: str, observation_text: str,
+                                             context: str) -> Dict[str, Any]:
+        """
+        Async counterpart of generate_component_evaluation.
+        
+        Args:
+            component_id (str): The Danielson component ID.
+            observation_text (str): The observation text.
+            context (str): Additional contextual analysis.
             
-        # Get the component-specific instruction
-        component_instruction_prompt = model.get_prompt(f"component_instruction_{component_id}")
-        if component_instruction_prompt:
-            specific_instruction = component_instruction_prompt.content
-        else:
-            specific_instruction = "Focus on key evidence directly related to this component."
+        Returns:
+            Dict[str, Any]: JSON-formatted evaluation with keys 'summary' and 'score'.
+        """
+        prompt = self._component_evaluation_prompt(component_id, observation_text, context)
+        cache_key, cached = self._score_cache_lookup("component_evaluation", prompt)
+        if cached is not None:
+            return cached
         
-        # Build the prompt using the base template and specific instruction
-        base_prompt = model.get_prompt("component_evaluation_base").content
-        prompt = base_prompt.format(
-            component_id=component_id,
-            specific_instruction=specific_instruction,
-            context=context,
-            observation_text=observation_text
+        try:
+            response = await _agenerate_ai_content(prompt, generation_config=_JSON_GENERATION_CONFIG)
+            result = self._component_evaluation_result(response)
+            return self._score_cache_store(cache_key, result, bool(result.get("summary")))
+        except Exception as e:
+            return {"score": 1, "summary": f"Error: {str(e)}"}
+    
+    def generate_batched_component_evaluation(self, component_ids: List[str], observation_text: str,
+                                              context: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate evaluations for several Danielson components with a single LLM call.
+        
+        A component missing from the response, or every component if the response cannot be
+        parsed, is evaluated on its own with generate_component_evaluation. If the call itself
+        fails, every component gets the error result generate_component_evaluation would return.
+        
+        Args:
+            component_ids (List[str]): The Danielson component IDs.
+            observation_text (str): The observation text.
+            context (str): Additional contextual analysis.
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Evaluation with keys 'summary' and 'score' for each component ID.
+        """
+        component_list = "\n".join(
+            f"{i}. Component {component_id}: {self._component_instruction(component_id)}"
+            for i, component_id in enumerate(component_ids, 1)
         )
+        prompt = self.get_prompt("component_evaluation_batch").formatter({
+            "component_list": component_list,
+            "context": context,
+            "observation_text": observation_text
+        })
         
         try:
-            import json
-            import google.generativeai as genai
-            
-            response = generate_ai_content(
-                prompt,
-                generation_config=genai.GenerationConfig(
-                    temperature=0,
-                    response_mime_type="application/json"
-                )
-            )
-            
-            if hasattr(response, 'parts') and response.parts:
-                response_text = ''.join(part.text for part in response.parts).strip()
-                result = json.loads(response_text)
-                result["score"] = normalize_score_integer(result.get("score", 1))
-                return result
-            else:
-                return {"score": 1, "summary": ""}
+            response = _generate_ai_content(prompt, generation_config=_BATCH_JSON_GENERATION_CONFIG)
         except Exception as e:
-            return {"score": 1, "summary": f"Error: {str(e)}"}
+            # Separate calls would fail the same way (auth, quota, ...), so they are not attempted
+            logger.warning("Batched evaluation of components %s failed", component_ids, exc_info=True)
+            return {component_id: {"score": 1, "summary": f"Error: {str(e)}"} for component_id in component_ids}
+        
+        evaluations = {}
+        try:
+            response_text = self._extract_text(response)
+            if response_text is not None:
+                parsed = _loads_json(response_text)
+                for entry in parsed.get("evaluations", []):
+                    component_id = entry.get("component_id")
+                    if component_id in component_ids and component_id not in evaluations:
+                        evaluations[component_id] = {
+                            "summary": entry.get("summary", ""),
+                            "score": normalize_score_integer(entry.get("score", 1))
+                        }
+        except (ValueError, TypeError, AttributeError):
+            # Malformed JSON or an unexpected shape; unparsed components are evaluated below
+            logger.warning("Could not parse the batched evaluation of components %s", component_ids, exc_info=True)
+        
+        for component_id in component_ids:
+            if component_id not in evaluations:
+                evaluations[component_id] = self.generate_component_evaluation(
+                    component_id=component_id,
+                    observation_text=observation_text,
+                    context=context
+                )
+        return evaluations
+    
+    def _component_instruction(self, component_id: str) -> str:
+        """Return the model's specific instruction for a component."""
+        component_instruction_prompt = self.get_prompt(f"component_instruction_{component_id}")
+        if component_instruction_prompt:
+            return component_instruction_prompt.content
+        else:
+            return "Focus on key evidence directly related to this component."
+    
+    def _component_evaluation_prompt(self, component_id: str, observation_text: str, context: str) -> str:
+        """Build the evaluation prompt for one component from the model's prompts."""
+        # Build the prompt using the base template and the component-specific instruction
+        return self.get_prompt("component_evaluation_base").formatter({
+            "component_id": component_id,
+            "specific_instruction": self._component_instruction(component_id),
+            "context": context,
+            "observation_text": observation_text
+        })
+    
+    @staticmethod
+    def _component_evaluation_result(response) -> Dict[str, Any]:
+        """Parse a component evaluation response into a dict with a normalized score."""
+        response_text = DanielsonModel._extract_text(response)
+        if response_text is not None:
+            # Surrounding whitespace is valid JSON, so the text is parsed without stripping
+            result = _loads_json(response_text)
+            result["score"] = normalize_score_integer(result.get("score", 1))
+            return result
+        else:
+            return {"score": 1, "summary": ""}
     
     def restructure_component_feedback(self, text: str, evidence: str, 
-                                      component_id: str, model=None) -> str:
+                                      component_id: str) -> str:
         """
         Restructure feedback for a single component using AI.
         
+        Feedback that already has the **Performance Analysis** and **Growth Path** sections
+        is returned unchanged without an LLM call.
+        
         Args:
             text (str): Original feedback text
             evidence (str): Original observation text containing evidence
             component_id (str): Component identifier (e.g., "1a")
-            model: The model instance (optional)
             
         Returns:
             str: Restructured feedback
         """
-        if model is None:
-            model = self
-            
-        # Get the restructure feedback prompt template
-        prompt_template = model.get_prompt("restructure_feedback").content
+        if _ALREADY_STRUCTURED.search(text):
+            return text
         
-        # Format the prompt with the inputs
-        prompt = prompt_template.format(
-            component_id=component_id,
-            text=text,
-            evidence=evidence
-        )
+        prompt = self._restructure_prompt(text, evidence, component_id)
+        cache_key, cached = self._score_cache_lookup("restructure_feedback", prompt)
+        if cached is not None:
+            return cached
         
         try:
+            response = _generate_ai_content(prompt)
+            restructured = self._extract_text(response)
+            if restructured is None:
+                return text  # Return original text if processing fails
+            return self._score_cache_store(cache_key, restructured)
+        except Exception as e:
+            return text  # Return original text if processing fails
+    
+    async def arestructure_component_feedback(self, text: str, evidence: str,
+                                              component_id: str) -> str:
+        """
+        Async counterpart of restructure_component_feedback.
+        
+        Args:
+            text (str): Original feedback text
+            evidence (str): Original observation text containing evidence
+            component_id (str): Component identifier (e.g., "1a")
             
-            response = generate_ai_content(prompt)
-            if hasattr(response, 'parts') and response.parts:
-                return ''.join(part.text for part in response.parts)
-            else:
+        Returns:
+            str: Restructured feedback
+        """
+        if _ALREADY_STRUCTURED.search(text):
+            return text
+        
+        prompt = self._restructure_prompt(text, evidence, component_id)
+        cache_key, cached = self._score_cache_lookup("restructure_feedback", prompt)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = await _agenerate_ai_content(prompt)
+            restructured = self._extract_text(response)
+            if restructured is None:
                 return text  # Return original text if processing fails
+            return self._score_cache_store(cache_key, restructured)
         except Exception as e:
             return text  # Return original text if processing fails
     
+    def _score_cache_lookup(self, kind: str, prompt: str):
+        """
+        Look up a stored result for a fully formatted prompt.
+        
+        Returns:
+            Tuple of the cache key (None when the score cache is disabled) and the cached
+            result, or None on a miss.
+        """
+        if self._score_cache is None:
+            return None, None
+        cache_key = ResponseCache.make_key(kind, prompt)
+        return cache_key, self._score_cache.get(cache_key)
+    
+    def _score_cache_store(self, cache_key: Optional[str], result: Any, cacheable: bool = True) -> Any:
+        """Store a result under cache_key when it is cacheable and the score cache is enabled."""
+        if cache_key is not None and cacheable:
+            self._score_cache.set(cache_key, result)
+        return result
+    
+    def _restructure_prompt(self, text: str, evidence: str, component_id: str) -> str:
+        """Build the feedback restructuring prompt from the model's prompts."""
+        # Format the restructure feedback prompt template with the inputs
+        return self.get_prompt("restructure_feedback").formatter({
+            "component_id": component_id,
+            "text": text,
+            "evidence": evidence
+        })
+    
+    @staticmethod
+    def _extract_text(response) -> Optional[str]:
+        """Return the text of a generate_ai_content response, or None if it has no content."""
+        parts = getattr(response, 'parts', None)
+        return ''.join(part.text for part in parts) if parts else None
+    
     def generate_single_component_evaluation(self, low_inference_notes: str, 
-                                           component_id: str, model=None) -> Dict[str, Any]:
+                                           component_id: str) -> Dict[str, Any]:
         """
         Generate an evaluation for a single Danielson Framework component based on low inference notes.
         
         Args:
             low_inference_notes (str): The observation text/low inference notes
             component_id (str): The Danielson component ID (e.g., "1a", "2c", "3e")
-            model: The model instance (optional)
             
         Returns:
             Dict[str, Any]: Component evaluation with enhanced feedback
         """
-        if model is None:
-            model = self
-            
         # Step 1: Validate component ID format
-        if not (isinstance(component_id, str) and 
-                len(component_id) == 2 and 
-                component_id[0] in "123" and 
-                component_id[1] in "abcdef"):
-            return {"error": f"Invalid component ID: {component_id}. Must be in format like '1a', '2c', '3e'"}
+        invalid = self._component_id_error(component_id)
+        if invalid:
+            return invalid
         
         # Step 2: Generate contextual analysis for better evaluation
-        context_result = model.analyze_danielson_context(low_inference_notes, model)
+        context_result = self.analyze_danielson_context(low_inference_notes)
         
         if context_result.get("error"):
             return {"error": context_result["error"]}
         
         # Step 3: Generate evaluation for the specific component
-        component_eval = model.generate_component_evaluation(
+        component_eval = self.generate_component_evaluation(
             component_id=component_id,
             observation_text=low_inference_notes,
-            context=context_result["analysis"],
-            model=model
+            context=context_result["analysis"]
         )
         
         # Step 4: Enhance the feedback with more detailed, actionable information
-        enhanced_feedback = model.restructure_component_feedback(
+        enhanced_feedback = self.restructure_component_feedback(
             text=component_eval.get("summary", ""),
             evidence=low_inference_notes,
-            component_id=component_id,
-            model=model
+            component_id=component_id
         )
         
         # Step 5: Assemble final component evaluation
+        return self._assemble_component_result(component_id, component_eval, enhanced_feedback)
+    
+    def generate_multi_component_evaluation(self, low_inference_notes: str,
+                                            component_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate evaluations for several Danielson components of the same observation.
         
-        result = {
-            "component_id": component_id,
-            "score": normalize_score_integer(component_eval.get("score", 1)),
-            "summary": enhanced_feedback,
-            "domain": component_id[0],  # Extract domain from component ID (first character)
+        The contextual analysis is generated once and all components are scored with a single
+        batched evaluation call before their feedback is restructured.
+        
+        Args:
+            low_inference_notes (str): The observation text/low inference notes
+            component_ids (List[str]): The Danielson component IDs to evaluate
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Evaluation of each component, keyed by component ID in the
+            order given, each as returned by generate_single_component_evaluation
+        """
+        results, valid_ids = self._partition_component_ids(component_ids)
+        
+        if valid_ids:
+            context_result = self.analyze_danielson_context(low_inference_notes)
+            if context_result.get("error"):
+                results.update((component_id, {"error": context_result["error"]}) for component_id in valid_ids)
+            else:
+                component_evals = self.generate_batched_component_evaluation(
+                    component_ids=valid_ids,
+                    observation_text=low_inference_notes,
+                    context=context_result["analysis"]
+                )
+                for component_id in valid_ids:
+                    enhanced_feedback = self.restructure_component_feedback(
+                        text=component_evals[component_id].get("summary", ""),
+                        evidence=low_inference_notes,
+                        component_id=component_id
+                    )
+                    results[component_id] = self._assemble_component_result(
+                        component_id, component_evals[component_id], enhanced_feedback
+                    )
+        
+        return {component_id: results[component_id] for component_id in component_ids}
+    
+    def batch_generate_single_component_evaluation(self, items: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Score many (low_inference_notes, component_id) pairs for an offline run.
+        
+        Pairs are grouped by observation, so each observation's context is analyzed once and all
+        of its components are scored with a single batched evaluation call.
+        
+        Args:
+            items (List[Tuple[str, str]]): The (low_inference_notes, component_id) pairs to score
+            
+        Returns:
+            List[Dict[str, Any]]: Evaluation of each pair in the order given, each as returned
+            by generate_single_component_evaluation
+        """
+        component_ids_by_notes: Dict[str, List[str]] = {}
+        for low_inference_notes, component_id in items:
+            component_ids_by_notes.setdefault(low_inference_notes, []).append(component_id)
+        
+        evaluations = {
+            low_inference_notes: self.generate_multi_component_evaluation(low_inference_notes, component_ids)
+            for low_inference_notes, component_ids in component_ids_by_notes.items()
         }
+        return [evaluations[low_inference_notes][component_id] for low_inference_notes, component_id in items]
+    
+    async def agenerate_single_component_evaluation(self, low_inference_notes: str,
+                                                    component_id: str) -> Dict[str, Any]:
+        """
+        Async counterpart of generate_single_component_evaluation.
         
-        return result 
\ No newline at end of file
+        Args:
+            low_inference_notes (str): The observation text/low inference notes
+            component_id (str): The Danielson component ID (e.g., "1a", "2c", "3e")
+            
+        Returns:
+            Dict[str, Any]: Component evaluation with enhanced feedback
+        """
+        results = await self.agenerate_component_evaluations(low_inference_notes, [component_id])
+        return results[component_id]
+    
+    async def agenerate_component_evaluations(self, low_inference_notes: str, component_ids: List[str],
+                                              max_concurrency: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        Evaluate several Danielson components of the same observation concurrently.
+        
+        The contextual analysis is shared by every component, so it is generated once; each
+        component's evaluation and feedback restructuring then run concurrently, with at most
+        max_concurrency components in flight.
+        
+        Args:
+            low_inference_notes (str): The observation text/low inference notes
+            component_ids (List[str]): The Danielson component IDs to evaluate
+            max_concurrency (int): Maximum number of components evaluated at once
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Evaluation of each component, keyed by component ID in the
+            order given, each as returned by generate_single_component_evaluation
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        return await self._agenerate_component_evaluations(low_inference_notes, component_ids, semaphore)
+    
+    async def evaluate_dataset(self, notes_list: List[str], component_ids: List[str],
+                               max_concurrency: int = 16) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Evaluate the same Danielson components for every observation of a dataset concurrently.
+        
+        Each distinct observation has its context analyzed once; the evaluations of all
+        (observation, component) pairs then share a single bound of max_concurrency components
+        in flight. An observation whose evaluation raises gets an error for each component
+        instead of failing the whole dataset.
+        
+        Args:
+            notes_list (List[str]): The observation texts/low inference notes
+            component_ids (List[str]): The Danielson component IDs to evaluate for each observation
+            max_concurrency (int): Maximum number of components evaluated at once across the dataset
+            
+        Returns:
+            List[Dict[str, Dict[str, Any]]]: Evaluations of each observation in the order given,
+            each as returned by agenerate_component_evaluations
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        distinct_notes = list(dict.fromkeys(notes_list))
+        outcomes = await asyncio.gather(
+            *(self._agenerate_component_evaluations(notes, component_ids, semaphore)
+              for notes in distinct_notes),
+            return_exceptions=True
+        )
+        
+        evaluations = {}
+        for notes, outcome in zip(distinct_notes, outcomes):
+            if isinstance(outcome, Exception):
+                outcome = {component_id: {"error": str(outcome)} for component_id in component_ids}
+            evaluations[notes] = outcome
+        return [evaluations[notes] for notes in notes_list]
+    
+    async def _agenerate_component_evaluations(self, low_inference_notes: str, component_ids: List[str],
+                                               semaphore: asyncio.Semaphore) -> Dict[str, Dict[str, Any]]:
+        """Evaluate components of one observation, holding a slot of semaphore per component."""
+        results, valid_ids = self._partition_component_ids(component_ids)
+        
+        if valid_ids:
+            context_result = await self.aanalyze_danielson_context(low_inference_notes)
+            if context_result.get("error"):
+                results.update((component_id, {"error": context_result["error"]}) for component_id in valid_ids)
+            else:
+                async def evaluate_component(component_id):
+                    async with semaphore:
+                        component_eval = await self.agenerate_component_evaluation(
+                            component_id=component_id,
+                            observation_text=low_inference_notes,
+                            context=context_result["analysis"]
+                        )
+                        enhanced_feedback = await self.arestructure_component_feedback(
+                            text=component_eval.get("summary", ""),
+                            evidence=low_inference_notes,
+                            component_id=component_id
+                        )
+                    return self._assemble_component_result(component_id, component_eval, enhanced_feedback)
+                
+                evaluations = await asyncio.gather(*(evaluate_component(cid) for cid in valid_ids))
+                results.update(zip(valid_ids, evaluations))
+        
+        return {component_id: results[component_id] for component_id in component_ids}
+    
+    @staticmethod
+    def _component_id_error(component_id: str) -> Optional[Dict[str, Any]]:
+        """Return an error dict if component_id is not a valid Danielson component ID, else None."""
+        if not isinstance(component_id, str) or component_id not in _VALID_COMPONENTS:
+            return {"error": f"Invalid component ID: {component_id}. Must be in format like '1a', '2c', '3e'"}
+        return None
+    
+    @classmethod
+    def _partition_component_ids(cls, component_ids: List[str]):
+        """
+        Split component IDs into errors for the invalid ones and the distinct valid ones.
+        
+        Returns:
+            Tuple of a dict of error dicts keyed by invalid component ID, and the list of
+            distinct valid component IDs in the order given.
+        """
+        errors = {}
+        valid_ids = []
+        for component_id in component_ids:
+            invalid = cls._component_id_error(component_id)
+            if invalid:
+                errors[component_id] = invalid
+            elif component_id not in valid_ids:
+                valid_ids.append(component_id)
+        return errors, valid_ids
+    
+    @staticmethod
+    def _assemble_component_result(component_id: str, component_eval: Dict[str, Any],
+                                   enhanced_feedback: str) -> Dict[str, Any]:
+        """Assemble the final evaluation of one component."""
+        return {
+            "component_id": component_id,
+            "score": component_eval.get("score", 1),  # Already normalized by the evaluation step
+            "summary": enhanced_feedback,
+            "domain": _COMPONENT_TO_DOMAIN[component_id],
+        } 
\ No newline at end of file
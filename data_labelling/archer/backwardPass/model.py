@@ -6,6 +6,7 @@ using AdaLflow. It provides methods for managing prompts, evaluating model perfo
 and integrating with the PromptOptimizer.
 """
 
+from collections.abc import MutableMapping
 from typing import List, Dict, Any, Optional, Union, Callable
 import json
 import copy
@@ -16,6 +17,45 @@ from archer.helpers.prompt import Prompt
 from archer.helpers.llm_call import llm_call
 
 
+class _LazyPrompts(MutableMapping):
+    """
+    Mapping of prompt identifiers to prompts, where a prompt may be registered as a factory.
+    
+    A factory is any callable returning a Prompt; it is called on the first access of its
+    prompt, so models only build the prompts they actually use.
+    """
+    
+    __slots__ = ('_entries',)
+    
+    def __init__(self, prompts=None):
+        self._entries = dict(prompts or {})
+    
+    def __getitem__(self, prompt_id):
+        prompt = self._entries[prompt_id]
+        # Prompts are never callable, so anything callable is a factory still to be built
+        if callable(prompt):
+            prompt = self._entries[prompt_id] = prompt()
+        return prompt
+    
+    def __setitem__(self, prompt_id, prompt):
+        self._entries[prompt_id] = prompt
+    
+    def __delitem__(self, prompt_id):
+        del self._entries[prompt_id]
+    
+    def __contains__(self, prompt_id):
+        return prompt_id in self._entries
+    
+    def __iter__(self):
+        return iter(self._entries)
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self._entries)})"
+
+
 class Model:
     """
     A class representing a trainable prompt-based model.
@@ -26,7 +66,8 @@ class Model:
     
     Attributes:
         name (str): Name of the model for identification.
-        prompts (Dict[str, Prompt]): Dictionary of prompts with their identifiers.
+        prompts (MutableMapping[str, Prompt]): Mapping of prompts with their identifiers; prompts
+            added as factories are built on first access.
         functions (Dict[str, Callable]): Dictionary of functions using the prompts.
         model_type (str): Type of the model (e.g., "generator", "evaluator").
         adalflow_enabled (bool): Whether AdaLflow is enabled for this model.
@@ -55,7 +96,7 @@ class Model:
             metadata: Additional metadata about the model.
         """
         self.name = name
-        self.prompts = prompts or {}
+        self.prompts = _LazyPrompts(prompts)
         self.functions = functions or {}
         self.model_type = model_type
         self.adalflow_enabled = adalflow_enabled
@@ -78,20 +119,21 @@ class Model:
                 param_type=ParameterType.PROMPT
             )
     
-    def add_prompt(self, prompt_id: str, prompt: Prompt) -> None:
+    def add_prompt(self, prompt_id: str, prompt: Union[Prompt, Callable[[], Prompt]]) -> None:
         """
         Add a prompt to the model.
         
         Args:
             prompt_id: Identifier for the prompt.
-            prompt: The Prompt object to add.
+            prompt: The Prompt object to add, or a factory returning it, which is only called
+                    when the prompt is first accessed.
         """
         self.prompts[prompt_id] = prompt
         
         # If AdaLflow is enabled, create a parameter for this prompt
         if self.adalflow_enabled:
             self.adalflow_params[prompt_id] = Parameter(
-                data=prompt.content,
+                data=self.prompts[prompt_id].content,
                 role_desc=f"Prompt '{prompt_id}' in model '{self.name}'",
                 requires_opt=True,
                 param_type=ParameterType.PROMPT
@@ -14,6 +14,18 @@ from functools import partial
 from archer.helpers.llm_call import llm_call
 from archer.helpers.prompt import Prompt
 
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Feedback and score maps are keyed by the prompt's index in the batch, as a string;
+# precompute the keys for typical batch sizes instead of converting on every lookup
+_PROMPT_KEYS = tuple(str(i) for i in range(1024))
+
+
+def prompt_key(index: int) -> str:
+    """Return the feedback/score map key for the prompt at the given batch index."""
+    return _PROMPT_KEYS[index] if index < len(_PROMPT_KEYS) else str(index)
+
 # Check if AdaLFlow is available
 try:
     from adalflow.optim.parameter import Parameter, ParameterType
@@ -257,7 +269,6 @@ class PromptOptimizer:
         Returns:
             List of new Prompt objects (variants).
         """
-        logger = logging.getLogger(__name__)
         variants = []
         traits = variation_traits or self.variation_traits
         
@@ -273,14 +284,14 @@ class PromptOptimizer:
         variant_count = 0
         max_variants = len(base_prompts) * num_variants * 2  # Absolute maximum to prevent runaway generation
         
-        logger.info(f"Generating up to {num_variants} variants for {len(base_prompts)} base prompts")
+        logger.info("Generating up to %d variants for %d base prompts", num_variants, len(base_prompts))
         
         for base_prompt in base_prompts:
             # Limit variants per base prompt
             prompt_variants = 0
             
             if variant_count >= max_variants:
-                logger.warning(f"Reached maximum variant limit ({max_variants}), stopping generation")
+                logger.warning("Reached maximum variant limit (%d), stopping generation", max_variants)
                 break
                 
             for i in range(num_variants):
@@ -300,7 +311,7 @@ class PromptOptimizer:
                         if self.adalflow_enabled and ADALFLOW_AVAILABLE and retry == 0:
                             try:
                                 # Attempt AdaLFlow generation on first try only
-                                logger.debug(f"Attempting AdaLFlow generation for prompt variant {i+1}")
+                                logger.debug("Attempting AdaLFlow generation for prompt variant %d", i+1)
                                 param = Parameter(
                                     data=base_prompt.content,
                                     role_desc=f"Base prompt",
@@ -338,7 +349,7 @@ class PromptOptimizer:
                                     break  # Success, no need for more retries
                                     
                             except Exception as e:
-                                logger.error(f"AdaLFlow variant generation failed: {str(e)}")
+                                logger.error("AdaLFlow variant generation failed: %s", e)
                                 # Fall through to standard approach on failure
                         
                         # Standard LLM approach (fallback or primary if AdaLFlow disabled)
@@ -354,12 +365,12 @@ class PromptOptimizer:
                             variant_count += 1
                             break  # Success, no need for more retries
                         elif retry < max_retries:
-                            logger.warning(f"Variant generation attempt {retry+1}/{max_retries+1} failed, retrying...")
+                            logger.warning("Variant generation attempt %d/%d failed, retrying...", retry+1, max_retries+1)
                         else:
-                            logger.error(f"Failed to generate variant after {max_retries+1} attempts")
+                            logger.error("Failed to generate variant after %d attempts", max_retries+1)
                             
                     except Exception as e:
-                        logger.error(f"Error in variant generation (retry {retry+1}/{max_retries+1}): {str(e)}")
+                        logger.error("Error in variant generation (retry %d/%d): %s", retry+1, max_retries+1, e)
                         if retry == max_retries:
                             logger.error("Exceeded maximum retries, skipping this variant")
                     
@@ -367,7 +378,7 @@ class PromptOptimizer:
                     if retry < max_retries:
                         time.sleep(0.5)
         
-        logger.info(f"Successfully generated {len(variants)} variants")
+        logger.info("Successfully generated %d variants", len(variants))
         return variants
     
     def _generate_variant_with_llm(self, base_prompt, variation_instructions="", temperature_boost=0.0, timeout=30):
@@ -383,7 +394,6 @@ class PromptOptimizer:
         Returns:
             A new Prompt object or None if generation failed.
         """
-        logger = logging.getLogger(__name__)
         try:
             variation_prompt = (
                 f"Create a variation of this prompt that preserves its intent "
@@ -413,7 +423,7 @@ class PromptOptimizer:
                     variant_content = response.get("choices", [{}])[0].get("message", {}).get("content", "")
                     
                     if variant_content:
-                        logger.debug(f"Successfully generated variant (length: {len(variant_content)})")
+                        logger.debug("Successfully generated variant (length: %d)", len(variant_content))
                         variant = Prompt(
                             content=variant_content,
                             score=0.0,
@@ -425,12 +435,12 @@ class PromptOptimizer:
                     return None
                     
                 except concurrent.futures.TimeoutError:
-                    logger.error(f"Timeout ({timeout}s) exceeded while generating variant")
+                    logger.error("Timeout (%ss) exceeded while generating variant", timeout)
                     future.cancel()  # Attempt to cancel the future
                     return None
                     
         except Exception as e:
-            logger.error(f"Error generating variant: {str(e)}")
+            logger.error("Error generating variant: %s", e)
             return None
     
     def _wrap_prompts_as_params(self, prompt_list):
@@ -471,11 +481,10 @@ class PromptOptimizer:
         Returns:
             List[Prompt]: The optimized prompt objects, or the original prompts if optimization fails.
         """
-        logger = logging.getLogger(__name__)
-        logger.info(f"Starting backward pass optimization for {len(prompt_objs)} prompts")
-        logger.debug(f"Feedback map: {feedback_map}")
-        logger.debug(f"Score map: {score_map}")
-        logger.info(f"AdaLFlow enabled: {self.adalflow_enabled}")
+        logger.info("Starting backward pass optimization for %d prompts", len(prompt_objs))
+        logger.debug("Feedback map: %s", feedback_map)
+        logger.debug("Score map: %s", score_map)
+        logger.info("AdaLFlow enabled: %s", self.adalflow_enabled)
         
         # If no prompts, return empty list
         if not prompt_objs:
@@ -493,10 +502,10 @@ class PromptOptimizer:
                     version=prompt.generation
                 )
                 if db_prompt_id:
-                    prompt_db_ids[str(i)] = db_prompt_id
-                    logger.info(f"Prompt {i} stored/retrieved from database with ID: {db_prompt_id}")
+                    prompt_db_ids[i] = db_prompt_id
+                    logger.info("Prompt %d stored/retrieved from database with ID: %s", i, db_prompt_id)
                 else:
-                    logger.warning(f"Failed to store/retrieve prompt {i} in database")
+                    logger.warning("Failed to store/retrieve prompt %d in database", i)
         
         # If AdaLFlow is enabled, use it for optimization
         if self.adalflow_enabled and ADALFLOW_AVAILABLE:
@@ -505,17 +514,17 @@ class PromptOptimizer:
                 # Step 1: Wrap Prompts as AdaLFlow Parameters
                 logger.info("Step 1: Wrapping prompts as AdaLFlow parameters")
                 parameters = self._wrap_prompts_as_params(prompt_objs)
-                logger.debug(f"Created {len(parameters)} AdaLFlow parameters")
+                logger.debug("Created %d AdaLFlow parameters", len(parameters))
                 
                 # Step 2: Attach gradients (feedback and score)
                 logger.info("Step 2: Attaching gradients to parameters")
                 for i, param in enumerate(parameters):
-                    pid = str(i)
+                    pid = prompt_key(i)
                     feedback = feedback_map.get(pid, "")
                     score = score_map.get(pid, 0.0)
                     magnitude = self._calculate_gradient_magnitude(score)
                     
-                    logger.debug(f"Parameter {i}: score={score}, magnitude={magnitude}")
+                    logger.debug("Parameter %d: score=%s, magnitude=%s", i, score, magnitude)
                     
                     param.add_gradient({
                         "score": score,
@@ -528,11 +537,11 @@ class PromptOptimizer:
                 logger.info("Step 3: Running backward pass")
                 for param in parameters:
                     try:
-                        logger.debug(f"Running backward() on parameter: {param.role_desc}")
+                        logger.debug("Running backward() on parameter: %s", param.role_desc)
                         param.backward()  # Triggers LLM to analyze feedback
-                        logger.debug(f"Backward pass successful for parameter: {param.role_desc}")
+                        logger.debug("Backward pass successful for parameter: %s", param.role_desc)
                     except Exception as e:
-                        logger.error(f"Error in backward() for parameter {param.role_desc}: {str(e)}")
+                        logger.error("Error in backward() for parameter %s: %s", param.role_desc, e)
                         # Continue with other parameters even if one fails
                 
                 # Step 4: Run Optimizer (TGD) to generate new prompt variants
@@ -546,7 +555,7 @@ class PromptOptimizer:
                     self.optimizer.step()     # Finalize new values
                     logger.info("Optimizer completed successfully")
                 except Exception as e:
-                    logger.error(f"Error in optimizer: {str(e)}")
+                    logger.error("Error in optimizer: %s", e)
                     logger.warning("Falling back to standard optimization")
                     return self._fallback_optimize(prompt_objs, feedback_map, score_map, database=database)
                 
@@ -555,14 +564,15 @@ class PromptOptimizer:
                 new_prompts = []
                 for i, param in enumerate(parameters):
                     original_prompt = prompt_objs[i]
-                    logger.debug(f"Creating new prompt from parameter {i}")
-                    logger.debug(f"Original content: {original_prompt.content[:50]}...")
-                    logger.debug(f"New content: {param.data[:50]}...")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Creating new prompt from parameter %d", i)
+                        logger.debug("Original content: %s...", original_prompt.content[:50])
+                        logger.debug("New content: %s...", param.data[:50])
                     
                     prompt = Prompt(
                         content=param.data,
-                        score=score_map.get(str(i), 0.0),
-                        feedback_or_generation=feedback_map.get(str(i), ""),
+                        score=score_map.get(prompt_key(i), 0.0),
+                        feedback_or_generation=feedback_map.get(prompt_key(i), ""),
                         generation=original_prompt.generation + 1
                     )
                     new_prompts.append(prompt)
@@ -575,7 +585,7 @@ class PromptOptimizer:
                         variation_traits=self.variation_traits,
                         num_variants=2  # Create 2 additional variants per optimized prompt
                     )
-                    logger.info(f"Generated {len(variants)} additional variants")
+                    logger.info("Generated %d additional variants", len(variants))
                     new_prompts.extend(variants)
                     
                     # Save all prompts to database if available
@@ -583,25 +593,25 @@ class PromptOptimizer:
                         for i, prompt in enumerate(new_prompts):
                             # Determine parent ID from the mapping
                             original_idx = i % len(prompt_objs)  # Map back to original prompt index
-                            parent_id = prompt_db_ids.get(str(original_idx))
+                            parent_id = prompt_db_ids.get(original_idx)
                             
                             # Store in database
                             if i < len(prompt_objs):  # This is a direct optimization
                                 self.save_variants_to_database([prompt], database, parent_prompt_id=parent_id)
                             else:  # This is a variant
                                 parent_idx = (i - len(prompt_objs)) % len(prompt_objs)
-                                parent_id = prompt_db_ids.get(str(parent_idx))
+                                parent_id = prompt_db_ids.get(parent_idx)
                                 self.save_variants_to_database([prompt], database, parent_prompt_id=parent_id)
                     
                     # The variation is complete - stop the optimization process here
                     logger.info("Optimization and variation completed - stopping optimization process")
                 except Exception as e:
-                    logger.error(f"Error generating variants: {str(e)}")
+                    logger.error("Error generating variants: %s", e)
                 
                 return new_prompts
                 
             except Exception as e:
-                logger.error(f"Error in AdaLFlow optimization: {str(e)}")
+                logger.error("Error in AdaLFlow optimization: %s", e)
                 logger.warning("Falling back to standard optimization")
                 # Fallback to standard optimization if AdaLFlow fails
                 return self._fallback_optimize(prompt_objs, feedback_map, score_map, database=database)
@@ -624,8 +634,7 @@ class PromptOptimizer:
         Returns:
             List[Prompt]: The optimized prompt objects.
         """
-        logger = logging.getLogger(__name__)
-        logger.info(f"Using fallback optimization for {len(prompt_objs)} prompts")
+        logger.info("Using fallback optimization for %d prompts", len(prompt_objs))
         
         # Ensure all prompts are in the database before optimization
         prompt_db_ids = {}
@@ -638,14 +647,14 @@ class PromptOptimizer:
                     version=prompt.generation
                 )
                 if db_prompt_id:
-                    prompt_db_ids[str(i)] = db_prompt_id
-                    logger.info(f"Prompt {i} stored/retrieved from database with ID: {db_prompt_id}")
+                    prompt_db_ids[i] = db_prompt_id
+                    logger.info("Prompt %d stored/retrieved from database with ID: %s", i, db_prompt_id)
                 else:
-                    logger.warning(f"Failed to store/retrieve prompt {i} in database")
+                    logger.warning("Failed to store/retrieve prompt %d in database", i)
         
         # Safety check - don't optimize too many prompts at once
         if len(prompt_objs) > 10:
-            logger.warning(f"Large number of prompts ({len(prompt_objs)}) to optimize, limiting to first 10")
+            logger.warning("Large number of prompts (%d) to optimize, limiting to first 10", len(prompt_objs))
             prompt_objs = prompt_objs[:10]
         
         new_prompts = []
@@ -654,11 +663,11 @@ class PromptOptimizer:
         
         for i, prompt in enumerate(prompt_objs):
             try:
-                pid = str(i)
+                pid = prompt_key(i)
                 feedback = feedback_map.get(pid, "")
                 score = score_map.get(pid, 0.0)
                 
-                logger.debug(f"Optimizing prompt {i}: score={score}")
+                logger.debug("Optimizing prompt %d: score=%s", i, score)
                 
                 # Optimize the prompt with timeout protection
                 start_time = time.time()
@@ -672,7 +681,7 @@ class PromptOptimizer:
                         # Wait for the future to complete with a timeout
                         improved_content = future.result(timeout=60)
                         execution_time = time.time() - start_time
-                        logger.debug(f"Optimization completed in {execution_time:.2f} seconds")
+                        logger.debug("Optimization completed in %.2f seconds", execution_time)
                         
                     except concurrent.futures.TimeoutError:
                         logger.error("Timeout exceeded while optimizing prompt, using original content")
@@ -680,8 +689,9 @@ class PromptOptimizer:
                         improved_content = prompt.content
                         optimization_errors += 1
                 
-                logger.debug(f"Original content: {prompt.content[:50]}...")
-                logger.debug(f"Improved content: {improved_content[:50]}...")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Original content: %s...", prompt.content[:50])
+                    logger.debug("Improved content: %s...", improved_content[:50])
                 
                 # Create a new prompt with the improved content
                 new_prompt = Prompt(
@@ -695,17 +705,17 @@ class PromptOptimizer:
                 
                 # Save the optimized prompt to database
                 if database and hasattr(database, 'store_generator_prompt'):
-                    parent_id = prompt_db_ids.get(pid)
+                    parent_id = prompt_db_ids.get(i)
                     if parent_id:
                         prompt_id = database.store_generator_prompt(
                             content=improved_content,
                             parent_prompt_id=parent_id,
                             version=prompt.generation + 1
                         )
-                        logger.info(f"Saved optimized prompt {i} with ID: {prompt_id}")
+                        logger.info("Saved optimized prompt %d with ID: %s", i, prompt_id)
                 
             except Exception as e:
-                logger.error(f"Error optimizing prompt {i}: {str(e)}")
+                logger.error("Error optimizing prompt %d: %s", i, e)
                 optimization_errors += 1
                 
                 # Use the original prompt as a fallback
@@ -720,12 +730,12 @@ class PromptOptimizer:
         # Calculate safe variant count - reduce if we had errors
         if optimization_errors > 0:
             safe_variant_count = max(1, min(2, variant_limit - optimization_errors))
-            logger.warning(f"Reducing variant count to {safe_variant_count} due to {optimization_errors} optimization errors")
+            logger.warning("Reducing variant count to %d due to %d optimization errors", safe_variant_count, optimization_errors)
         else:
             safe_variant_count = min(variant_limit, 2)
         
         # Generate variants with a timeout
-        logger.info(f"Generating variants (max {safe_variant_count}) for fallback optimization")
+        logger.info("Generating variants (max %d) for fallback optimization", safe_variant_count)
         try:
             start_time = time.time()
             with concurrent.futures.ThreadPoolExecutor() as executor:
@@ -740,14 +750,14 @@ class PromptOptimizer:
                     # Wait for the future to complete with a timeout
                     variants = future.result(timeout=120)  # 2 minute timeout for the entire variant generation
                     generation_time = time.time() - start_time
-                    logger.info(f"Generated {len(variants)} variants in {generation_time:.2f} seconds")
+                    logger.info("Generated %d variants in %.2f seconds", len(variants), generation_time)
                     
                     # Save variants to database
                     if database and hasattr(database, 'store_generator_prompt'):
                         for j, new_prompt in enumerate(new_prompts):
                             # Find original prompt index
                             orig_idx = j % len(prompt_objs)
-                            parent_db_id = prompt_db_ids.get(str(orig_idx))
+                            parent_db_id = prompt_db_ids.get(orig_idx)
                             
                             # Get variants related to this prompt
                             prompt_variants = []
@@ -771,7 +781,7 @@ class PromptOptimizer:
                     future.cancel()
             
         except Exception as e:
-            logger.error(f"Error generating variants in fallback: {str(e)}")
+            logger.error("Error generating variants in fallback: %s", e)
         
         # Final safety check - make sure we return something
         if not new_prompts and prompt_objs:
@@ -840,10 +850,9 @@ class PromptOptimizer:
         Returns:
             bool: True if successful, False otherwise.
         """
-        logger = logging.getLogger(__name__)
         logger.info(f"Starting model optimization for {model.name}")
-        logger.debug(f"Feedback map: {feedback_map}")
-        logger.debug(f"Score map: {score_map}")
+        logger.debug("Feedback map: %s", feedback_map)
+        logger.debug("Score map: %s", score_map)
         logger.info(f"AdaLFlow enabled: {self.adalflow_enabled}")
         
         if not model.adalflow_enabled:
@@ -864,7 +873,7 @@ class PromptOptimizer:
                 score = score_map.get(prompt_id, 0.0)
                 magnitude = self._calculate_gradient_magnitude(score)
                 
-                logger.debug(f"Parameter {prompt_id}: score={score}, magnitude={magnitude}")
+                logger.debug("Parameter %s: score=%s, magnitude=%s", prompt_id, score, magnitude)
                 
                 param.add_gradient({
                     "score": score,
@@ -877,9 +886,9 @@ class PromptOptimizer:
             logger.info("Step 2: Running backward pass on model parameters")
             for prompt_id, param in model.adalflow_params.items():
                 try:
-                    logger.debug(f"Running backward() on parameter {prompt_id}")
+                    logger.debug("Running backward() on parameter %s", prompt_id)
                     param.backward()
-                    logger.debug(f"Backward pass successful for parameter {prompt_id}")
+                    logger.debug("Backward pass successful for parameter %s", prompt_id)
                 except Exception as e:
                     logger.error(f"Error in backward() for parameter {prompt_id}: {str(e)}")
                     # Continue with other parameters even if one fails
@@ -909,9 +918,10 @@ class PromptOptimizer:
                         score = score_map.get(prompt_id, 0.0)
                         feedback = feedback_map.get(prompt_id, "")
                         
-                        logger.debug(f"Updating prompt {prompt_id}")
-                        logger.debug(f"Old content: {old_content[:50]}...")
-                        logger.debug(f"New content: {new_content[:50]}...")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Updating prompt %s", prompt_id)
+                            logger.debug("Old content: %s...", old_content[:50])
+                            logger.debug("New content: %s...", new_content[:50])
                         
                         model.update_prompt(
                             prompt_id=prompt_id,
@@ -947,7 +957,6 @@ class PromptOptimizer:
         Returns:
             List of best performing Prompt objects after optimization and evaluation.
         """
-        logger = logging.getLogger(__name__)
         
         # Step 0: Ensure all prompts being optimized are in the database
         if database and hasattr(database, 'store_generator_prompt'):
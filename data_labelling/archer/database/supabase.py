@@ -383,6 +383,90 @@ class SupabaseDatabase:
         """
         return self.store_evaluation(output_id, score, feedback, improved_output, is_human=True)
 
+    def store_human_feedback_bulk(self, output_ids, scores, feedbacks, improved_outputs) -> bool:
+        """
+        Store human feedback for many outputs with a single output lookup and a single insert.
+
+        Outputs that are missing or have no prompt_id are routed through store_human_feedback
+        so they get the same prompt repair logic as single-record writes. If the batch insert
+        fails, its rows are retried one at a time.
+
+        Args:
+            output_ids: Sequence of output IDs being evaluated
+            scores: Sequence of integer scores, aligned with output_ids
+            feedbacks: Sequence of feedback texts, aligned with output_ids
+            improved_outputs: Sequence of improved outputs, aligned with output_ids
+
+        Returns:
+            bool: True if every record was stored, False otherwise
+        """
+        try:
+            records = list(zip(output_ids, scores, feedbacks, improved_outputs))
+            if not records:
+                return True
+
+            success, data = self._safe_execute(
+                self.client.table("archer_outputs").select("*").in_("id", [str(r[0]) for r in records]),
+                "fetching outputs for bulk feedback"
+            )
+            if not success:
+                return False
+            outputs = {str(o.get("id")): o for o in (data or [])}
+
+            now = datetime.now().isoformat()
+            rows = []
+            fallback = []
+            for output_id, score, feedback, improved_output in records:
+                output = outputs.get(str(output_id))
+                if not output or not output.get("prompt_id"):
+                    fallback.append((output_id, score, feedback, improved_output))
+                    continue
+                rows.append({
+                    "id": str(uuid.uuid4()),
+                    "input": output.get("input_data", ""),
+                    "generated_content": output.get("generated_content", ""),
+                    "evaluation_content": "",
+                    "score": int(score),
+                    "feedback": feedback,
+                    "improved_output": improved_output,
+                    "output_id": output_id,
+                    "prompt_id": output.get("prompt_id"),
+                    "evaluator_id": "human",
+                    "is_human": True,
+                    "timestamp": now,
+                    "created_at": now
+                })
+
+            all_stored = True
+            if rows:
+                success, _ = self._safe_execute(
+                    self.client.table("archer_evaluations").insert(rows),
+                    "storing bulk evaluations"
+                )
+                if success:
+                    logger.info(f"Stored {len(rows)} human evaluations in one batch")
+                else:
+                    # The batch insert is all-or-nothing, so retry each row on its own
+                    logger.warning(f"Bulk insert of {len(rows)} evaluations failed, retrying per record")
+                    for row in rows:
+                        row_success, _ = self._safe_execute(
+                            self.client.table("archer_evaluations").insert(row),
+                            "storing evaluation"
+                        )
+                        if not row_success:
+                            logger.warning(f"Failed to save feedback for output {row['output_id']}")
+                            all_stored = False
+
+            for output_id, score, feedback, improved_output in fallback:
+                if not self.store_human_feedback(output_id, score, feedback, improved_output):
+                    logger.warning(f"Failed to save feedback for output {output_id}")
+                    all_stored = False
+
+            return all_stored
+        except Exception as e:
+            logger.error(f"Exception in store_human_feedback_bulk: {str(e)}")
+            return False
+
     def store_prompt(self, content: str, prompt_type: str, parent_prompt_id: Optional[str] = None, version: int = 1) -> Optional[str]:
         """
         Store a prompt (either generator or evaluator) in the consolidated archer_prompts table.
@@ -839,6 +923,52 @@ class SupabaseDatabase:
             logger.error(f"Exception in store_record: {str(e)}")
             return None
 
+    def store_records_bulk(self, records: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Store several records in the archer_records table with a single insert.
+        
+        Args:
+            records: Dicts with the keyword arguments of store_record (input_data, content,
+                     generator_prompt_id, evaluator_prompt_id, prompt_generation, round_id)
+            
+        Returns:
+            The record IDs in input order, or a list of None if the insert failed
+        """
+        if not records:
+            return []
+        
+        try:
+            now = datetime.now().isoformat()
+            rows = [
+                {
+                    "id": str(uuid.uuid4()),
+                    "input": record["input_data"],
+                    "generated_content": record["content"],
+                    "generator_prompt_id": record["generator_prompt_id"],
+                    "evaluator_prompt_id": record["evaluator_prompt_id"],
+                    "prompt_generation": record["prompt_generation"],
+                    "round_id": record["round_id"],
+                    "validated_status": False,
+                    "created_at": now,
+                    "updated_at": now
+                }
+                for record in records
+            ]
+            
+            success, _ = self._safe_execute(
+                self.client.table("archer_records").insert(rows),
+                "storing records in bulk"
+            )
+            
+            if not success:
+                return [None] * len(records)
+                
+            logger.info(f"Stored {len(rows)} records in bulk")
+            return [row["id"] for row in rows]
+        except Exception as e:
+            logger.error(f"Exception in store_records_bulk: {str(e)}")
+            return [None] * len(records)
+
     def update_record_evaluation(self, record_id: str, ai_score: float, ai_feedback: str, ai_improved_output: str) -> bool:
         """
         Update a record with AI evaluation data.
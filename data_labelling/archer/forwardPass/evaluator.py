@@ -2,8 +2,9 @@
 This module defines the AIExpert class for evaluating generated content.
 """
 
-from typing import List, Dict, Any
-from archer.helpers.llm_call import llm_call
+from typing import List, Dict, Any, Tuple
+from archer.helpers.llm_call import llm_call, allm_call
+import json
 import os
 class AIExpert:
     """
@@ -29,6 +30,7 @@ class AIExpert:
         self.knowledge_base = knowledge_base
         self.rubric = rubric
         self.llm_call = llm_call
+        self.allm_call = allm_call
         self.current_prompt = ""
         self._set_default_prompt()
     
@@ -80,55 +82,185 @@ class AIExpert:
         Returns:
             dict: Evaluation results with keys like 'score', 'feedback', etc.
         """
-        # Replace placeholders in the current prompt
-        eval_prompt = self.current_prompt.replace("{input_placeholder}", str(input_data))
-        eval_prompt = eval_prompt.replace("{content_placeholder}", generated_content)
-        
-        # Use the centralized llm_call function
-        messages = [{"role": "user", "content": eval_prompt}]
+        messages = self._build_messages(generated_content, input_data)
         
         try:
             # Mock API key for testing purposes
             response = self.llm_call(messages=messages, model=self.model_name, openrouter_api_key=os.getenv("OPENROUTER_API_KEY"))
+            parsed = self._parse_response(response)
+            if parsed is not None:
+                return parsed
+        except Exception as e:
+            print(f"Error in evaluation: {e}")
+        
+        return self._fallback_result()
+
+    async def aevaluate(self, generated_content, input_data):
+        """
+        Async counterpart of evaluate, awaiting the LLM call instead of blocking a thread.
+        
+        Args:
+            generated_content (str): The content to evaluate.
+            input_data: The original input data.
             
-            # Parse the response
-            if response and "choices" in response and len(response["choices"]) > 0:
-                content = response["choices"][0]["message"]["content"]
-                
-                # Parse content to extract structured data
-                lines = content.strip().split('\n')
-                score = 3.0  # Default score
-                feedback = "No feedback provided"
-                improved_output = "No improved output provided"
-                summary = "No summary provided"
-                
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith("Score:"):
-                        try:
-                            score = float(line.replace("Score:", "").strip())
-                        except:
-                            pass
-                    elif line.startswith("Feedback:"):
-                        feedback = line.replace("Feedback:", "").strip()
-                    elif line.startswith("Improved Output:"):
-                        improved_output = line.replace("Improved Output:", "").strip()
-                    elif line.startswith("Summary:"):
-                        summary = line.replace("Summary:", "").strip()
-                
-                return {
-                    'score': score,
-                    'feedback': feedback,
-                    'improved_output': improved_output,
-                    'summary': summary
-                }
+        Returns:
+            dict: Evaluation results with keys like 'score', 'feedback', etc.
+        """
+        messages = self._build_messages(generated_content, input_data)
+        
+        try:
+            response = await self.allm_call(messages=messages, model=self.model_name, openrouter_api_key=os.getenv("OPENROUTER_API_KEY"))
+            parsed = self._parse_response(response)
+            if parsed is not None:
+                return parsed
         except Exception as e:
             print(f"Error in evaluation: {e}")
         
-        # Fallback if parsing fails or an exception occurs
+        return self._fallback_result()
+
+    def _build_messages(self, generated_content, input_data):
+        """
+        Fill the current evaluator prompt for one generation.
+        
+        Args:
+            generated_content (str): The content to evaluate.
+            input_data: The original input data.
+            
+        Returns:
+            list: Messages for the centralized llm_call function.
+        """
+        # Replace placeholders in the current prompt
+        eval_prompt = self.current_prompt.replace("{input_placeholder}", str(input_data))
+        eval_prompt = eval_prompt.replace("{content_placeholder}", generated_content)
+        
+        return [{"role": "user", "content": eval_prompt}]
+
+    def _parse_response(self, response):
+        """
+        Parse an LLM response into an evaluation dict.
+        
+        Args:
+            response (dict): Response in the llm_call format.
+            
+        Returns:
+            dict or None: Evaluation results, or None if the response has no content.
+        """
+        if not (response and "choices" in response and len(response["choices"]) > 0):
+            return None
+        content = response["choices"][0]["message"]["content"]
+        
+        # Parse content to extract structured data
+        lines = content.strip().split('\n')
+        score = 3.0  # Default score
+        feedback = "No feedback provided"
+        improved_output = "No improved output provided"
+        summary = "No summary provided"
+        
+        for line in lines:
+            line = line.strip()
+            if line.startswith("Score:"):
+                try:
+                    score = float(line.replace("Score:", "").strip())
+                except:
+                    pass
+            elif line.startswith("Feedback:"):
+                feedback = line.replace("Feedback:", "").strip()
+            elif line.startswith("Improved Output:"):
+                improved_output = line.replace("Improved Output:", "").strip()
+            elif line.startswith("Summary:"):
+                summary = line.replace("Summary:", "").strip()
+        
+        return {
+            'score': score,
+            'feedback': feedback,
+            'improved_output': improved_output,
+            'summary': summary
+        }
+
+    def _fallback_result(self):
+        """Result returned when parsing fails or an exception occurs."""
         return {
             'score': 3.0,
             'feedback': "Error obtaining detailed feedback",
             'improved_output': "Error obtaining improved output example",
             'summary': "Error obtaining evaluation summary"
-        } 
\ No newline at end of file
+        }
+
+    def evaluate_batch(self, items: List[Tuple[str, Any]], batch_size: int = 4) -> List[Dict[str, Any]]:
+        """
+        Evaluate several generations with one LLM call per chunk of items.
+        
+        Each chunk is sent as a single prompt, built from the current evaluator prompt,
+        listing the numbered generations and asking for a JSON array of
+        evaluations. A chunk whose response cannot be parsed into exactly one
+        evaluation per item falls back to evaluate() for each of its items.
+        
+        Args:
+            items (list): (generated_content, input_data) pairs to evaluate.
+            batch_size (int): Maximum number of items per LLM call.
+            
+        Returns:
+            list: One evaluation dict per item, in the order of items.
+        """
+        results = []
+        for start in range(0, len(items), max(1, batch_size)):
+            chunk = items[start:start + max(1, batch_size)]
+            batch_results = self._evaluate_chunk(chunk) if len(chunk) > 1 else None
+            if batch_results is None:
+                batch_results = [self.evaluate(content, input_data) for content, input_data in chunk]
+            results.extend(batch_results)
+        return results
+    
+    def _evaluate_chunk(self, chunk):
+        """
+        Evaluate a chunk of items in a single LLM call.
+        
+        Args:
+            chunk (list): (generated_content, input_data) pairs.
+            
+        Returns:
+            list or None: One evaluation dict per item, or None if the response was unusable.
+        """
+        numbered = "\n\n".join(
+            f"### Generation {i + 1}\nInput data: {input_data}\nGenerated content: {content}"
+            for i, (content, input_data) in enumerate(chunk)
+        )
+        # Keep the instructions of the current (possibly optimized) evaluator prompt, pointing
+        # its placeholders at the numbered generations
+        instructions = self.current_prompt.replace("{input_placeholder}", "the input data of each generation below")
+        instructions = instructions.replace("{content_placeholder}", "the generated content of each generation below")
+        batch_prompt = f"""
+        {instructions.strip()}
+        
+        Evaluate each of the following {len(chunk)} generations separately, following the instructions above.
+        
+        {numbered}
+        
+        Return only a JSON array of {len(chunk)} objects, in the same order as the generations,
+        each with the keys "score" (1-5), "feedback", "improved_output" and "summary".
+        """
+        messages = [{"role": "user", "content": batch_prompt}]
+        
+        try:
+            response = self.llm_call(messages=messages, model=self.model_name, openrouter_api_key=os.getenv("OPENROUTER_API_KEY"))
+            if not (response and "choices" in response and len(response["choices"]) > 0):
+                return None
+            content = response["choices"][0]["message"]["content"]
+            
+            # Tolerate prose or code fences around the array
+            parsed = json.loads(content[content.index("["):content.rindex("]") + 1])
+            if not isinstance(parsed, list) or len(parsed) != len(chunk):
+                return None
+            
+            return [
+                {
+                    'score': float(entry.get('score', 3.0)),
+                    'feedback': entry.get('feedback', "No feedback provided"),
+                    'improved_output': entry.get('improved_output', "No improved output provided"),
+                    'summary': entry.get('summary', "No summary provided")
+                }
+                for entry in parsed
+            ]
+        except Exception as e:
+            print(f"Error in batch evaluation, falling back to single evaluations: {e}")
+            return None
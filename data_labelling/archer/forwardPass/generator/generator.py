@@ -2,7 +2,12 @@
 This module defines the GenerativeModel class for generating content using LLMs.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+
 from archer.helpers.llm_call import llm_call as default_llm_call
+from archer.helpers.llm_call import allm_call as default_allm_call
 
 class GenerativeModel:
     """
@@ -24,7 +29,8 @@ class GenerativeModel:
             temperature (float, optional): Temperature setting for generation.
             top_p (float, optional): Top-p setting for generation.
             generation_func (callable, optional): Custom generation function.
-            llm_call (callable, optional): Custom LLM call function.
+            llm_call (callable, optional): Custom LLM call function. A synchronous custom
+                function is run on a worker thread by the async methods.
         """
         self.model_name = model_name
         self.temperature = temperature
@@ -100,4 +106,119 @@ class GenerativeModel:
                 
             results.append((generated_content, prompt))
         
-        return results 
\ No newline at end of file
+        return results 
+
+    def generate_batch(self, inputs, max_workers=8):
+        """
+        Generate content for several inputs at once.
+        
+        Every (input, prompt) pair is dispatched to a shared thread pool, so generations for
+        different prompts run concurrently as well as those for different inputs.
+        
+        Args:
+            inputs (list): The input data items to feed into the generation process.
+            max_workers (int, optional): Maximum number of concurrent generations.
+            
+        Returns:
+            list: One list of (generated_content, prompt) tuples per input, in input order.
+        """
+        inputs = list(inputs)
+        prompts = list(self.active_prompts)
+        if not prompts:
+            return [[] for _ in inputs]
+        
+        generate_one = self.generation_func if self.generation_func else self._call_llm
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            contents = list(executor.map(
+                lambda pair: generate_one(pair[1].content, pair[0]), product(inputs, prompts)
+            ))
+        
+        width = len(prompts)
+        return [list(zip(contents[i * width:(i + 1) * width], prompts)) for i in range(len(inputs))]
+
+    async def _acall_llm(self, prompt, input_data):
+        """
+        Async counterpart of _call_llm.
+        
+        Args:
+            prompt (str): The prompt content to use.
+            input_data (str): The input data to process.
+            
+        Returns:
+            str: The generated content or error message.
+        """
+        if self.llm_call:
+            # Custom call functions are synchronous; keep them off the event loop
+            return await asyncio.to_thread(self._call_llm, prompt, input_data)
+        
+        try:
+            response = await default_allm_call(
+                messages=[
+                    {"role": "system", "content": prompt},
+                    {"role": "user", "content": input_data}
+                ],
+                model=self.model_name,
+                temperature=self.temperature
+            )
+            
+            # Extract content from the response
+            if "choices" in response and len(response["choices"]) > 0:
+                return response["choices"][0]["message"]["content"]
+            else:
+                return "Error: No response generated"
+        except Exception as e:
+            return f"Error: {str(e)}"
+    
+    async def agenerate(self, input_data):
+        """
+        Async counterpart of generate; all active prompts are generated concurrently.
+        
+        Args:
+            input_data: The input data to feed into the generation process.
+            
+        Returns:
+            list: A list of tuples (generated_content, prompt).
+        """
+        if not self.active_prompts:
+            return []
+        
+        prompts = list(self.active_prompts)
+        if self.generation_func:
+            contents = await asyncio.gather(*(
+                asyncio.to_thread(self.generation_func, prompt.content, input_data) for prompt in prompts
+            ))
+        else:
+            contents = await asyncio.gather(*(self._acall_llm(prompt.content, input_data) for prompt in prompts))
+        
+        return list(zip(contents, prompts))
+
+    async def agenerate_batch(self, inputs, max_concurrency=48):
+        """
+        Async counterpart of generate_batch, bounding in-flight generations with a semaphore.
+        
+        Args:
+            inputs (list): The input data items to feed into the generation process.
+            max_concurrency (int, optional): Maximum number of concurrent generations.
+            
+        Returns:
+            list: One list of (generated_content, prompt) tuples per input, in input order.
+        """
+        inputs = list(inputs)
+        prompts = list(self.active_prompts)
+        if not prompts:
+            return [[] for _ in inputs]
+        
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def generate_one(input_data, prompt):
+            async with semaphore:
+                if self.generation_func:
+                    return await asyncio.to_thread(self.generation_func, prompt.content, input_data)
+                return await self._acall_llm(prompt.content, input_data)
+        
+        contents = await asyncio.gather(*(
+            generate_one(input_data, prompt) for input_data, prompt in product(inputs, prompts)
+        ))
+        
+        width = len(prompts)
+        return [list(zip(contents[i * width:(i + 1) * width], prompts)) for i in range(len(inputs))]
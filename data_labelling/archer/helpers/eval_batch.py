@@ -0,0 +1,86 @@
+"""
+This module defines the EvalBatch class holding forward-pass evaluations column-wise.
+"""
+from collections.abc import Sequence
+
+import numpy as np
+
+
+def _as_score(value):
+    """Convert an evaluation score to float, treating missing or malformed scores as 0."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class EvalBatch(Sequence):
+    """
+    Structure-of-arrays view of forward-pass evaluations.
+
+    Each column is aligned by row. Indexing or iterating yields
+    (prompt, generated_text, evaluation) tuples, so an EvalBatch can be used
+    wherever a list of evaluation tuples was expected.
+
+    Attributes:
+        prompts (list): The Prompt used for each row.
+        texts (list): The generated content for each row.
+        results (list): The evaluation dict for each row.
+        feedbacks (list): The feedback string of each evaluation.
+        scores (np.ndarray): The float64 score of each evaluation.
+    """
+
+    __slots__ = ('prompts', 'texts', 'results', 'feedbacks', 'scores')
+
+    def __init__(self, prompts, texts, results):
+        """
+        Initialize a new EvalBatch from aligned columns.
+
+        Args:
+            prompts (list): The Prompt used for each row.
+            texts (list): The generated content for each row.
+            results (list): The evaluation dict for each row.
+        """
+        self.prompts = list(prompts)
+        self.texts = list(texts)
+        self.results = list(results)
+        self.feedbacks = [result.get('feedback', '') for result in self.results]
+        self.scores = np.fromiter((_as_score(result.get('score', 0)) for result in self.results),
+                                  dtype=np.float64, count=len(self.results))
+        # A NaN score would poison every mean it takes part in
+        np.nan_to_num(self.scores, copy=False, nan=0.0)
+
+    @classmethod
+    def from_evaluations(cls, evaluations):
+        """
+        Build an EvalBatch from (prompt, generated_text, evaluation) tuples.
+
+        Args:
+            evaluations: An EvalBatch, which is returned unchanged, or an iterable of tuples.
+
+        Returns:
+            EvalBatch: The evaluations in column form.
+        """
+        if isinstance(evaluations, cls):
+            return evaluations
+        # Fill the columns row by row, so streamed evaluations are never held as tuples
+        prompts, texts, results = [], [], []
+        for prompt, text, result in evaluations:
+            prompts.append(prompt)
+            texts.append(text)
+            results.append(result)
+        return cls(prompts, texts, results)
+
+    def __len__(self):
+        return len(self.results)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return EvalBatch(self.prompts[index], self.texts[index], self.results[index])
+        return self.prompts[index], self.texts[index], self.results[index]
+
+    def __iter__(self):
+        return zip(self.prompts, self.texts, self.results)
+
+    def __repr__(self):
+        return f"EvalBatch({len(self)} evaluations)"
@@ -3,6 +3,7 @@ This module provides the llm_call function for making API calls to language mode
 """
 import os
 import json
+import asyncio
 import time
 import logging
 import random
@@ -58,51 +59,12 @@ def llm_call(
     
     # Special handling for test environment
     if api_key == "test_api_key":
-        # Return a mock response for testing
-        mock_content = "Score: 4\nFeedback: Good content but needs improvement\nImproved Output: This is an improved version\nSummary: Overall good with minor issues"
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": mock_content
-                    }
-                }
-            ]
-        }
+        return _mock_response()
     
     if not api_key:
         raise ValueError("Google API key is required")
     
-    # Configure the Gemini API
-    genai.configure(api_key=api_key)
-    
-    # Create a generation config
-    generation_config = genai.GenerationConfig(
-        temperature=temperature,
-    )
-    
-    # Add max tokens if provided
-    if max_tokens is not None:
-        generation_config.max_output_tokens = max_tokens
-    
-    # Handle JSON response format if specified
-    if response_format is not None and response_format.get("type") == "json_object":
-        generation_config.response_mime_type = "application/json"
-    
-    # Convert OpenAI message format to Gemini content format
-    # Gemini expects a single string or explicitly formatted content
-    prompt = ""
-    for message in messages:
-        role = message.get("role", "")
-        content = message.get("content", "")
-        if role == "system":
-            prompt += f"System: {content}\n\n"
-        elif role == "user":
-            prompt += f"User: {content}\n\n"
-        elif role == "assistant":
-            prompt += f"Assistant: {content}\n\n"
-        else:
-            prompt += f"{content}\n\n"
+    prompt, generation_config = _prepare_gemini_request(api_key, messages, temperature, max_tokens, response_format)
     
     # Implement API call with retries and timeout
     for attempt in range(retries + 1):
@@ -170,20 +132,148 @@ def _execute_gemini_call(model, prompt, generation_config, stream):
             # Would need custom handling
             return response
         
-        # Extract content from response
-        content = ""
-        if response.parts:
-            content = ''.join(part.text for part in response.parts)
-        
         # Return in a format compatible with the previous implementation
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": content
-                    }
-                }
-            ]
-        }
+        return _format_response(response)
     except Exception as e:
-        raise Exception(f"API call failed: {str(e)}")
\ No newline at end of file
+        raise Exception(f"API call failed: {str(e)}")
+
+
+def _mock_response() -> Dict[str, Any]:
+    """Return the canned response used when GOOGLE_API_KEY is the test key."""
+    mock_content = "Score: 4\nFeedback: Good content but needs improvement\nImproved Output: This is an improved version\nSummary: Overall good with minor issues"
+    return {
+        "choices": [
+            {
+                "message": {
+                    "content": mock_content
+                }
+            }
+        ]
+    }
+
+
+def _prepare_gemini_request(api_key, messages, temperature, max_tokens, response_format):
+    """
+    Configure the Gemini client and convert OpenAI-style messages into a prompt and generation config.
+    
+    Returns:
+        tuple: (prompt string, genai.GenerationConfig)
+    """
+    # Configure the Gemini API
+    genai.configure(api_key=api_key)
+    
+    # Create a generation config
+    generation_config = genai.GenerationConfig(
+        temperature=temperature,
+    )
+    
+    # Add max tokens if provided
+    if max_tokens is not None:
+        generation_config.max_output_tokens = max_tokens
+    
+    # Handle JSON response format if specified
+    if response_format is not None and response_format.get("type") == "json_object":
+        generation_config.response_mime_type = "application/json"
+    
+    # Convert OpenAI message format to Gemini content format
+    # Gemini expects a single string or explicitly formatted content
+    prompt = ""
+    for message in messages:
+        role = message.get("role", "")
+        content = message.get("content", "")
+        if role == "system":
+            prompt += f"System: {content}\n\n"
+        elif role == "user":
+            prompt += f"User: {content}\n\n"
+        elif role == "assistant":
+            prompt += f"Assistant: {content}\n\n"
+        else:
+            prompt += f"{content}\n\n"
+    
+    return prompt, generation_config
+
+
+def _format_response(response) -> Dict[str, Any]:
+    """Convert a Gemini response into the OpenAI-style structure callers expect."""
+    content = ""
+    if response.parts:
+        content = ''.join(part.text for part in response.parts)
+    
+    return {
+        "choices": [
+            {
+                "message": {
+                    "content": content
+                }
+            }
+        ]
+    }
+
+
+async def allm_call(
+    messages: List[Dict[str, str]],
+    model: str = "gemini-2.0-flash",
+    openrouter_api_key: str = None,
+    temperature: float = 0.7,
+    max_tokens: Optional[int] = None,
+    response_format: Optional[Dict[str, Any]] = None,
+    timeout: int = 60,
+    retries: int = 2,
+    retry_delay: float = 1.0,
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    Async counterpart of llm_call using Gemini's native async client.
+    
+    Waiting on the network does not hold a thread, so many calls can be in flight at once.
+    
+    Args:
+        messages (list): List of message objects with 'role' and 'content' keys.
+        model (str, optional): Model identifier string.
+        openrouter_api_key (str, optional): Kept for backward compatibility, not used.
+        temperature (float, optional): Temperature parameter for generation.
+        max_tokens (int, optional): Maximum tokens to generate.
+        response_format (dict, optional): Format specification for the response.
+        timeout (int, optional): Timeout in seconds for each API call.
+        retries (int, optional): Number of retries if API call fails.
+        retry_delay (float, optional): Delay between retries in seconds.
+        **kwargs: Other llm_call options, accepted for signature compatibility.
+        
+    Returns:
+        dict: The model response in a standardized format.
+        
+    Raises:
+        ValueError: If API key is missing and not in test mode.
+        Exception: If the API call fails after all retries.
+    """
+    logger = logging.getLogger(__name__)
+    
+    api_key = os.getenv("GOOGLE_API_KEY")
+    if api_key == "test_api_key":
+        return _mock_response()
+    if not api_key:
+        raise ValueError("Google API key is required")
+    
+    prompt, generation_config = _prepare_gemini_request(api_key, messages, temperature, max_tokens, response_format)
+    model_instance = genai.GenerativeModel(model)
+    
+    for attempt in range(retries + 1):
+        try:
+            response = await asyncio.wait_for(
+                model_instance.generate_content_async(prompt, generation_config=generation_config),
+                timeout=timeout
+            )
+            return _format_response(response)
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                logger.error(f"API timeout after {timeout} seconds (attempt {attempt+1}/{retries+1})")
+            else:
+                logger.error(f"API call error: {str(e)} (attempt {attempt+1}/{retries+1})")
+            
+            if attempt < retries:
+                logger.info(f"Retrying in {retry_delay} seconds...")
+                await asyncio.sleep(retry_delay)
+                # Increase delay for subsequent retries
+                retry_delay *= 1.5
+            else:
+                raise Exception(f"API call failed after {retries+1} attempts: {str(e)}")
@@ -2,6 +2,8 @@
 This module defines the Prompt class which represents a prompt used in the Archer system.
 """
 
+import hashlib
+
 class Prompt:
     """
     Represents a prompt for LLM generation.
@@ -15,8 +17,14 @@ class Prompt:
         llm_call: A function or method to call an LLM with this prompt.
         id (str, optional): Database ID of the prompt for tracking in the database.
         average_score (float, optional): Average score from all evaluations of this prompt.
+        content_key (str): Stable hex fingerprint of the content, identical across cycles.
+        formatter (callable): Fills the content's {placeholders} from a mapping.
     """
     
+    # Fixed attribute set: no per-instance __dict__, which keeps large candidate pools small
+    __slots__ = ('content', 'score', 'feedback', 'generation', 'history', 'llm_call', 'id', 'average_score',
+                 '_content_key', '_keyed_content', '_formatter', '_formatter_content')
+    
     def __init__(self, content, score=0.0, feedback_or_generation=None, generation=0, id=None, average_score=0.0):
         """
         Initialize a new Prompt instance.
@@ -46,6 +54,42 @@ class Prompt:
         # New attributes for database integration
         self.id = id
         self.average_score = average_score
+        self._content_key = None
+        self._keyed_content = None
+        self._formatter = None
+        self._formatter_content = None
+    
+    @property
+    def content_key(self):
+        """
+        Get a stable fingerprint of the prompt content.
+        
+        The digest is memoized and recomputed only after the content changes, so the same
+        text maps to the same key in every cycle regardless of object identity.
+        
+        Returns:
+            str: 16-character hex BLAKE2b digest of the content.
+        """
+        if self._keyed_content is not self.content:
+            self._content_key = hashlib.blake2b(str(self.content).encode("utf-8"), digest_size=8).hexdigest()
+            self._keyed_content = self.content
+        return self._content_key
+    
+    @property
+    def formatter(self):
+        """
+        Get a callable that fills the content's placeholders from a mapping.
+        
+        The callable is built once per content, so templates filled on every LLM call
+        do not rebuild it; it is rebuilt after the content changes.
+        
+        Returns:
+            callable: The content's format_map, taking a dict of placeholder values.
+        """
+        if self._formatter_content is not self.content:
+            self._formatter = self.content.format_map
+            self._formatter_content = self.content
+        return self._formatter
     
     def update(self, new_content, score=None, feedback=None):
         """
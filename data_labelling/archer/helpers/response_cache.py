@@ -0,0 +1,245 @@
+"""
+This module provides the ResponseCache class for memoizing LLM responses.
+
+Responses are keyed by a BLAKE2b fingerprint of the call's arguments plus a
+namespace describing the model configuration, held in an in-process LRU and
+optionally persisted to SQLite so they survive restarts. Entries can be given a
+time-to-live after which they are treated as misses, and the in-memory LRU can be
+bounded by total serialized size as well as by entry count.
+"""
+import copy
+import hashlib
+import inspect
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    Thread-safe exact-match cache for LLM responses.
+
+    Attributes:
+        maxsize (int): Maximum number of entries held in memory.
+        max_bytes (int): Optional bound on the total serialized size of in-memory entries.
+        db_path (str): Optional path of a SQLite file used as a persistent backend.
+        ttl (float): Optional lifetime of an entry in seconds; None keeps entries forever.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to call through.
+    """
+
+    def __init__(self, maxsize: int = 4096, db_path: Optional[str] = None, ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None):
+        """
+        Initialize a new ResponseCache.
+
+        Args:
+            maxsize: Maximum number of entries held in memory.
+            db_path: Optional SQLite file for persisting entries across runs.
+            ttl: Optional lifetime of an entry in seconds.
+            max_bytes: Optional bound on the total JSON-encoded size of in-memory entries.
+        """
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.db_path = db_path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._db = None
+
+        if db_path:
+            try:
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                # WAL lets concurrent readers proceed while a writer commits
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT, created_at REAL)"
+                )
+                columns = {row[1] for row in self._db.execute("PRAGMA table_info(responses)")}
+                if "created_at" not in columns:
+                    self._db.execute("ALTER TABLE responses ADD COLUMN created_at REAL")
+                self._db.commit()
+            except Exception as e:
+                logger.error(f"Could not open response cache database {db_path}: {str(e)}")
+                self._db = None
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a deterministic fingerprint from the given parts.
+
+        Args:
+            *parts: Values identifying a call; non-string values are JSON-encoded.
+
+        Returns:
+            str: Hex BLAKE2b digest of the parts.
+        """
+        encoded = [
+            part if isinstance(part, str) else json.dumps(part, sort_keys=True, default=str)
+            for part in parts
+        ]
+        return hashlib.blake2b("\0".join(encoded).encode("utf-8"), digest_size=32).hexdigest()
+
+    def get(self, key: str) -> Any:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Fingerprint produced by make_key.
+
+        Returns:
+            The cached response (a copy), or None if the key is not cached or has expired.
+        """
+        with self._lock:
+            if key in self._entries:
+                value, created_at, _ = self._entries[key]
+                if not self._expired(created_at):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(value)
+                self._forget(key)
+
+            if self._db is not None:
+                try:
+                    row = self._db.execute(
+                        "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+                    ).fetchone()
+                except Exception as e:
+                    logger.error(f"Error reading response cache: {str(e)}")
+                    row = None
+                if row is not None and not self._expired(row[1]):
+                    value = json.loads(row[0])
+                    self._remember(key, value, row[1], len(row[0]))
+                    self.hits += 1
+                    return copy.deepcopy(value)
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Fingerprint produced by make_key.
+            value: JSON-serializable response to cache.
+        """
+        encoded = json.dumps(value, default=str)
+        with self._lock:
+            created_at = time.time()
+            self._remember(key, copy.deepcopy(value), created_at, len(encoded))
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                        (key, encoded, created_at)
+                    )
+                    self._db.commit()
+                except Exception as e:
+                    logger.error(f"Error writing response cache: {str(e)}")
+
+    def clear(self) -> None:
+        """Drop every in-memory entry; persisted entries are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def wrap(self, func: Callable, namespace: Callable[[], str],
+             should_cache: Callable[[Any], bool] = lambda result: True) -> Callable:
+        """
+        Wrap a function so that calls with identical arguments are served from the cache.
+
+        Coroutine functions get an async wrapper, so sync and async variants of a call
+        can share entries when given the same namespace.
+
+        Args:
+            func: The function or coroutine function to memoize.
+            namespace: Called on every lookup to describe state that also affects the
+                       result, such as the model name, temperature, or current prompt.
+            should_cache: Predicate deciding whether a fresh result may be stored,
+                          so that error responses are never cached.
+
+        Returns:
+            Callable: The memoizing wrapper.
+        """
+        signature = inspect.signature(func)
+
+        def call_key(args, kwargs):
+            # Bind so positional and keyword calls share a key
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return self.make_key(namespace(), dict(bound.arguments))
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = call_key(args, kwargs)
+                cached = self.get(key)
+                if cached is not None:
+                    return cached
+
+                result = await func(*args, **kwargs)
+                if should_cache(result):
+                    self.set(key, result)
+                return result
+
+            return self._expose_key(async_wrapper, call_key, should_cache)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = call_key(args, kwargs)
+            cached = self.get(key)
+            if cached is not None:
+                return cached
+
+            result = func(*args, **kwargs)
+            if should_cache(result):
+                self.set(key, result)
+            return result
+
+        return self._expose_key(wrapper, call_key, should_cache)
+
+    def _expose_key(self, wrapper: Callable, call_key: Callable, should_cache: Callable[[Any], bool]) -> Callable:
+        """
+        Let callers that compute results another way, e.g. in a batch, share the wrapper's entries.
+
+        wrapper.cache_key(*args, **kwargs) returns the key of a call, and
+        wrapper.cache_result(key, result) stores a result under it unless should_cache rejects it.
+        """
+        def cache_result(key: str, result: Any) -> None:
+            if should_cache(result):
+                self.set(key, result)
+
+        wrapper.cache_key = lambda *args, **kwargs: call_key(args, kwargs)
+        wrapper.cache_result = cache_result
+        return wrapper
+
+    def _expired(self, created_at: Optional[float]) -> bool:
+        """Whether an entry written at created_at has outlived the TTL. Untimestamped entries never expire."""
+        return self.ttl is not None and created_at is not None and time.time() - created_at > self.ttl
+
+    def _remember(self, key: str, value: Any, created_at: Optional[float], size: int) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entries when full. Caller holds the lock."""
+        self._forget(key)
+        self._entries[key] = (value, created_at, size)
+        self._bytes += size
+        while len(self._entries) > self.maxsize or (
+                self.max_bytes is not None and self._bytes > self.max_bytes and len(self._entries) > 1):
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+
+    def _forget(self, key: str) -> None:
+        """Remove an in-memory entry if present. Caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
@@ -2,6 +2,8 @@
 This module defines classes for visualizing and tracking performance in the Archer system.
 """
 
+from archer.helpers.eval_batch import EvalBatch
+
 class PerformanceTracker:
     """
     A class for tracking and visualizing the performance of prompts over time.
@@ -59,10 +61,13 @@ class PerformanceTracker:
         
         Args:
             prompts: List of Prompt objects
-            evaluations: List of evaluation tuples (prompt, content, result)
+            evaluations: List of evaluation tuples (prompt, content, result), or an EvalBatch
         """
         # Extract scores from evaluations
-        scores = [eval_result[2].get('score', 0.0) for eval_result in evaluations]
+        if isinstance(evaluations, EvalBatch):
+            scores = evaluations.scores.tolist()
+        else:
+            scores = [eval_result[2].get('score', 0.0) for eval_result in evaluations]
         
         # Calculate average score for this evaluation batch
         avg_score = sum(scores) / len(scores) if scores else 0.0
@@ -2,6 +2,7 @@
 Tests for the DanielsonModel class in data-labelling/archer/backwardPass/danielson_model.py.
 """
 
+import asyncio
 import pytest
 import sys
 import os
@@ -49,6 +50,12 @@ class TestDanielsonModel:
         assert "component_instruction_1a" in model.prompts
         assert "component_instruction_3e" in model.prompts
         
+        # Static instructions precede every placeholder, so calls share a cacheable prefix
+        for name in ("context_analysis", "component_evaluation_base", "restructure_feedback"):
+            content = model.get_prompt(name).content
+            assert "Guidelines" not in content[content.index("{"):]
+            assert "**Growth Path**" not in content[content.index("{"):]
+        
         # Verify Danielson functions were registered
         assert "analyze_context" in model.functions
         assert "generate_component_evaluation" in model.functions
@@ -86,16 +93,22 @@ class TestDanielsonModel:
         # Call analyze_danielson_context
         result = model.analyze_danielson_context("Sample observation text")
         
-        # Verify the function was called
+        # Verify the function was called, on the smaller context model
         sys.modules['eval.danielson'].generate_ai_content.assert_called_once()
+        call_kwargs = sys.modules['eval.danielson'].generate_ai_content.call_args.kwargs
+        assert call_kwargs["model_name"] == "gemini-2.0-flash-lite"
         
         # Verify the result
         assert result["analysis"] == "Mock analysis content"
         assert result["error"] is None
         
+        # The same observation is served from the context cache
+        assert model.analyze_danielson_context("Sample observation text") == result
+        sys.modules['eval.danielson'].generate_ai_content.assert_called_once()
+        
         # Test error handling
         sys.modules['eval.danielson'].generate_ai_content.side_effect = Exception("Test error")
-        result = model.analyze_danielson_context("Sample observation text")
+        result = model.analyze_danielson_context("Another observation text")
         assert result["analysis"] == ""
         assert result["error"] == "Test error"
 
@@ -132,6 +145,117 @@ class TestDanielsonModel:
         assert result["score"] == 1
         assert "Error" in result["summary"]
 
+    def test_generate_batched_component_evaluation(self):
+        """Test several components are scored in one call, with missing ones evaluated alone."""
+        batch_part = MagicMock()
+        batch_part.text = '{"evaluations": [{"component_id": "1a", "summary": "Batched summary", "score": 4}]}'
+        single_part = MagicMock()
+        single_part.text = '{"score": 2, "summary": "Single summary"}'
+        sys.modules['eval.danielson'].generate_ai_content.side_effect = [
+            MagicMock(parts=[batch_part]), MagicMock(parts=[single_part])
+        ]
+        
+        model = DanielsonModel()
+        result = model.generate_batched_component_evaluation(["1a", "2b"], "Sample observation", "Sample context")
+        
+        assert sys.modules['eval.danielson'].generate_ai_content.call_count == 2
+        batch_prompt = sys.modules['eval.danielson'].generate_ai_content.call_args_list[0].args[0]
+        assert "Component 1a" in batch_prompt and "Component 2b" in batch_prompt
+        assert result == {"1a": {"summary": "Batched summary", "score": 3},
+                          "2b": {"score": 3, "summary": "Single summary"}}
+        
+        # An unparsable response falls back to one call per component
+        batch_part.text = "not json"
+        sys.modules['eval.danielson'].generate_ai_content.side_effect = [
+            MagicMock(parts=[batch_part]), MagicMock(parts=[single_part]), MagicMock(parts=[single_part])
+        ]
+        result = model.generate_batched_component_evaluation(["1c", "2d"], "Sample observation", "Sample context")
+        assert result == {"1c": {"score": 3, "summary": "Single summary"},
+                          "2d": {"score": 3, "summary": "Single summary"}}
+        
+        # A failed call is not repeated per component
+        sys.modules['eval.danielson'].generate_ai_content.reset_mock()
+        sys.modules['eval.danielson'].generate_ai_content.side_effect = Exception("Quota exceeded")
+        result = model.generate_batched_component_evaluation(["1e", "2e"], "Sample observation", "Sample context")
+        sys.modules['eval.danielson'].generate_ai_content.assert_called_once()
+        assert result == {"1e": {"score": 1, "summary": "Error: Quota exceeded"},
+                          "2e": {"score": 1, "summary": "Error: Quota exceeded"}}
+    
+    def test_run_on_uses_the_given_model_prompts(self):
+        """Test run_on runs a method with the prompts of another, plain Model."""
+        model = DanielsonModel()
+        model.update_prompt("component_instruction_1a", "Custom 1a instruction")
+        clone = model.clone()
+        assert not isinstance(clone, DanielsonModel)
+        
+        prompt = DanielsonModel.run_on(clone, "_component_evaluation_prompt", "1a", "Observation", "Context")
+        assert "Custom 1a instruction" in prompt
+        
+        # Repeated calls reuse one wrapper, and with it the context cache
+        mock_part = MagicMock()
+        mock_part.text = "Mock analysis content"
+        sys.modules['eval.danielson'].generate_ai_content.return_value = MagicMock(parts=[mock_part])
+        first = DanielsonModel.run_on(clone, "analyze_danielson_context", "Observation")
+        assert DanielsonModel.run_on(clone, "analyze_danielson_context", "Observation") == first
+        sys.modules['eval.danielson'].generate_ai_content.assert_called_once()
+        assert DanielsonModel.run_on(model, "_component_instruction", "1a") == "Custom 1a instruction"
+    
+    def test_batch_generate_single_component_evaluation(self):
+        """Test offline batch scoring evaluates each observation once, in input order."""
+        model = DanielsonModel()
+        
+        def fake_multi(notes, component_ids):
+            return {cid: {"component_id": cid, "notes": notes} for cid in component_ids}
+        
+        with patch.object(model, "generate_multi_component_evaluation", side_effect=fake_multi) as multi:
+            results = model.batch_generate_single_component_evaluation(
+                [("Notes A", "1a"), ("Notes B", "2b"), ("Notes A", "3c")]
+            )
+        
+        assert multi.call_count == 2
+        assert multi.call_args_list[0].args[:2] == ("Notes A", ["1a", "3c"])
+        assert results == [{"component_id": "1a", "notes": "Notes A"},
+                           {"component_id": "2b", "notes": "Notes B"},
+                           {"component_id": "3c", "notes": "Notes A"}]
+    
+    def test_score_cache_persists_component_evaluations(self, tmp_path):
+        """Test repeated evaluations are served from the on-disk score cache."""
+        mock_part = MagicMock()
+        mock_part.text = '{"score": 3, "summary": "Cached summary"}'
+        sys.modules['eval.danielson'].generate_ai_content.return_value = MagicMock(parts=[mock_part])
+        cache_path = str(tmp_path / "scores.sqlite")
+        
+        first = DanielsonModel(score_cache=True, score_cache_path=cache_path)
+        result = first.generate_component_evaluation("1a", "Sample observation", "Sample context")
+        assert first.generate_component_evaluation("1a", "Sample observation", "Sample context") == result
+        
+        # A new model with the same prompts reads the persisted result
+        second = DanielsonModel(score_cache=True, score_cache_path=cache_path)
+        assert second.generate_component_evaluation("1a", "Sample observation", "Sample context") == result
+        sys.modules['eval.danielson'].generate_ai_content.assert_called_once()
+        
+        # A different component is a different prompt, so it misses
+        second.generate_component_evaluation("1b", "Sample observation", "Sample context")
+        assert sys.modules['eval.danielson'].generate_ai_content.call_count == 2
+    
+    def test_rate_limited_calls_are_retried(self, monkeypatch):
+        """Test calls rejected with HTTP 429 are retried on both the sync and async paths."""
+        from google.api_core.exceptions import TooManyRequests
+        monkeypatch.setattr(sys.modules[DanielsonModel.__module__], "_rate_limit_delay", lambda attempt: 0)
+        mock_part = MagicMock()
+        mock_part.text = "Restructured feedback"
+        response = MagicMock(parts=[mock_part])
+        generate = sys.modules['eval.danielson'].generate_ai_content
+        model = DanielsonModel()
+        
+        generate.side_effect = [TooManyRequests("quota"), response]
+        assert model.restructure_component_feedback("Original feedback", "Sample evidence", "1a") == "Restructured feedback"
+        
+        generate.side_effect = [TooManyRequests("quota"), TooManyRequests("quota"), response]
+        assert asyncio.run(model.arestructure_component_feedback("Other feedback", "Sample evidence", "1a")) \
+            == "Restructured feedback"
+        assert generate.call_count == 5
+    
     def test_restructure_component_feedback(self):
         """Test restructuring component feedback."""
         # Setup mock
@@ -161,6 +285,12 @@ class TestDanielsonModel:
         sys.modules['eval.danielson'].generate_ai_content.side_effect = Exception("Test error")
         result = model.restructure_component_feedback("Original feedback", "Sample evidence", "1a")
         assert result == "Original feedback"  # Should return original text on error
+        
+        # Feedback already in the target structure skips the LLM round trip
+        sys.modules['eval.danielson'].generate_ai_content.reset_mock()
+        structured = "**Performance Analysis**\nStrong pacing.\n\n**Growth Path**\nAdd exit tickets."
+        assert model.restructure_component_feedback(structured, "Sample evidence", "1a") == structured
+        sys.modules['eval.danielson'].generate_ai_content.assert_not_called()
 
     def test_generate_single_component_evaluation(self):
         """Test generating a single component evaluation."""
@@ -188,23 +318,22 @@ class TestDanielsonModel:
             )
             
             # Verify the function calls
-            mock_analyze.assert_called_once_with("Sample observation", model)
+            mock_analyze.assert_called_once_with("Sample observation")
             mock_generate_eval.assert_called_once_with(
                 component_id="1a",
                 observation_text="Sample observation",
-                context="Context analysis",
-                model=model
+                context="Context analysis"
             )
             mock_restructure.assert_called_once_with(
                 text="Evaluation summary",
                 evidence="Sample observation",
-                component_id="1a",
-                model=model
+                component_id="1a"
             )
             
-            # Verify the result
+            # Verify the result; the evaluation step already normalized the score
             assert result["component_id"] == "1a"
             assert result["score"] == 3
+            sys.modules['eval.danielson'].normalize_score_integer.assert_not_called()
             assert result["summary"] == "Enhanced feedback"
             assert result["domain"] == "1"
             
@@ -219,5 +348,45 @@ class TestDanielsonModel:
             assert "error" in result
             assert result["error"] == "Context error"
 
+    def test_agenerate_component_evaluations_shares_context(self):
+        """Test async multi-component evaluation analyzes the context once for all components."""
+        def fake_generate(prompt, generation_config=None, model_name=None):
+            part = MagicMock()
+            part.text = '{"score": 3, "summary": "Summary"}' if generation_config else "Generated text"
+            response = MagicMock()
+            response.parts = [part]
+            return response
+        sys.modules['eval.danielson'].generate_ai_content.side_effect = fake_generate
+        
+        model = DanielsonModel()
+        results = asyncio.run(model.agenerate_component_evaluations("Sample observation", ["1a", "2b", "bad"]))
+        
+        # One context call, then an evaluation and a restructure per valid component
+        assert sys.modules['eval.danielson'].generate_ai_content.call_count == 5
+        assert list(results) == ["1a", "2b", "bad"]
+        assert results["2b"] == {"component_id": "2b", "score": 3, "summary": "Generated text", "domain": "2"}
+        assert "Invalid component ID" in results["bad"]["error"]
+    
+    def test_evaluate_dataset(self):
+        """Test dataset evaluation scores each distinct observation once and keeps input order."""
+        def fake_generate(prompt, generation_config=None, model_name=None):
+            part = MagicMock()
+            part.text = '{"score": 3, "summary": "Summary"}' if generation_config else "Generated text"
+            return MagicMock(parts=[part])
+        sys.modules['eval.danielson'].generate_ai_content.side_effect = fake_generate
+        
+        model = DanielsonModel()
+        results = asyncio.run(model.evaluate_dataset(["Notes A", "Notes B", "Notes A"], ["1a"], max_concurrency=2))
+        
+        # A context, an evaluation and a restructure call per distinct observation
+        assert sys.modules['eval.danielson'].generate_ai_content.call_count == 6
+        assert len(results) == 3 and results[0] == results[2]
+        assert results[1]["1a"]["score"] == 3
+        
+        # An observation that fails outright reports an error for each component
+        with patch.object(model, "aanalyze_danielson_context", side_effect=RuntimeError("boom")):
+            results = asyncio.run(model.evaluate_dataset(["Notes C"], ["1a", "2b"]))
+        assert results == [{"1a": {"error": "boom"}, "2b": {"error": "boom"}}]
+
 if __name__ == "__main__":
     pytest.main(["-xvs", __file__]) 
\ No newline at end of file
@@ -73,6 +73,21 @@ class TestModel:
         assert "main_prompt" in model.adalflow_params
         assert model.adalflow_params["main_prompt"].data == test_prompt.content
 
+    def test_add_prompt_factory(self):
+        """Test that a prompt added as a factory is built once, on first access."""
+        model = Model(name="test_model")
+        factory = MagicMock(return_value=Prompt(content="Lazy prompt content"))
+        
+        model.add_prompt("lazy_prompt", factory)
+        assert "lazy_prompt" in model.prompts
+        factory.assert_not_called()
+        
+        # The first access builds the prompt, later accesses reuse it
+        prompt = model.get_prompt("lazy_prompt")
+        assert prompt.content == "Lazy prompt content"
+        assert model.prompts["lazy_prompt"] is prompt
+        factory.assert_called_once()
+
     def test_remove_prompt(self):
         """Test removing prompts from the model."""
         model = Model(name="test_model")
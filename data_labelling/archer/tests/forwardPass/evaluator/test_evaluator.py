@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import sys
 import os
@@ -265,4 +266,62 @@ class TestAIExpert:
         
         # Result should be valid
         assert "feedback" in result
-        assert "improved_output" in result
\ No newline at end of file
+        assert "improved_output" in result
+    @patch('forwardPass.evaluator.llm_call')
+    def test_evaluate_batch_single_call(self, mock_llm_call):
+        """Test that evaluate_batch scores a chunk of generations with one LLM call"""
+        mock_llm_call.return_value = {
+            "choices": [
+                {
+                    "message": {
+                        "content": '```json\n[{"score": 4, "feedback": "F1", "improved_output": "I1", "summary": "S1"},'
+                                   ' {"score": 2, "feedback": "F2", "improved_output": "I2", "summary": "S2"}]\n```'
+                    }
+                }
+            ]
+        }
+        
+        expert = AIExpert("gemini-2.0-flash", ["Document 1"], {"clarity": {"weight": 0.5}})
+        expert.set_prompt("Optimized evaluator prompt. Input: {input_placeholder} Content: {content_placeholder}")
+        results = expert.evaluate_batch([("Content 1", "Input 1"), ("Content 2", "Input 2")], batch_size=4)
+        
+        # Both generations go out in a single prompt built from the current evaluator prompt
+        mock_llm_call.assert_called_once()
+        prompt = mock_llm_call.call_args[1]["messages"][0]["content"]
+        assert "Content 1" in prompt and "Content 2" in prompt
+        assert "Optimized evaluator prompt." in prompt and "{content_placeholder}" not in prompt
+        
+        assert [r["score"] for r in results] == [4.0, 2.0]
+        assert results[1]["feedback"] == "F2"
+
+    @patch('forwardPass.evaluator.llm_call')
+    def test_evaluate_batch_falls_back_on_bad_response(self, mock_llm_call):
+        """Test that evaluate_batch evaluates items one by one when the batch response is unusable"""
+        mock_llm_call.side_effect = [
+            {"choices": [{"message": {"content": "Not JSON at all"}}]},
+            {"choices": [{"message": {"content": "Score: 5\nFeedback: Great"}}]},
+            {"choices": [{"message": {"content": "Score: 1\nFeedback: Poor"}}]},
+        ]
+        
+        expert = AIExpert("gemini-2.0-flash", ["Document 1"], {"clarity": {"weight": 0.5}})
+        results = expert.evaluate_batch([("Content 1", "Input 1"), ("Content 2", "Input 2")])
+        
+        # One failed batch call, then one call per item
+        assert mock_llm_call.call_count == 3
+        assert [r["score"] for r in results] == [5.0, 1.0]
+
+    @patch('forwardPass.evaluator.allm_call')
+    def test_aevaluate_parses_like_evaluate(self, mock_allm_call):
+        """Test that aevaluate awaits the async client and parses its response"""
+        mock_allm_call.return_value = {
+            "choices": [{"message": {"content": "Score: 4\nFeedback: Clear\nSummary: Solid"}}]
+        }
+        
+        expert = AIExpert("gemini-2.0-flash", ["Document 1"], {"clarity": {"weight": 0.5}})
+        result = asyncio.run(expert.aevaluate("Content", "Input"))
+        
+        mock_allm_call.assert_awaited_once()
+        assert "Content" in mock_allm_call.call_args[1]["messages"][0]["content"]
+        assert result["score"] == 4.0
+        assert result["feedback"] == "Clear"
+        assert result["summary"] == "Solid"
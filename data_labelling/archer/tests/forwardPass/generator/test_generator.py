@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import sys
 import os
@@ -148,4 +149,32 @@ class TestGenerativeModel:
         # Verify the mock was called with empty input
         mock_gen_func.assert_called_once_with("Test prompt", "")
         
-        assert results[0][0] == "Generated from empty input" 
\ No newline at end of file
+        assert results[0][0] == "Generated from empty input"
+    
+    def test_agenerate_with_custom_llm_call(self):
+        """Test async generation over multiple prompts with a synchronous custom llm_call"""
+        mock_llm_call = MagicMock(side_effect=lambda messages, **kwargs: {
+            "choices": [{"message": {"content": f"Generated for {messages[0]['content']}"}}]
+        })
+        
+        model = GenerativeModel("test-model", llm_call=mock_llm_call)
+        prompts = [Prompt(content="Prompt 1"), Prompt(content="Prompt 2")]
+        model.set_prompts(prompts)
+        
+        results = asyncio.run(model.agenerate("Test input"))
+        
+        assert mock_llm_call.call_count == 2
+        assert results == [("Generated for Prompt 1", prompts[0]), ("Generated for Prompt 2", prompts[1])]
+
+    def test_generate_batch_groups_results_per_input(self):
+        """Test that batched generation returns one list per input, in input and prompt order"""
+        model = GenerativeModel("test-model", generation_func=lambda prompt, input_data: f"{prompt}:{input_data}")
+        prompts = [Prompt(content="P1"), Prompt(content="P2")]
+        model.set_prompts(prompts)
+        
+        expected = [
+            [("P1:A", prompts[0]), ("P2:A", prompts[1])],
+            [("P1:B", prompts[0]), ("P2:B", prompts[1])]
+        ]
+        assert model.generate_batch(["A", "B"], max_workers=3) == expected
+        assert asyncio.run(model.agenerate_batch(["A", "B"], max_concurrency=3)) == expected
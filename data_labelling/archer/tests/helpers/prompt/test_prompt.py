@@ -114,4 +114,27 @@ class TestPrompt:
         content_with_special_chars = "!@#$%^&*()_+<>?:{}\n\t"
         prompt = Prompt(content_with_special_chars)
         
-        assert prompt.content == content_with_special_chars 
\ No newline at end of file
+        assert prompt.content == content_with_special_chars
+    
+    def test_content_key_is_stable_and_tracks_content(self):
+        """Test that equal content shares a key and updating the content changes it"""
+        prompt = Prompt("Same text", score=1.0)
+        key = prompt.content_key
+        
+        assert key == Prompt("Same text", score=4.0).content_key
+        assert len(key) == 16
+        
+        prompt.update("New text")
+        assert prompt.content_key != key
+        assert prompt.content_key == Prompt("New text").content_key
+    
+    def test_formatter_fills_placeholders_and_tracks_content(self):
+        """Test that the formatter fills placeholders and follows content updates"""
+        prompt = Prompt("Evaluate {component_id}")
+        formatter = prompt.formatter
+        
+        assert formatter({"component_id": "1a"}) == "Evaluate 1a"
+        assert prompt.formatter is formatter
+        
+        prompt.update("Score {component_id}")
+        assert prompt.formatter({"component_id": "2b"}) == "Score 2b"
@@ -0,0 +1,33 @@
+import numpy as np
+
+from helpers.eval_batch import EvalBatch
+from helpers.prompt import Prompt
+
+class TestEvalBatch:
+    """Tests for the EvalBatch class."""
+
+    def test_columns_align_with_tuple_view(self):
+        """Rows read back as (prompt, text, result) tuples and score/feedback columns line up."""
+        prompts = [Prompt("P1"), Prompt("P2")]
+        results = [{"score": 4, "feedback": "good"}, {"score": "bad"}]
+
+        batch = EvalBatch.from_evaluations(zip(prompts, ["t1", "t2"], results))
+
+        assert len(batch) == 2
+        assert batch[0] == (prompts[0], "t1", results[0])
+        assert list(batch) == [(prompts[0], "t1", results[0]), (prompts[1], "t2", results[1])]
+        assert batch.feedbacks == ["good", ""]
+        np.testing.assert_array_equal(batch.scores, [4.0, 0.0])
+
+    def test_from_evaluations_passes_batches_through(self):
+        """An existing batch is reused and an empty iterable gives an empty batch."""
+        batch = EvalBatch([Prompt("P")], ["t"], [{"score": 1}])
+
+        assert EvalBatch.from_evaluations(batch) is batch
+        assert len(EvalBatch.from_evaluations(iter([]))) == 0
+
+    def test_nan_scores_become_zero(self):
+        """NaN scores are zeroed so they do not poison per-prompt means."""
+        batch = EvalBatch([Prompt("P")] * 2, ["t1", "t2"], [{"score": float("nan")}, {"score": 3}])
+
+        np.testing.assert_array_equal(batch.scores, [0.0, 3.0])
@@ -0,0 +1,106 @@
+import pytest
+from unittest.mock import MagicMock
+
+from helpers.response_cache import ResponseCache
+
+class TestResponseCache:
+    """Tests for the ResponseCache class."""
+
+    def test_wrap_serves_repeated_calls_from_cache(self):
+        """Identical calls, positional or keyword, hit the underlying function once."""
+        cache = ResponseCache()
+        func = MagicMock(return_value={"score": 4.0})
+
+        def evaluate(generated_content, input_data):
+            return func(generated_content, input_data)
+
+        cached = cache.wrap(evaluate, namespace=lambda: "model")
+
+        first = cached("content", "input")
+        second = cached(generated_content="content", input_data="input")
+
+        assert first == second == {"score": 4.0}
+        assert func.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_namespace_change_misses(self):
+        """A different namespace (e.g. a new evaluator prompt) is a different key."""
+        cache = ResponseCache()
+        namespace = {"value": "prompt v1"}
+        func = MagicMock(return_value="out")
+        cached = cache.wrap(lambda prompt, input_data: func(prompt, input_data),
+                            namespace=lambda: namespace["value"])
+
+        cached("p", "i")
+        namespace["value"] = "prompt v2"
+        cached("p", "i")
+
+        assert func.call_count == 2
+
+    def test_should_cache_skips_errors(self):
+        """Results rejected by should_cache are not stored."""
+        cache = ResponseCache()
+        func = MagicMock(return_value="Error: timeout")
+        cached = cache.wrap(lambda prompt, input_data: func(prompt, input_data),
+                            namespace=lambda: "model",
+                            should_cache=lambda result: not result.startswith("Error:"))
+
+        cached("p", "i")
+        cached("p", "i")
+
+        assert func.call_count == 2
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted once maxsize is exceeded."""
+        cache = ResponseCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_sqlite_backend_persists(self, tmp_path):
+        """Entries written to the SQLite backend are visible to a new cache instance."""
+        db_path = str(tmp_path / "responses.sqlite")
+        ResponseCache(db_path=db_path).set("key", {"feedback": "kept"})
+
+        assert ResponseCache(db_path=db_path).get("key") == {"feedback": "kept"}
+
+    def test_returned_values_are_copies(self):
+        """Mutating a returned response does not change the cached one."""
+        cache = ResponseCache()
+        cache.set("key", {"score": 3.0})
+
+        cache.get("key")["score"] = 1.0
+
+        assert cache.get("key") == {"score": 3.0}
+
+    def test_ttl_expires_entries(self, tmp_path, monkeypatch):
+        """Entries older than the TTL are misses, both in memory and on disk."""
+        db_path = str(tmp_path / "responses.sqlite")
+        now = {"value": 1000.0}
+        monkeypatch.setattr("helpers.response_cache.time.time", lambda: now["value"])
+
+        cache = ResponseCache(db_path=db_path, ttl=60)
+        cache.set("key", "value")
+        now["value"] += 30
+        assert cache.get("key") == "value"
+
+        now["value"] += 60
+        assert cache.get("key") is None
+        assert ResponseCache(db_path=db_path, ttl=60).get("key") is None
+
+    def test_max_bytes_evicts_least_recently_used(self):
+        """Entries are evicted oldest-first once their serialized size exceeds max_bytes."""
+        cache = ResponseCache(max_bytes=40)
+        cache.set("a", "x" * 15)
+        cache.set("b", "y" * 15)
+        cache.get("a")
+        cache.set("c", "z" * 15)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "x" * 15
+        assert cache.get("c") == "z" * 15
@@ -75,13 +75,14 @@ def generate_single_component_evaluation(low_inference_notes: str, component_id:
     return result
 
 
-def generate_ai_content(prompt: str, generation_config: Optional[Any] = None):
+def generate_ai_content(prompt: str, generation_config: Optional[Any] = None, model_name: Optional[str] = None):
     """
     Wrapper for generating AI content using either Gemini or Groq.
     For Groq, we use the "llama-3.3-70b-versatile" model and map the generation
     parameters (e.g. temperature and JSON output) per the Groq API documentation.
+    model_name selects a different Gemini model (default: "gemini-2.0-flash").
     """
-    model = genai.GenerativeModel("gemini-2.0-flash")
+    model = genai.GenerativeModel(model_name or "gemini-2.0-flash")
     return model.generate_content(prompt, generation_config=generation_config)
 
 def analyze_danielson_context(text: str):